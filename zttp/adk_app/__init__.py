@@ -1,5 +1,26 @@
-"""Top-level package for the Zero-Key Trip & Task Planner (ZTTP)."""
+"""Top-level package for the Zero-Key Trip & Task Planner (ZTTP).
 
-from .app import create_app
+``create_app`` and the subpackages (``adk_app.tools``, ``adk_app.agents``,
+...) are imported on first attribute access, so ``import adk_app`` does not
+pull in the agents, the orchestration graph or any HTTP library until they
+are actually used.
+"""
 
-__all__ = ["create_app"]
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .app import create_app
+
+_EXPORTS: Dict[str, str] = {
+    "create_app": ".app",
+}
+
+_SUBPACKAGES = frozenset({"agents", "memory", "orchestration", "telemetry", "tools"})
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, subpackages=_SUBPACKAGES)
@@ -0,0 +1,39 @@
+"""Lazy ``__getattr__``/``__dir__`` pairs for the package ``__init__`` modules.
+
+Each package declares which module every public name lives in and hands the
+map to :func:`lazy_exports`; the defining module is only imported when one of
+its names is first looked up, and the value is then stored on the package so
+later lookups skip ``__getattr__`` entirely.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str], *, subpackages: Iterable[str] = ()
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Return ``(__getattr__, __dir__)`` for ``package``.
+
+    ``exports`` maps each public name to the (relative) module defining it;
+    names in ``subpackages`` resolve to the submodule of that name.
+    """
+    submodules = frozenset(subpackages)
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            return importlib.import_module(f".{name}", package)
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
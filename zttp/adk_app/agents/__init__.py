@@ -1,15 +1,29 @@
-"""Agent role exports for the ZTTP project."""
-
-from .planner import PlannerAgent
-from .researcher import ResearcherAgent
-from .scheduler import SchedulerAgent
-from .checklist import ChecklistAgent
-from .presenter import PresenterAgent
-
-__all__ = [
-    "PlannerAgent",
-    "ResearcherAgent",
-    "SchedulerAgent",
-    "ChecklistAgent",
-    "PresenterAgent",
-]
+"""Agent role exports for the ZTTP project.
+
+Agents are imported on first access.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .planner import PlannerAgent
+    from .researcher import ResearcherAgent
+    from .scheduler import SchedulerAgent
+    from .checklist import ChecklistAgent
+    from .presenter import PresenterAgent
+
+_EXPORTS: Dict[str, str] = {
+    "PlannerAgent": ".planner",
+    "ResearcherAgent": ".researcher",
+    "SchedulerAgent": ".scheduler",
+    "ChecklistAgent": ".checklist",
+    "PresenterAgent": ".presenter",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -5,6 +5,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
+RAIN_THRESHOLD = 40
+
+
+def _is_rainy(precipitation_probability: float | None) -> bool:
+    return precipitation_probability is not None and precipitation_probability > RAIN_THRESHOLD
+
 
 @dataclass
 class ChecklistAgent:
@@ -13,9 +19,14 @@ class ChecklistAgent:
     def build(self, *, schedule: List[Dict[str, Any]], weather: Dict[str, Any] | None = None) -> Dict[str, Any]:
         packing = ["Comfortable walking shoes", "Reusable water bottle", "Phone charger"]
         tasks = ["Download offline maps", "Confirm local transit options"]
-        if weather:
+        # Per-day forecasts attached by the scheduler take precedence over the trip-wide arrays.
+        rainy_days = [day["date"] for day in schedule if _is_rainy((day.get("weather") or {}).get("precipitation"))]
+        if rainy_days:
+            packing.append("Light rain jacket")
+            tasks.append(f"Plan indoor backups for rainy days: {', '.join(rainy_days)}")
+        elif weather:
             precipitation = weather.get("precipitation_probability_max", [0])
-            if any(p > 40 for p in precipitation):
+            if any(_is_rainy(p) for p in precipitation):
                 packing.append("Light rain jacket")
         if schedule:
             packing.append("Tickets or confirmations for booked activities")
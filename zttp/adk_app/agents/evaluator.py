@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
+
+BUDGET_TIERS = frozenset({"low", "mid", "high"})
 
 
 @dataclass
@@ -17,22 +19,29 @@ class EvaluationResult:
         return self.score >= max(1, int(self.max * 0.7))
 
 
-def evaluate(plan: Dict[str, Any]) -> EvaluationResult:
-    schedule: List[Dict[str, Any]] = plan.get("schedule", [])
+def _activity_text(schedule: List[Dict[str, Any]]) -> str:
+    # One lower() over the joined activities instead of two per segment.
+    return "\n".join([segment.get("activity", "") for day in schedule for segment in day.get("segments", ())]).lower()
+
+
+def _score(plan: Dict[str, Any], activity_text: str) -> EvaluationResult:
     stops: List[Dict[str, Any]] = plan.get("stops", [])
     rules = {
-        "has_two_meals": any(
-            "breakfast" in segment.get("activity", "").lower()
-            or "lunch" in segment.get("activity", "").lower()
-            for day in schedule
-            for segment in day.get("segments", [])
-        ),
+        "has_two_meals": "breakfast" in activity_text or "lunch" in activity_text,
         "covers_3_pois": len(stops) >= 3,
         "weather_aware": bool(plan.get("weather_note")),
-        "budget_tagged": plan.get("budget") in {"low", "mid", "high"},
+        "budget_tagged": plan.get("budget") in BUDGET_TIERS,
         "no_duplicates": len({stop.get("title") for stop in stops}) == len(stops),
-        "has_sources": all(stop.get("source") for stop in stops),
+        "has_sources": all([stop.get("source") for stop in stops]),
     }
-    score = sum(int(value) for value in rules.values())
+    score = sum(rules.values())
     return EvaluationResult(score=score, max=len(rules), rules=rules)
 
+
+def evaluate(plan: Dict[str, Any]) -> EvaluationResult:
+    return _score(plan, _activity_text(plan.get("schedule", [])))
+
+
+def evaluate_many(plans: Iterable[Dict[str, Any]]) -> List[EvaluationResult]:
+    """Score many plans in one pass; results line up with the input order."""
+    return [_score(plan, _activity_text(plan.get("schedule", []))) for plan in plans]
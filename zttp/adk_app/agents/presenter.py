@@ -3,26 +3,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Protocol
 
 from adk_app.tools.export import md_export
 
 
+class Writable(Protocol):
+    def write(self, chunk: str) -> Any: ...
+
+
 @dataclass
 class PresenterAgent:
     """Persist itinerary artifacts as Markdown files."""
 
     output_dir: str
 
-    def _render_schedule(self, schedule: List[Dict[str, Any]]) -> str:
-        lines = ["## Schedule"]
+    def _render_schedule(self, schedule: List[Dict[str, Any]]) -> Iterator[str]:
+        yield "## Schedule\n"
         for day in schedule:
-            lines.append(f"### {day['date']} – {day['city']}")
+            lines = [f"### {day['date']} – {day['city']}"]
             for segment in day.get("segments", []):
                 summary = segment.get("summary")
                 detail = f" — {summary}" if summary else ""
                 lines.append(f"- **{segment['slot'].title()}**: {segment['activity']}{detail}")
-        return "\n".join(lines)
+            yield "\n".join(lines) + "\n"
 
     def _render_checklists(self, checklist: Dict[str, List[str]]) -> str:
         lines = ["## Packing Checklist"]
@@ -33,28 +37,42 @@ class PresenterAgent:
             lines.append(f"- [ ] {task}")
         return "\n".join(lines)
 
-    def present(
+    def render(
         self,
         *,
-        filename: str,
         schedule: List[Dict[str, Any]],
         stops: List[Dict[str, Any]],
         checklist: Dict[str, List[str]],
         weather_note: str | None = None,
-    ) -> str:
-        parts = ["# Zero-Key Trip & Task Planner\n"]
+    ) -> Iterator[str]:
+        """Yield the Markdown document one section (or one day) at a time."""
+        yield "# Zero-Key Trip & Task Planner\n\n"
         if weather_note:
-            parts.append(f"> Weather note: {weather_note}\n")
-        parts.append(self._render_schedule(schedule))
+            yield f"> Weather note: {weather_note}\n\n"
+        yield from self._render_schedule(schedule)
         if stops:
-            parts.append("\n## Points of Interest")
+            yield "\n## Points of Interest\n"
             for stop in stops:
-                parts.append(f"- **{stop['title']}** — {stop.get('summary', 'No summary available.')}")
+                lines = [f"- **{stop['title']}** — {stop.get('summary', 'No summary available.')}"]
                 if stop.get("source"):
-                    parts.append(f"  - Source: {stop['source']}")
-        parts.append("\n" + self._render_checklists(checklist))
-        content = "\n".join(parts) + "\n"
+                    lines.append(f"  - Source: {stop['source']}")
+                yield "\n".join(lines) + "\n"
+        yield "\n" + self._render_checklists(checklist) + "\n"
+
+    def present_to(self, out: Writable, **plan: Any) -> None:
+        """Stream the rendered document into any object with ``write(str)``, e.g. an HTTP response."""
+        for chunk in self.render(**plan):
+            out.write(chunk)
+
+    def present(
+        self,
+        *,
+        filename: str,
+        schedule: List[Dict[str, Any]],
+        stops: List[Dict[str, Any]],
+        checklist: Dict[str, List[str]],
+        weather_note: str | None = None,
+    ) -> str:
         path = f"{self.output_dir}/{filename}"
-        md_export(path, content)
+        md_export(path, self.render(schedule=schedule, stops=stops, checklist=checklist, weather_note=weather_note))
         return path
-
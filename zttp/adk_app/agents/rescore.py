@@ -0,0 +1,110 @@
+"""Re-score stored itineraries with the rubric and persist the results.
+
+Usage (from the ``zttp`` directory)::
+
+    python -m adk_app.agents.rescore
+    python -m adk_app.agents.rescore --db db/zttp.sqlite --limit 5000 --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from adk_app.memory.sqlite_memory import SQLiteMemoryService
+
+from .evaluator import evaluate_many
+
+DEFAULT_DB = Path(__file__).resolve().parents[2] / "db" / "zttp.sqlite"
+
+
+def parse_artifact(text: str, *, budget: Optional[str] = None) -> Dict[str, Any]:
+    """Rebuild the parts of a plan the rubric looks at from a presenter Markdown file.
+
+    The budget is not written to the artifact, so callers pass it in (the
+    re-score CLI uses the owner's profile tier).
+    """
+    plan: Dict[str, Any] = {
+        "schedule": [],
+        "stops": [],
+        "weather_note": None,
+        "budget": budget,
+        "checklist": {"packing": [], "tasks": []},
+    }
+    section = ""
+    for line in text.splitlines():
+        if line.startswith("> Weather note: "):
+            plan["weather_note"] = line[len("> Weather note: ") :]
+        elif line.startswith("## "):
+            section = line[3:].strip()
+        elif section == "Schedule" and line.startswith("### "):
+            day_label, _, city = line[4:].partition(" – ")
+            plan["schedule"].append({"date": day_label, "city": city, "segments": []})
+        elif section == "Schedule" and line.startswith("- **") and plan["schedule"]:
+            slot, _, rest = line[4:].partition("**: ")
+            activity, _, summary = rest.partition(" — ")
+            plan["schedule"][-1]["segments"].append({"slot": slot.lower(), "activity": activity, "summary": summary})
+        elif section == "Points of Interest" and line.startswith("- **"):
+            title, _, summary = line[4:].partition("** — ")
+            plan["stops"].append({"title": title, "summary": summary})
+        elif section == "Points of Interest" and line.startswith("  - Source: ") and plan["stops"]:
+            plan["stops"][-1]["source"] = line[len("  - Source: ") :]
+        elif section.endswith("Checklist") and line.startswith("- [ ] "):
+            key = "packing" if section.startswith("Packing") else "tasks"
+            plan["checklist"][key].append(line[6:])
+    return plan
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Re-score historical itineraries with the rubric.")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB)
+    parser.add_argument("--limit", type=int, default=None, help="only the most recent N itineraries")
+    parser.add_argument("--dry-run", action="store_true", help="score without writing rubric_scores")
+    args = parser.parse_args(argv)
+
+    with SQLiteMemoryService(db_path=args.db) as memory:
+        rows = memory.connections.connection().execute(
+            """
+            SELECT i.user_id, i.city, i.start_date, i.artifact_path, u.budget_tier
+            FROM itineraries AS i LEFT JOIN users AS u ON u.user_id = i.user_id
+            ORDER BY i.id DESC
+            LIMIT ?
+            """,
+            (-1 if args.limit is None else args.limit,),
+        ).fetchall()
+
+        start = time.perf_counter()
+        run_ids: List[str] = []
+        plans: List[Dict[str, Any]] = []
+        missing = 0
+        for user_id, city, start_date, artifact_path, budget in rows:
+            try:
+                text = Path(artifact_path).read_text(encoding="utf-8")
+            except OSError:
+                missing += 1
+                continue
+            # Same run id the orchestration graph uses for live runs.
+            run_ids.append(f"run-{user_id}-{start_date}-{city.replace(' ', '_')}")
+            plans.append(parse_artifact(text, budget=budget))
+        parsed_at = time.perf_counter()
+        results = evaluate_many(plans)
+        evaluated_at = time.perf_counter()
+        if not args.dry_run:
+            memory.record_rubric_scores(
+                (run_id, result.score, result.max, result.passed) for run_id, result in zip(run_ids, results)
+            )
+        elapsed = time.perf_counter() - start
+
+    passed = sum(result.passed for result in results)
+    print(f"Re-scored {len(results)} plans ({missing} artifacts missing), {passed} passed.")
+    if results:
+        print(
+            f"{len(results) / elapsed:,.0f} plans/s end to end; "
+            f"{len(results) / max(evaluated_at - parsed_at, 1e-9):,.0f} plans/s scoring only."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,41 +4,86 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, List, Optional
 
-from adk_app.tools.wiki import wiki_page, wiki_search
-
-
-async def _fetch_page(title: str) -> Dict[str, Any]:
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, wiki_page, title)
-
-
-async def _fetch_pages(titles: Iterable[str]) -> List[Dict[str, Any]]:
-    return await asyncio.gather(*(_fetch_page(t) for t in titles))
+from adk_app.memory.poi_index import POIIndex
+from adk_app.tools.cache import get_response_cache
+from adk_app.tools.deadline import Deadline, DeadlineExceeded, current_deadline
+from adk_app.tools.wiki import wiki_search_extracts_async
 
 
 @dataclass
 class ResearcherAgent:
-    """Collect information about points of interest."""
+    """Collect information about points of interest.
+
+    With an ``index``, queries are answered from the local POI index when it
+    can serve them, and live results are written back to it. The index is
+    skipped while the response cache is bypassed.
+    """
 
     max_results: int = 6
+    summary_sentences: int = 2
+    summary_max_bytes: int = 512
+    index: Optional[POIIndex] = None
+
+    async def research(
+        self, *, city: str, focus: str | None = None, limit: int | None = None, deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """Return ``{"city", "pois"}`` for the query.
+
+        ``deadline`` (by default the run's :func:`current_deadline`) bounds the
+        live fetch. When it runs out, :class:`DeadlineExceeded` is raised with
+        ``partial`` set to a result built from the pages that did arrive,
+        topped up from the index, so the caller can carry on with it.
+        """
+        limit = limit or self.max_results
+        deadline = deadline or current_deadline()
+        index = self.index if self.index is not None and not get_response_cache().bypass else None
+        if index is not None:
+            cached = await asyncio.to_thread(index.lookup, city, focus=focus, limit=limit)
+            if cached is not None:
+                return {"city": city, "pois": cached}
 
-    async def research(self, *, city: str, focus: str | None = None) -> Dict[str, Any]:
         query = f"{city} points of interest"
         if focus:
             query = f"{query} {focus}"
-        search_results = wiki_search(query, limit=self.max_results)
-        titles = [result["title"] for result in search_results]
-        pages = await _fetch_pages(titles)
-        pois: List[Dict[str, Any]] = []
-        for page, result in zip(pages, search_results):
-            pois.append(
-                {
-                    "title": page.get("title") or result["title"],
-                    "summary": (page.get("text") or "").split("\n", 1)[0].strip(),
-                    "source": f"https://en.wikipedia.org/wiki/{result['title'].replace(' ', '_')}",
-                }
-            )
+        # Search and intro extracts arrive together, so the cost stays at one
+        # round trip (two above 20 results) regardless of ``max_results``. Only
+        # a short, size-capped summary is requested since that is all we keep.
+        fetch = wiki_search_extracts_async(
+            query,
+            limit,
+            sentences=self.summary_sentences,
+            max_bytes=self.summary_max_bytes,
+        )
+        try:
+            # The HTTP client cuts its own requests at the deadline and keeps what
+            # arrived; the bound here covers waiting on another run's fetch.
+            pages = await (fetch if deadline is None else deadline.bound(fetch, "wiki_search_extracts", grace=0.05))
+        except DeadlineExceeded as exc:
+            pois = _pois(exc.partial or [])
+            if index is not None and len(pois) < limit:
+                known = {poi["title"] for poi in pois}
+                fallback = await asyncio.to_thread(index.lookup, city, focus=focus, limit=limit, partial=True)
+                pois.extend(poi for poi in fallback or [] if poi["title"] not in known)
+            # Partial answers are not written back: the index would treat them as complete.
+            raise DeadlineExceeded(str(exc), partial={"city": city, "pois": pois[:limit]}) from exc
+        pois = _pois(pages)
+        if index is not None:
+            await asyncio.to_thread(index.store, city, pois, focus=focus, requested=limit)
         return {"city": city, "pois": pois}
 
+
+def _pois(pages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    pois: List[Dict[str, Any]] = []
+    for page in pages:
+        poi = {
+            "title": page["title"],
+            "summary": (page.get("text") or "").split("\n", 1)[0].strip(),
+            "source": f"https://en.wikipedia.org/wiki/{page['title'].replace(' ', '_')}",
+        }
+        if "lat" in page and "lon" in page:
+            poi["lat"] = page["lat"]
+            poi["lon"] = page["lon"]
+        pois.append(poi)
+    return pois
@@ -3,30 +3,82 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
-
-from adk_app.tools.geo import cluster_points
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
 class SchedulerAgent:
     """Arrange researched POIs into the planner skeleton."""
 
-    def schedule(self, *, skeleton: Dict[str, Any], pois: List[Dict[str, Any]]) -> Dict[str, Any]:
+    route_budget_ms: float = 5.0
+
+    def _order_day(self, pois: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Order a day's stops for the shortest walk; POIs without coordinates go last."""
+        from adk_app.tools.geo import coordinates_array, haversine_matrix
+        from adk_app.tools.routing import solve_route
+
+        located = [poi for poi in pois if "lat" in poi and "lon" in poi]
+        unlocated = [poi for poi in pois if "lat" not in poi or "lon" not in poi]
+        solution = solve_route(haversine_matrix(coordinates_array(located)), time_budget_ms=self.route_budget_ms)
+        ordered = [located[i] for i in solution.order] + unlocated
+        route = {
+            "distance_km": solution.distance_km,
+            "solve_ms": solution.solve_ms,
+            "timed_out": solution.timed_out,
+            "stops": len(ordered),
+        }
+        return ordered, route
+
+    @staticmethod
+    def _meal(slot: str, near: Dict[str, Any] | None) -> Dict[str, Any]:
+        where = f"near {near['title']}" if near else "at a local café"
+        return {"slot": slot, "activity": f"{slot.title()} {where}"}
+
+    def schedule(
+        self,
+        *,
+        skeleton: Dict[str, Any],
+        pois: List[Dict[str, Any]],
+        weather: Optional[Dict[str, Dict[str, Any]]] = None,
+        dedupe: bool = False,
+        include_meals: bool = False,
+    ) -> Dict[str, Any]:
+        """Fill the skeleton's slots from ``pois``.
+
+        ``weather`` maps ISO dates to that day's forecast (see
+        :func:`~adk_app.tools.weather.forecast_by_date`) and is attached to
+        the matching day. ``dedupe`` drops repeated titles before scheduling;
+        ``include_meals`` adds breakfast and lunch stops next to each day's
+        first activities.
+        """
+        # geo/routing pull in numpy; import them on first use rather than at app start-up.
+        from adk_app.tools.geo import cluster_points
+
         days = skeleton.get("days", [])
         if not days:
-            return {"schedule": [], "stops": []}
-        clusters = cluster_points(pois, buckets=len(days) or 1)
+            return {"schedule": [], "stops": [], "routes": []}
+        if dedupe:
+            unique: Dict[str, Dict[str, Any]] = {}
+            for poi in pois:
+                unique.setdefault(poi.get("title", ""), poi)
+            pois = list(unique.values())
+        # Keep the best-ranked POIs that fit the available slots, then group
+        # them by neighbourhood so each day stays in one part of the city.
+        capacity = sum(len(day["segments"]) for day in days)
+        clusters = cluster_points(pois[:capacity], buckets=len(days) or 1)
         schedule: List[Dict[str, Any]] = []
         stops: List[Dict[str, Any]] = []
-        poi_iter = iter(pois)
+        routes: List[Dict[str, Any]] = []
         for day, cluster in zip(days, clusters):
             segments = day["segments"]
             day_plan = {"date": day["date"], "city": day["city"], "segments": []}
+            if weather and day["date"] in weather:
+                day_plan["weather"] = weather[day["date"]]
+            ordered, route = self._order_day(cluster[: len(segments)])
+            routes.append({"date": day["date"], **route})
+            day_pois = iter(ordered)
             for segment in segments:
-                poi = next(poi_iter, None)
-                if poi is None and cluster:
-                    poi = cluster.pop(0)
+                poi = next(day_pois, None)
                 if poi is None:
                     entry = {"slot": segment["slot"], "activity": "Open exploration"}
                 else:
@@ -37,6 +89,9 @@ class SchedulerAgent:
                         "summary": poi.get("summary"),
                     }
                 day_plan["segments"].append(entry)
+            if include_meals:
+                first = ordered[0] if ordered else None
+                day_plan["segments"].insert(0, self._meal("breakfast", first))
+                day_plan["segments"].insert(2, self._meal("lunch", ordered[1] if len(ordered) > 1 else first))
             schedule.append(day_plan)
-        return {"schedule": schedule, "stops": stops}
-
+        return {"schedule": schedule, "stops": stops, "routes": routes}
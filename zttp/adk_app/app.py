@@ -2,28 +2,51 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import weakref
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence
 
 from adk_app.agents.checklist import ChecklistAgent
 from adk_app.agents.planner import PlannerAgent
 from adk_app.agents.presenter import PresenterAgent
 from adk_app.agents.researcher import ResearcherAgent
 from adk_app.agents.scheduler import SchedulerAgent
+from adk_app.memory.poi_index import POIIndex
 from adk_app.memory.sqlite_memory import SQLiteMemoryService
+from adk_app.orchestration.background import run_blocking
+from adk_app.orchestration.batch import BatchResult
 from adk_app.orchestration.graph import OrchestrationGraph
 from adk_app.telemetry.logger import TelemetryLogger
+from adk_app.tools.cache import configure_response_cache
 
 
 @dataclass
 class Application:
     graph: OrchestrationGraph
+    max_concurrency: int = 8
+    _semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = field(
+        default_factory=weakref.WeakKeyDictionary, init=False, repr=False
+    )
 
     def run(self, request: Dict[str, Any]) -> Dict[str, Any]:
         return self.graph.run(**request)
 
+    async def run_async(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Plan on the running loop, with at most ``max_concurrency`` plans in flight."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        async with semaphore:
+            return await self.graph.run_async(**request)
+
+    def run_batch(self, requests: Sequence[Dict[str, Any]], max_workers: int = 8) -> List[BatchResult]:
+        """Plan many requests at once, sharing research and weather fetches between them."""
+        return run_blocking(self.graph.run_batch_async(requests, max_workers=max_workers))
+
 
 def create_app(base_path: Path) -> Application:
     base_path = base_path.resolve()
@@ -31,10 +54,11 @@ def create_app(base_path: Path) -> Application:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     memory_service = SQLiteMemoryService(db_path=db_path)
     telemetry = TelemetryLogger(db_path=str(db_path))
+    configure_response_cache(db_path=db_path.with_name("tool_cache.sqlite"))
 
     graph = OrchestrationGraph(
         planner=PlannerAgent(),
-        researcher=ResearcherAgent(),
+        researcher=ResearcherAgent(index=POIIndex(db_path.with_name("poi_index.sqlite"))),
         scheduler=SchedulerAgent(),
         checklist=ChecklistAgent(),
         presenter=PresenterAgent(output_dir=str(base_path / "plans")),
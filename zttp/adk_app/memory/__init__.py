@@ -1,5 +1,30 @@
-"""Memory service utilities."""
+"""Memory service utilities.
 
-from .sqlite_memory import SQLiteMemoryService
+Exports resolve lazily on first access.
+"""
 
-__all__ = ["SQLiteMemoryService"]
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .connection import SQLiteConnectionManager
+    from .migrations import LATEST_VERSION, migrate
+    from .poi_index import POIIndex
+    from .profile_cache import ProfileCache
+    from .sqlite_memory import SQLiteMemoryService
+
+_EXPORTS: Dict[str, str] = {
+    "SQLiteConnectionManager": ".connection",
+    "LATEST_VERSION": ".migrations",
+    "migrate": ".migrations",
+    "POIIndex": ".poi_index",
+    "ProfileCache": ".profile_cache",
+    "SQLiteMemoryService": ".sqlite_memory",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
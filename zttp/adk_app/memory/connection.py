@@ -0,0 +1,93 @@
+"""Thread-local SQLite connection management with WAL and tuned pragmas."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Union
+
+
+class _Holder:
+    """Per-thread box for a connection; its finalizer closes the connection when the thread exits."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+
+@dataclass
+class SQLiteConnectionManager:
+    """Hand out one long-lived connection per thread for a database file.
+
+    The database runs in WAL mode so readers on other threads are never
+    blocked by the single writer; concurrent writers wait up to
+    ``busy_timeout_ms`` for the write lock instead of failing immediately.
+    A thread's connection is closed when that thread exits, so short-lived
+    executor threads do not leave connections behind.
+    """
+
+    db_path: Union[str, Path]
+    cached_statements: int = 256
+    cache_size_kib: int = 8192
+    busy_timeout_ms: int = 5000
+    synchronous: str = "NORMAL"
+    _local: threading.local = field(default_factory=threading.local, init=False, repr=False)
+    _all: Dict[int, sqlite3.Connection] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.busy_timeout_ms / 1000,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use.
+
+        Use the connection as a context manager for a transaction; it is not
+        closed on exit and is reused by later calls from the same thread.
+        """
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            with self._lock:
+                if self._closed:
+                    raise sqlite3.ProgrammingError(f"Connection manager for {self.db_path} is closed")
+                conn = self._open()
+                self._all[id(conn)] = conn
+            holder = self._local.holder = _Holder(conn)
+            # Thread-local values are dropped when their thread ends.
+            weakref.finalize(holder, self._release, conn)
+        return holder.conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if self._all.pop(id(conn), None) is None:
+                return
+        conn.close()
+
+    @property
+    def open_connections(self) -> int:
+        with self._lock:
+            return len(self._all)
+
+    def close(self) -> None:
+        """Close every connection opened by any thread."""
+        with self._lock:
+            self._closed = True
+            connections, self._all = list(self._all.values()), {}
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
@@ -0,0 +1,87 @@
+"""Versioned schema migrations for the memory database.
+
+Version 1 is the baseline in ``schema.sql``; later versions are appended to
+:data:`MIGRATIONS` and never edited once released. The applied version is
+kept in ``PRAGMA user_version`` (cheap to check on every start-up) and each
+step is also logged in ``schema_migrations``.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional, Union
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    sql: Union[str, Callable[[], str]]
+
+
+def _baseline() -> str:
+    return Path(__file__).with_name("schema.sql").read_text(encoding="utf-8")
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "baseline schema.sql", _baseline),
+    Migration(
+        2,
+        "history and telemetry indexes",
+        """
+        CREATE INDEX IF NOT EXISTS idx_itineraries_user_id ON itineraries(user_id, id);
+        CREATE INDEX IF NOT EXISTS idx_telemetry_run_id ON telemetry(run_id);
+        CREATE INDEX IF NOT EXISTS idx_telemetry_agent_tool_start ON telemetry(agent, tool, start_ts);
+        """,
+    ),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+_LOG_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    applied_at REAL NOT NULL
+)
+"""
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection, target: Optional[int] = None) -> List[int]:
+    """Apply every migration above the database's version, up to ``target``; return those applied.
+
+    Each migration runs in its own transaction together with its version
+    bump, so an interrupted upgrade resumes from the last completed step.
+    """
+    target = LATEST_VERSION if target is None else target
+    version = current_version(conn)
+    applied: List[int] = []
+    for migration in MIGRATIONS:
+        if migration.version <= version or migration.version > target:
+            continue
+        sql = migration.sql() if callable(migration.sql) else migration.sql
+        # executescript() commits any open transaction first, so wrap the
+        # script explicitly to keep the DDL and the version bump atomic.
+        try:
+            conn.executescript(
+                f"""
+                BEGIN;
+                {sql}
+                {_LOG_TABLE};
+                INSERT OR REPLACE INTO schema_migrations(version, name, applied_at)
+                VALUES ({migration.version}, '{migration.name.replace("'", "''")}', {time.time()});
+                PRAGMA user_version = {migration.version};
+                COMMIT;
+                """
+            )
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        applied.append(migration.version)
+    return applied
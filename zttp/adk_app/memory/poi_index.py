@@ -0,0 +1,276 @@
+"""Local full-text POI index (SQLite FTS5) so research can be served offline.
+
+Load a dump with one JSON object per line (``city``, ``title``, ``summary``
+and optionally ``source``, ``lat``, ``lon``), from the ``zttp`` directory::
+
+    python -m adk_app.memory.poi_index pois.jsonl
+    python -m adk_app.memory.poi_index pois.jsonl --db db/poi_index.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .connection import SQLiteConnectionManager
+
+DEFAULT_DB = Path(__file__).resolve().parents[2] / "db" / "poi_index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pois (
+    id INTEGER PRIMARY KEY,
+    city TEXT NOT NULL,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL,
+    lat REAL,
+    lon REAL,
+    UNIQUE (city, title)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS pois_fts USING fts5(
+    city, title, summary, content='pois', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS pois_ai AFTER INSERT ON pois BEGIN
+    INSERT INTO pois_fts(rowid, city, title, summary) VALUES (new.id, new.city, new.title, new.summary);
+END;
+
+CREATE TRIGGER IF NOT EXISTS pois_ad AFTER DELETE ON pois BEGIN
+    INSERT INTO pois_fts(pois_fts, rowid, city, title, summary)
+    VALUES ('delete', old.id, old.city, old.title, old.summary);
+END;
+
+CREATE TRIGGER IF NOT EXISTS pois_au AFTER UPDATE ON pois BEGIN
+    INSERT INTO pois_fts(pois_fts, rowid, city, title, summary)
+    VALUES ('delete', old.id, old.city, old.title, old.summary);
+    INSERT INTO pois_fts(rowid, city, title, summary) VALUES (new.id, new.city, new.title, new.summary);
+END;
+
+CREATE TABLE IF NOT EXISTS poi_queries (
+    city TEXT NOT NULL,
+    focus TEXT NOT NULL,
+    requested INTEGER NOT NULL,
+    poi_ids TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (city, focus)
+);
+"""
+
+_UPSERT = """
+INSERT INTO pois(city, title, summary, source, lat, lon)
+VALUES(?, ?, ?, ?, ?, ?)
+ON CONFLICT(city, title) DO UPDATE SET
+    summary=excluded.summary,
+    source=excluded.source,
+    lat=COALESCE(excluded.lat, pois.lat),
+    lon=COALESCE(excluded.lon, pois.lon)
+"""
+
+
+def _city_key(city: str) -> str:
+    return " ".join(city.lower().split())
+
+
+def _focus_key(focus: Optional[str]) -> str:
+    return " ".join((focus or "").lower().split())
+
+
+def _quote(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _match_expression(text: str, city_key: Optional[str] = None) -> str:
+    # Constraining the city inside MATCH keeps FTS from scoring every city's rows.
+    terms = "{title summary}: (" + " OR ".join(_quote(term) for term in text.split()) + ")"
+    return terms if city_key is None else f"city: {_quote(city_key)} AND {terms}"
+
+
+def _source_for(title: str) -> str:
+    return f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
+
+
+def _row_values(city: str, poi: Dict[str, Any]) -> tuple:
+    title = poi["title"]
+    return (
+        _city_key(city),
+        title,
+        poi.get("summary") or "",
+        poi.get("source") or _source_for(title),
+        poi.get("lat"),
+        poi.get("lon"),
+    )
+
+
+def _as_poi(row: tuple) -> Dict[str, Any]:
+    poi: Dict[str, Any] = {"title": row[0], "summary": row[1], "source": row[2]}
+    if row[3] is not None and row[4] is not None:
+        poi["lat"] = row[3]
+        poi["lon"] = row[4]
+    return poi
+
+
+@dataclass
+class POIIndex:
+    """Points of interest per city with an FTS5 index over titles and summaries.
+
+    :meth:`lookup` answers a research query locally when it can: either the
+    same city/focus was fetched before for at least as many results, or the
+    index already holds enough POIs for the city that match the focus.
+    Anything else is a miss, and the caller is expected to fetch live and
+    hand the results to :meth:`store`.
+    """
+
+    db_path: Union[str, Path] = DEFAULT_DB
+    connections: SQLiteConnectionManager = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.connections = SQLiteConnectionManager(self.db_path)
+        with self.connections.connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connections.close()
+
+    def lookup(
+        self, city: str, *, focus: Optional[str] = None, limit: int = 6, partial: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return up to ``limit`` POIs for the query, or ``None`` on a miss.
+
+        With ``partial``, fewer than ``limit`` matches still count as an
+        answer; that is the fallback when live research runs out of time.
+        """
+        city_key, focus_key = _city_key(city), _focus_key(focus)
+        conn = self.connections.connection()
+        row = conn.execute(
+            "SELECT requested, poi_ids FROM poi_queries WHERE city = ? AND focus = ?", (city_key, focus_key)
+        ).fetchone()
+        ids = json.loads(row[1])[:limit] if row is not None and row[0] >= limit else []
+        # An empty recorded answer (left by older versions) is a miss, not "no POIs".
+        if ids:
+            placeholders = ",".join("?" * len(ids))
+            found = {
+                poi_id: values
+                for poi_id, *values in conn.execute(
+                    f"SELECT id, title, summary, source, lat, lon FROM pois WHERE id IN ({placeholders})", ids
+                )
+            }
+            if len(found) == len(ids):
+                return [_as_poi(tuple(found[poi_id])) for poi_id in ids]
+
+        if focus_key:
+            rows = conn.execute(
+                """
+                SELECT p.title, p.summary, p.source, p.lat, p.lon
+                FROM pois_fts JOIN pois AS p ON p.id = pois_fts.rowid
+                WHERE pois_fts MATCH ? AND p.city = ?
+                ORDER BY bm25(pois_fts)
+                LIMIT ?
+                """,
+                (_match_expression(focus_key, city_key), city_key, limit),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT title, summary, source, lat, lon FROM pois WHERE city = ? ORDER BY id LIMIT ?",
+                (city_key, limit),
+            ).fetchall()
+        if not rows or (len(rows) < limit and not partial):
+            return None
+        return [_as_poi(row) for row in rows]
+
+    def search(self, text: str, *, city: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Full-text search over titles and summaries, best matches first."""
+        if not text.split():
+            return []
+        sql = """
+            SELECT p.title, p.summary, p.source, p.lat, p.lon
+            FROM pois_fts JOIN pois AS p ON p.id = pois_fts.rowid
+            WHERE pois_fts MATCH ?
+        """
+        city_key = None if city is None else _city_key(city)
+        params: List[Any] = [_match_expression(_focus_key(text), city_key)]
+        if city_key is not None:
+            sql += " AND p.city = ?"
+            params.append(city_key)
+        sql += " ORDER BY bm25(pois_fts) LIMIT ?"
+        params.append(limit)
+        return [_as_poi(row) for row in self.connections.connection().execute(sql, params)]
+
+    def store(
+        self, city: str, pois: List[Dict[str, Any]], *, focus: Optional[str] = None, requested: Optional[int] = None
+    ) -> None:
+        """Write live research results back, remembering them as the answer to this query.
+
+        An empty result is not remembered: it would be served forever as a hit
+        and the query would never reach live research again.
+        """
+        if not pois:
+            return
+        city_key = _city_key(city)
+        with self.connections.connection() as conn:
+            ids = [
+                conn.execute(_UPSERT + " RETURNING id", _row_values(city, poi)).fetchone()[0] for poi in pois
+            ]
+            conn.execute(
+                """
+                INSERT INTO poi_queries(city, focus, requested, poi_ids, fetched_at)
+                VALUES(?, ?, ?, ?, ?)
+                ON CONFLICT(city, focus) DO UPDATE SET
+                    requested=excluded.requested,
+                    poi_ids=excluded.poi_ids,
+                    fetched_at=excluded.fetched_at
+                """,
+                (city_key, _focus_key(focus), requested or len(pois), json.dumps(ids), time.time()),
+            )
+
+    def load(self, records: Iterable[Dict[str, Any]], *, batch_size: int = 5000) -> int:
+        """Bulk-insert ``records`` (each with a ``city``), one transaction per batch."""
+        conn = self.connections.connection()
+        total = 0
+        batch: List[tuple] = []
+        for record in records:
+            batch.append(_row_values(record["city"], record))
+            if len(batch) >= batch_size:
+                with conn:
+                    conn.executemany(_UPSERT, batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            with conn:
+                conn.executemany(_UPSERT, batch)
+            total += len(batch)
+        return total
+
+    def count(self) -> int:
+        return self.connections.connection().execute("SELECT COUNT(*) FROM pois").fetchone()[0]
+
+
+def read_jsonl(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Bulk-load POIs from a JSONL dump into the local index.")
+    parser.add_argument("path", type=Path, help="JSONL file with city, title, summary[, source, lat, lon]")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    index = POIIndex(db_path=args.db)
+    start = time.perf_counter()
+    loaded = index.load(read_jsonl(args.path), batch_size=args.batch_size)
+    elapsed = time.perf_counter() - start
+    print(f"Loaded {loaded} POIs in {elapsed:.2f}s ({loaded / max(elapsed, 1e-9):,.0f}/s); index holds {index.count()}.")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
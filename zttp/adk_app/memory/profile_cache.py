@@ -0,0 +1,105 @@
+"""Bounded in-process LRU cache for user profiles."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+Profile = Dict[str, str]
+
+
+@dataclass
+class ProfileCache:
+    """Least-recently-used profiles, including "no such user" answers.
+
+    Unknown users are cached as negative entries with a shorter TTL so a
+    profile created by another process still shows up soon. Readers take a
+    :meth:`token` before going to SQLite and hand it to :meth:`put`; any
+    write in between makes the token stale, so a slow reader can never put
+    back a profile that an upsert has already replaced. ``max_entries=0``
+    disables caching while keeping the counters.
+    """
+
+    max_entries: int = 1024
+    ttl_seconds: float = 300.0
+    negative_ttl_seconds: float = 30.0
+    hits: int = field(default=0, init=False)
+    negative_hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    evictions: int = field(default=0, init=False)
+    invalidations: int = field(default=0, init=False)
+    _entries: "OrderedDict[str, Tuple[float, Optional[Profile]]]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _writes: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def get(self, user_id: str) -> Tuple[bool, Optional[Profile]]:
+        """Return ``(found, profile)``; ``(True, None)`` is a cached unknown user."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                if entry[1] is None:
+                    self.negative_hits += 1
+                    return True, None
+                self.hits += 1
+                return True, dict(entry[1])
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+        return False, None
+
+    def token(self) -> int:
+        with self._lock:
+            return self._writes
+
+    def put(self, user_id: str, profile: Optional[Profile], token: int) -> None:
+        """Cache what a read returned, unless a write happened since ``token``."""
+        with self._lock:
+            if token != self._writes:
+                return
+            self._store(user_id, profile)
+
+    def write_through(self, user_id: str, profile: Profile) -> None:
+        """Record a committed upsert and make every outstanding read token stale."""
+        with self._lock:
+            self._writes += 1
+            self._store(user_id, profile)
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        with self._lock:
+            self._writes += 1
+            self.invalidations += 1
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+    def _store(self, user_id: str, profile: Optional[Profile]) -> None:
+        if self.max_entries <= 0:
+            return
+        ttl = self.negative_ttl_seconds if profile is None else self.ttl_seconds
+        self._entries[user_id] = (time.monotonic() + ttl, None if profile is None else dict(profile))
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Return counters and the hit rate (negative hits count as hits)."""
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+            }
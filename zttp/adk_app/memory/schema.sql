@@ -34,3 +34,33 @@ CREATE TABLE IF NOT EXISTS rubric_scores (
     passed INTEGER,
     created_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
+
+CREATE TABLE IF NOT EXISTS telemetry_rollups (
+    bucket_start INTEGER NOT NULL,
+    agent TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    calls INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    total_ms INTEGER NOT NULL,
+    histogram TEXT NOT NULL,
+    PRIMARY KEY (bucket_start, agent, tool)
+);
+
+CREATE TABLE IF NOT EXISTS telemetry_metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT,
+    agent TEXT,
+    name TEXT,
+    value REAL,
+    ts REAL
+);
+
+CREATE TABLE IF NOT EXISTS plan_cache (
+    cache_key TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_plan_cache_user ON plan_cache(user_id);
@@ -2,43 +2,115 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .connection import SQLiteConnectionManager
+from .migrations import LATEST_VERSION, current_version, migrate
+from .profile_cache import ProfileCache
+
+_MAX_ROWID = 2**63 - 1
+# Stay well under SQLite's bound-parameter limit for IN (...) lookups.
+_IN_CHUNK = 500
+
+
+def _profile(row: tuple) -> Dict[str, str]:
+    return {"user_id": row[0], "budget_tier": row[1], "pace_preference": row[2], "must_avoid": row[3]}
+
+
+def _drop_cached_plans(conn: sqlite3.Connection, where: str, params: Tuple[Any, ...]) -> List[str]:
+    """Delete the matching plan_cache rows and return the artifact paths they held."""
+    paths = [
+        row[0]
+        for row in conn.execute(
+            f"SELECT json_extract(payload, '$.artifact_path') FROM plan_cache WHERE {where}", params
+        )
+        if row[0]
+    ]
+    conn.execute(f"DELETE FROM plan_cache WHERE {where}", params)
+    return paths
 
 
 @dataclass
 class SQLiteMemoryService:
     db_path: Path
+    profile_cache: ProfileCache = field(default_factory=ProfileCache)
+    connections: SQLiteConnectionManager = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
+        self.connections = SQLiteConnectionManager(self.db_path)
         self.ensure_schema()
 
     @property
     def _connection(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        return self.connections.connection()
+
+    def close(self) -> None:
+        self.connections.close()
+
+    def __enter__(self) -> "SQLiteMemoryService":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def ensure_schema(self) -> None:
-        schema_path = Path(__file__).with_name("schema.sql")
-        sql = schema_path.read_text(encoding="utf-8")
-        with self._connection as conn:
-            conn.executescript(sql)
+        """Run pending migrations; a database already at the latest version costs one PRAGMA read."""
+        conn = self._connection
+        if current_version(conn) < LATEST_VERSION:
+            migrate(conn)
 
     def get_user_profile(self, user_id: str) -> Optional[Dict[str, str]]:
+        found, profile = self.profile_cache.get(user_id)
+        if found:
+            return profile
+        token = self.profile_cache.token()
         with self._connection as conn:
             row = conn.execute(
                 "SELECT user_id, budget_tier, pace_preference, must_avoid FROM users WHERE user_id = ?",
                 (user_id,),
             ).fetchone()
-        if row is None:
-            return None
-        return {
-            "user_id": row[0],
-            "budget_tier": row[1],
-            "pace_preference": row[2],
-            "must_avoid": row[3],
-        }
+        profile = None if row is None else _profile(row)
+        self.profile_cache.put(user_id, profile, token)
+        return profile
+
+    def get_user_profiles(self, user_ids: Iterable[str]) -> Dict[str, Optional[Dict[str, str]]]:
+        """Look up many profiles at once; unknown users map to ``None``.
+
+        Cached answers are served from memory and the rest are loaded with
+        one ``IN`` query per :data:`_IN_CHUNK` ids.
+        """
+        result: Dict[str, Optional[Dict[str, str]]] = {}
+        missing: List[str] = []
+        for user_id in dict.fromkeys(user_ids):
+            found, profile = self.profile_cache.get(user_id)
+            if found:
+                result[user_id] = profile
+            else:
+                missing.append(user_id)
+        if not missing:
+            return result
+        token = self.profile_cache.token()
+        loaded: Dict[str, Dict[str, str]] = {}
+        with self._connection as conn:
+            for offset in range(0, len(missing), _IN_CHUNK):
+                chunk = missing[offset : offset + _IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                for row in conn.execute(
+                    "SELECT user_id, budget_tier, pace_preference, must_avoid FROM users "
+                    f"WHERE user_id IN ({placeholders})",
+                    chunk,
+                ):
+                    loaded[row[0]] = _profile(row)
+        for user_id in missing:
+            profile = loaded.get(user_id)
+            self.profile_cache.put(user_id, profile, token)
+            result[user_id] = profile
+        return result
 
     def upsert_user_profile(
         self, user_id: str, *, budget_tier: str, pace_preference: str, must_avoid: str
@@ -55,6 +127,10 @@ class SQLiteMemoryService:
                 """,
                 (user_id, budget_tier, pace_preference, must_avoid),
             )
+            # Cached plans were keyed on the old profile; drop them in the same transaction.
+            dropped = _drop_cached_plans(conn, "user_id = ?", (user_id,))
+        self.profile_cache.write_through(user_id, _profile((user_id, budget_tier, pace_preference, must_avoid)))
+        self._remove_artifacts(dropped)
 
     def record_itinerary(
         self,
@@ -74,6 +150,13 @@ class SQLiteMemoryService:
                 (user_id, city, start_date, duration_days, artifact_path),
             )
 
+    def record_rubric_scores(self, scores: Iterable[Tuple[str, int, int, bool]]) -> int:
+        """Insert ``(run_id, score, max, passed)`` rows in a single transaction."""
+        rows = [(run_id, score, max_score, int(passed)) for run_id, score, max_score, passed in scores]
+        with self._connection as conn:
+            conn.executemany("INSERT INTO rubric_scores(run_id, score, max, passed) VALUES(?, ?, ?, ?)", rows)
+        return len(rows)
+
     def fetch_last_itineraries(self, user_id: str, limit: int = 5) -> List[Dict[str, str]]:
         with self._connection as conn:
             rows = conn.execute(
@@ -96,3 +179,81 @@ class SQLiteMemoryService:
             for row in rows
         ]
 
+    def fetch_itinerary_page(
+        self, user_id: str, *, limit: int = 20, before_id: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Return one page of history, newest first, and the cursor for the next page.
+
+        Pass the returned cursor as ``before_id`` to continue; it is ``None``
+        on the last page. Each page is a range scan on ``(user_id, id)``, so
+        deep pages cost the same as the first, unlike ``OFFSET``.
+        """
+        with self._connection as conn:
+            rows = conn.execute(
+                """
+                SELECT id, city, start_date, duration_days, artifact_path
+                FROM itineraries
+                WHERE user_id = ? AND id < ?
+                ORDER BY id DESC
+                LIMIT ?
+                """,
+                (user_id, before_id if before_id is not None else _MAX_ROWID, limit + 1),
+            ).fetchall()
+        page = [
+            {
+                "id": row[0],
+                "city": row[1],
+                "start_date": row[2],
+                "duration_days": row[3],
+                "artifact_path": row[4],
+            }
+            for row in rows[:limit]
+        ]
+        next_cursor = page[-1]["id"] if len(rows) > limit else None
+        return page, next_cursor
+
+    def get_cached_plan(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored plan payload for ``cache_key`` unless it has expired."""
+        with self._connection as conn:
+            row = conn.execute(
+                "SELECT payload FROM plan_cache WHERE cache_key = ? AND expires_at > ?",
+                (cache_key, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def store_cached_plan(self, cache_key: str, *, user_id: str, payload: Dict[str, Any], ttl_seconds: float) -> None:
+        """Cache a finished plan; its artifact file is deleted once the entry expires or is invalidated."""
+        now = time.time()
+        with self._connection as conn:
+            conn.execute(
+                """
+                INSERT INTO plan_cache(cache_key, user_id, payload, expires_at)
+                VALUES(?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    user_id=excluded.user_id,
+                    payload=excluded.payload,
+                    expires_at=excluded.expires_at
+                """,
+                (cache_key, user_id, json.dumps(payload, separators=(",", ":")), now + ttl_seconds),
+            )
+            dropped = _drop_cached_plans(conn, "expires_at <= ?", (now,))
+        self._remove_artifacts(dropped)
+
+    def invalidate_cached_plans(self, user_id: Optional[str] = None) -> None:
+        """Drop cached plans (and their artifacts) for ``user_id``, or every cached plan when omitted."""
+        with self._connection as conn:
+            if user_id is None:
+                dropped = _drop_cached_plans(conn, "1", ())
+            else:
+                dropped = _drop_cached_plans(conn, "user_id = ?", (user_id,))
+        self._remove_artifacts(dropped)
+
+    def _remove_artifacts(self, paths: Iterable[str]) -> None:
+        """Delete artifact files that no remaining cached plan points at."""
+        conn = self._connection
+        for path in set(paths):
+            still_cached = conn.execute(
+                "SELECT 1 FROM plan_cache WHERE json_extract(payload, '$.artifact_path') = ? LIMIT 1", (path,)
+            ).fetchone()
+            if still_cached is None:
+                Path(path).unlink(missing_ok=True)
@@ -1,5 +1,30 @@
-"""Orchestration graph exports."""
+"""Orchestration graph exports.
 
-from .graph import OrchestrationGraph
+The graph (and with it every agent and tool) is only imported when first used.
+"""
 
-__all__ = ["OrchestrationGraph"]
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .background import run_blocking
+    from .batch import BatchResult, SharedFetches
+    from .dag import Stage, StageMemo, run_stages
+    from .graph import OrchestrationGraph
+
+_EXPORTS: Dict[str, str] = {
+    "run_blocking": ".background",
+    "BatchResult": ".batch",
+    "SharedFetches": ".batch",
+    "Stage": ".dag",
+    "StageMemo": ".dag",
+    "run_stages": ".dag",
+    "OrchestrationGraph": ".graph",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,66 @@
+"""A long-lived background event loop for the blocking entry points.
+
+``asyncio.run`` builds a fresh loop per call, and with it a fresh async HTTP
+client (clients are per loop) and a fresh ``to_thread`` executor. Running
+every blocking plan on one shared loop keeps pooled connections and worker
+threads alive between plans.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _thread
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="zttp-loop", daemon=True)
+            thread.start()
+            _loop, _thread = loop, thread
+            atexit.register(shutdown)
+        return _loop
+
+
+def run_blocking(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on the shared background loop and wait for its result."""
+    loop = _ensure_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_blocking() cannot be called from the background loop itself; await instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def shutdown() -> None:
+    """Close the loop's HTTP client and executor, then stop the loop thread."""
+    global _loop, _thread
+    with _lock:
+        loop, thread, _loop, _thread = _loop, _thread, None, None
+    if loop is None or loop.is_closed():
+        return
+    atexit.unregister(shutdown)
+    from adk_app.tools.http_client import close_async_http_client
+
+    async def _close() -> None:
+        await close_async_http_client()
+        await loop.shutdown_default_executor()
+
+    asyncio.run_coroutine_threadsafe(_close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join()
+    loop.close()
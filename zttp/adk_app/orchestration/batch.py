@@ -0,0 +1,59 @@
+"""Helpers for planning many requests together."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from adk_app.tools.deadline import DeadlineExceeded, has_time_left
+
+T = TypeVar("T")
+
+
+@dataclass
+class SharedFetches:
+    """Run each keyed fetch once per batch and hand its result to every caller.
+
+    The first caller for a key starts the fetch; later callers await the same
+    task, so a failure reaches all of them. ``asyncio.shield`` keeps one
+    cancelled caller from cancelling the fetch for the rest.
+
+    The fetch runs under the latency budget of the request that started it.
+    If that budget cuts it, callers with time of their own left (or no
+    budget at all) run their own ``fetch`` instead of taking the cut.
+    """
+
+    started: int = field(default=0, init=False)
+    shared: int = field(default=0, init=False)
+    _tasks: Dict[Hashable, "asyncio.Future[Any]"] = field(default_factory=dict, init=False, repr=False)
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        while True:
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = asyncio.ensure_future(fetch())
+                self.started += 1
+            else:
+                self.shared += 1
+            try:
+                return await asyncio.shield(task)
+            except DeadlineExceeded:
+                if not has_time_left():
+                    raise
+                if self._tasks.get(key) is task:
+                    del self._tasks[key]
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one request in a batch, in the position it was submitted."""
+
+    index: int
+    request: Dict[str, Any]
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -0,0 +1,112 @@
+"""Dependency-driven stage executor used by the orchestration graph."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class Stage:
+    """A named unit of work that runs once all of its dependencies have finished.
+
+    ``func`` receives a mapping of every finished stage name to its output.
+    Coroutine functions are awaited on the loop; plain functions run in a
+    worker thread so blocking I/O does not hold up sibling stages. ``params``
+    holds any inputs that do not come from ``deps``; together they form the
+    stage's memo key.
+    """
+
+    name: str
+    func: Callable[[Dict[str, Any]], Any]
+    deps: Tuple[str, ...] = ()
+    params: Hashable = ()
+
+
+@dataclass
+class StageMemo:
+    """Stage outputs keyed by stage name, params and the keys of its dependencies.
+
+    Keys are built recursively, so a stage is only re-run when its own
+    params or something upstream of it changed. Reuse a memo across
+    :func:`run_stages` calls within one run to skip unchanged work.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    _outputs: Dict[Hashable, Any] = field(default_factory=dict, repr=False)
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        if key in self._outputs:
+            self.hits += 1
+            return True, self._outputs[key]
+        self.misses += 1
+        return False, None
+
+    def store(self, key: Hashable, output: Any) -> None:
+        self._outputs[key] = output
+
+
+def _validate(stages: Sequence[Stage]) -> None:
+    names = [stage.name for stage in stages]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate stage names: {names}")
+    known = set(names)
+    for stage in stages:
+        missing = set(stage.deps) - known
+        if missing:
+            raise ValueError(f"Stage {stage.name!r} depends on unknown stages {sorted(missing)}")
+    remaining = {stage.name: set(stage.deps) for stage in stages}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Stage dependencies form a cycle: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+async def run_stages(stages: Sequence[Stage], memo: Optional[StageMemo] = None) -> Dict[str, Any]:
+    """Run ``stages`` concurrently, respecting dependencies, and return their outputs.
+
+    Independent stages overlap, so wall time tracks the slowest dependency
+    chain rather than the sum of all stages. With ``memo``, stages whose key
+    is already known return the stored output without running. The first
+    failure cancels any stages still pending and is re-raised.
+    """
+    _validate(stages)
+    results: Dict[str, Any] = {}
+    keys: Dict[str, Hashable] = {}
+    tasks: Dict[str, "asyncio.Task[Any]"] = {}
+
+    async def _run(stage: Stage) -> Any:
+        if stage.deps:
+            await asyncio.gather(*(tasks[dep] for dep in stage.deps))
+        key = keys[stage.name] = (stage.name, stage.params, tuple(keys[dep] for dep in stage.deps))
+        if memo is not None:
+            hit, output = memo.lookup(key)
+            if hit:
+                results[stage.name] = output
+                return output
+        if inspect.iscoroutinefunction(stage.func):
+            output = await stage.func(results)
+        else:
+            output = await asyncio.to_thread(stage.func, results)
+        if memo is not None:
+            memo.store(key, output)
+        results[stage.name] = output
+        return output
+
+    for stage in stages:
+        tasks[stage.name] = asyncio.ensure_future(_run(stage))
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return results
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass
 from datetime import date
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, TypeVar
 
 from adk_app.agents import evaluator
 from adk_app.agents.checklist import ChecklistAgent
@@ -14,8 +16,75 @@ from adk_app.agents.presenter import PresenterAgent
 from adk_app.agents.researcher import ResearcherAgent
 from adk_app.agents.scheduler import SchedulerAgent
 from adk_app.memory.sqlite_memory import SQLiteMemoryService
+from adk_app.orchestration.background import run_blocking
+from adk_app.orchestration.batch import BatchResult, SharedFetches
+from adk_app.orchestration.dag import Stage, StageMemo, run_stages
 from adk_app.telemetry.logger import TelemetryLogger
-from adk_app.tools.weather import weather_forecast
+from adk_app.tools.cache import get_response_cache, make_key
+from adk_app.tools.deadline import Deadline, DeadlineExceeded, deadline_scope
+from adk_app.tools.weather import forecast_by_date, weather_range_async
+
+T = TypeVar("T")
+
+# Failing rubric rule -> planning knob that can fix it on a re-plan.
+REPLAN_FIXES: Dict[str, str] = {
+    "covers_3_pois": "widen_research",
+    "weather_aware": "weather_from_stops",
+    "has_two_meals": "include_meals",
+    "no_duplicates": "dedupe",
+}
+
+
+async def _within(deadline: Optional[Deadline], awaitable: Awaitable[T], what: str) -> T:
+    if deadline is None:
+        return await awaitable
+    # A little grace lets the HTTP client raise its own, more specific cut first.
+    return await deadline.bound(awaitable, what, grace=0.05)
+
+
+async def _fetch_once(
+    shared: Optional[SharedFetches],
+    key: Hashable,
+    fetch: Callable[[], Awaitable[T]],
+    deadline: Optional[Deadline],
+    what: str,
+) -> T:
+    if shared is None:
+        return await fetch()
+    # The shared fetch may belong to a request with a longer budget (or none),
+    # so each request bounds its own wait for it.
+    return await _within(deadline, shared.get(key, fetch), what)
+
+
+def _slug(text: str) -> str:
+    return "".join(char if char.isalnum() or char in "-_" else "_" for char in text)
+
+
+def _note_cut(cut: Optional[List[str]], stage: str) -> None:
+    if cut is not None and stage not in cut:
+        cut.append(stage)
+
+
+def _centroid(pois: Sequence[Dict[str, Any]]) -> Optional[Dict[str, float]]:
+    located = [poi for poi in pois if poi.get("lat") is not None and poi.get("lon") is not None]
+    if not located:
+        return None
+    return {
+        "lat": round(sum(poi["lat"] for poi in located) / len(located), 4),
+        "lon": round(sum(poi["lon"] for poi in located) / len(located), 4),
+    }
+
+
+def _weather_note(daily: Dict[str, Any]) -> str:
+    """Summarise the whole trip: wettest day and the overall temperature range."""
+
+    def values(name: str) -> List[float]:
+        return [value for value in daily.get(name) or [] if value is not None]
+
+    precipitation = max(values("precipitation_probability_max"), default=0)
+    low = min(values("temperature_2m_min"), default=None)
+    high = max(values("temperature_2m_max"), default=None)
+    return f"Chance of precipitation: {precipitation}% | Temps: {low}°C – {high}°C"
 
 
 @dataclass
@@ -27,8 +96,182 @@ class OrchestrationGraph:
     presenter: PresenterAgent
     memory: SQLiteMemoryService
     telemetry: TelemetryLogger
+    max_replans: int = 2
+    replan_budget_ms: float = 3000.0
+    latency_budget_ms: Optional[float] = None
+    hedge_after_ms: Optional[float] = None
 
-    def run(
+    def _stages(
+        self,
+        *,
+        run_id: str,
+        user_id: str,
+        city: str,
+        start_date: date,
+        duration_days: int,
+        pace: str,
+        weather_coordinates: Optional[Dict[str, float]],
+        budget: str,
+        shared: Optional[SharedFetches] = None,
+        profile: Optional[Dict[str, Any]] = None,
+        widen_research: bool = False,
+        weather_from_stops: bool = False,
+        include_meals: bool = False,
+        dedupe: bool = False,
+        present: bool = True,
+        deadline: Optional[Deadline] = None,
+        cut: Optional[List[str]] = None,
+        artifact_tag: str = "",
+    ) -> List[Stage]:
+        """Describe the pipeline as stages with explicit dependencies.
+
+        Research and weather only need the request (plus the profile for the
+        research focus), so they run side by side; scheduling waits for
+        research, and the checklist joins both branches. With ``shared``,
+        research and weather fetches are deduplicated across a batch.
+
+        The keyword flags are the re-plan knobs from :data:`REPLAN_FIXES`;
+        each is part of the affected stage's params so a :class:`StageMemo`
+        only re-runs what a knob actually changes.
+
+        Under a ``deadline``, research and weather that run out of time fall
+        back to what arrived (possibly nothing) instead of failing the plan;
+        the names of those stages are appended to ``cut``.
+        """
+        research_limit = self.researcher.max_results * 2 if widen_research else self.researcher.max_results
+
+        def load_profile(_: Dict[str, Any]) -> Dict[str, Any]:
+            if profile is not None:
+                return profile
+            return self.memory.get_user_profile(user_id) or {}
+
+        def skeleton(results: Dict[str, Any]) -> Dict[str, Any]:
+            merged_pace = results["profile"].get("pace_preference", pace)
+            return self.planner.plan(city=city, travel_date=start_date, duration_days=duration_days, pace=merged_pace)
+
+        async def research(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+            focus = None if widen_research else results["profile"].get("must_avoid")
+            try:
+                with self.telemetry.span(run_id=run_id, agent="researcher", tool="wiki"):
+                    payload = await _fetch_once(
+                        shared,
+                        ("research", city, focus, research_limit),
+                        lambda: self.researcher.research(
+                            city=city, focus=focus, limit=research_limit, deadline=deadline
+                        ),
+                        deadline,
+                        "research",
+                    )
+            except DeadlineExceeded as exc:
+                # The span above already recorded the cut as its error.
+                _note_cut(cut, "research")
+                payload = exc.partial or {}
+            return payload.get("pois", [])
+
+        async def weather(results: Dict[str, Any]) -> Dict[str, Any]:
+            weather_note: Optional[str] = None
+            weather_data: Dict[str, Any] | None = None
+            coordinates = weather_coordinates
+            if not coordinates and weather_from_stops:
+                coordinates = _centroid(results["research"])
+            if coordinates:
+                lat = coordinates.get("lat")
+                lon = coordinates.get("lon")
+                if lat is not None and lon is not None:
+                    # One request covers every day of the trip.
+                    try:
+                        with self.telemetry.span(run_id=run_id, agent="weather", tool="open-meteo"):
+                            forecasts = await _fetch_once(
+                                shared,
+                                ("weather", lat, lon, start_date.isoformat(), duration_days),
+                                lambda: _within(
+                                    deadline,
+                                    weather_range_async([(lat, lon)], start_date.isoformat(), duration_days),
+                                    "weather_range",
+                                ),
+                                deadline,
+                                "weather_range",
+                            )
+                    except DeadlineExceeded:
+                        _note_cut(cut, "weather")
+                        forecasts = None
+                    # Empty when the whole trip lies beyond the forecast horizon.
+                    weather_data = forecasts[0] if forecasts and forecasts[0] else None
+                    if weather_data is not None:
+                        weather_note = _weather_note(weather_data)
+            return {"note": weather_note, "data": weather_data, "by_date": forecast_by_date(weather_data)}
+
+        def schedule(results: Dict[str, Any]) -> Dict[str, Any]:
+            with self.telemetry.span(run_id=run_id, agent="scheduler", tool="route-solver"):
+                payload = self.scheduler.schedule(
+                    skeleton=results["skeleton"],
+                    pois=results["research"],
+                    weather=results["weather"]["by_date"],
+                    dedupe=dedupe,
+                    include_meals=include_meals,
+                )
+            for route in payload.get("routes", []):
+                for name in ("distance_km", "solve_ms"):
+                    self.telemetry.metric(run_id=run_id, agent="scheduler", name=f"route_{name}", value=route[name])
+            return payload
+
+        def checklist(results: Dict[str, Any]) -> Dict[str, Any]:
+            return self.checklist.build(schedule=results["schedule"]["schedule"], weather=results["weather"]["data"])
+
+        def evaluate(results: Dict[str, Any]) -> Dict[str, Any]:
+            plan = {
+                "schedule": results["schedule"]["schedule"],
+                "stops": results["schedule"]["stops"],
+                "weather_note": results["weather"]["note"],
+                "budget": budget,
+                "checklist": results["checklist"],
+            }
+            evaluation = evaluator.evaluate(plan)
+            with self.telemetry.span(run_id=run_id, agent="evaluator", tool="rule-rubric"):
+                passed = evaluation.passed
+            return {"plan": plan, "evaluation": evaluation, "passed": passed}
+
+        def present_plan(results: Dict[str, Any]) -> str:
+            plan = results["evaluate"]["plan"]
+            # ``artifact_tag`` comes from the plan-cache key, so a cached plan's
+            # file is never overwritten by a plan for another pace, budget or
+            # profile; the memory service deletes it with the cache entry. Plans
+            # that are never cached (cut ones) share one file per user and trip.
+            stem = f"{start_date.isoformat()}_{city.replace(' ', '_').lower()}_{_slug(user_id)}"
+            filename = f"{stem}_{artifact_tag}.md" if artifact_tag and not cut else f"{stem}.md"
+            with self.telemetry.span(run_id=run_id, agent="presenter", tool="md_export"):
+                artifact_path = self.presenter.present(
+                    filename=filename,
+                    schedule=plan["schedule"],
+                    stops=plan["stops"],
+                    checklist=plan["checklist"],
+                    weather_note=plan["weather_note"],
+                )
+            evaluation = results["evaluate"]["evaluation"]
+            self.memory.record_rubric_scores([(run_id, evaluation.score, evaluation.max, evaluation.passed)])
+            self.memory.record_itinerary(
+                user_id=user_id,
+                city=city,
+                start_date=start_date.isoformat(),
+                duration_days=duration_days,
+                artifact_path=artifact_path,
+            )
+            return artifact_path
+
+        stages = [
+            Stage("profile", load_profile),
+            Stage("skeleton", skeleton, deps=("profile",)),
+            Stage("research", research, deps=("profile",), params=(widen_research, research_limit)),
+            Stage("weather", weather, deps=("research",) if weather_from_stops else (), params=weather_from_stops),
+            Stage("schedule", schedule, deps=("skeleton", "research", "weather"), params=(include_meals, dedupe)),
+            Stage("checklist", checklist, deps=("schedule", "weather")),
+            Stage("evaluate", evaluate, deps=("schedule", "weather", "checklist")),
+        ]
+        if present:
+            stages.append(Stage("present", present_plan, deps=("evaluate",)))
+        return stages
+
+    async def run_async(
         self,
         *,
         user_id: str,
@@ -38,73 +281,213 @@ class OrchestrationGraph:
         pace: str,
         weather_coordinates: Optional[Dict[str, float]] = None,
         budget: str = "mid",
+        shared: Optional[SharedFetches] = None,
+        use_cache: bool = True,
+        latency_budget_ms: Optional[float] = None,
     ) -> Dict[str, Any]:
-        run_id = f"run-{start_date.isoformat()}-{city.replace(' ', '_')}"
-        profile = self.memory.get_user_profile(user_id) or {}
-        merged_pace = profile.get("pace_preference", pace)
-        skeleton = self.planner.plan(city=city, travel_date=start_date, duration_days=duration_days, pace=merged_pace)
-
-        with self.telemetry.span(run_id=run_id, agent="researcher", tool="wiki"):
-            pois_payload = asyncio.run(self.researcher.research(city=city, focus=profile.get("must_avoid")))
-        pois = pois_payload.get("pois", [])
-
-        schedule_payload = self.scheduler.schedule(skeleton=skeleton, pois=pois)
-        schedule = schedule_payload["schedule"]
-        stops = schedule_payload["stops"]
-
-        weather_note: Optional[str] = None
-        weather_data: Dict[str, Any] | None = None
-        if weather_coordinates:
-            lat = weather_coordinates.get("lat")
-            lon = weather_coordinates.get("lon")
-            if lat is not None and lon is not None:
-                with self.telemetry.span(run_id=run_id, agent="weather", tool="open-meteo"):
-                    weather_data = weather_forecast(lat, lon, start_date.isoformat())
-                precip_values = weather_data.get("precipitation_probability_max", [0]) if weather_data else [0]
-                temp_high = weather_data.get("temperature_2m_max", [None])[0] if weather_data else None
-                temp_low = weather_data.get("temperature_2m_min", [None])[0] if weather_data else None
-                weather_note = (
-                    f"Chance of precipitation: {max(precip_values)}% | Temps: {temp_low}°C – {temp_high}°C"
-                )
+        """Build a plan on the caller's event loop.
 
-        checklist_payload = self.checklist.build(schedule=schedule, weather=weather_data)
+        Network calls use the async HTTP client; only SQLite and file writes
+        are pushed to worker threads, so many plans can share one loop.
 
-        plan = {
-            "schedule": schedule,
-            "stops": stops,
-            "weather_note": weather_note,
-            "budget": budget,
-            "checklist": checklist_payload,
-        }
+        When rubric rules fail, the plan is rebuilt with the knobs from
+        :data:`REPLAN_FIXES` switched on, up to ``max_replans`` times or until
+        ``replan_budget_ms`` has elapsed. Stage outputs are memoized for the
+        whole run, so a re-plan only re-runs stages whose inputs changed.
+        The artifact is written once, for the final plan.
+
+        Finished plans are cached in the memory database, keyed on the
+        request and the user's profile, for as long as the research and
+        weather responses behind them stay fresh. A hit skips every stage as
+        long as the artifact is still on disk; pass ``use_cache=False`` (or
+        bypass the response cache) to force a rebuild.
 
-        evaluation = evaluator.evaluate(plan)
-        with self.telemetry.span(run_id=run_id, agent="evaluator", tool="rule-rubric"):
-            passed = evaluation.passed
-
-        filename = f"{start_date.isoformat()}_{city.replace(' ', '_').lower()}.md"
-        with self.telemetry.span(run_id=run_id, agent="presenter", tool="md_export"):
-            artifact_path = self.presenter.present(
-                filename=filename,
-                schedule=schedule,
-                stops=stops,
-                checklist=checklist_payload,
-                weather_note=weather_note,
+        ``latency_budget_ms`` (default :attr:`latency_budget_ms`, unbounded
+        when ``None``) sets a deadline for the whole run. Every HTTP request
+        is bounded by what is left of it and straggling requests are hedged
+        after :attr:`hedge_after_ms`. Once it passes, outstanding fetches are
+        cancelled and the plan is finished from whatever arrived; the cut
+        stages are listed under ``"cut"`` and such plans are not cached.
+        """
+        budget_ms = self.latency_budget_ms if latency_budget_ms is None else latency_budget_ms
+        deadline = None if budget_ms is None else Deadline.within(budget_ms, hedge_after_ms=self.hedge_after_ms)
+        with deadline_scope(deadline):
+            result = await self._plan(
+                user_id=user_id,
+                city=city,
+                start_date=start_date,
+                duration_days=duration_days,
+                pace=pace,
+                weather_coordinates=weather_coordinates,
+                budget=budget,
+                shared=shared,
+                use_cache=use_cache,
+                deadline=deadline,
             )
+        if deadline is not None and (deadline.cut or deadline.hedged):
+            for name, value in (("cut_calls", len(deadline.cut)), ("hedged_requests", deadline.hedged)):
+                self.telemetry.metric(run_id=result["run_id"], agent="orchestrator", name=name, value=value)
+        return result
 
-        self.memory.record_itinerary(
-            user_id=user_id,
-            city=city,
-            start_date=start_date.isoformat(),
-            duration_days=duration_days,
-            artifact_path=artifact_path,
+    async def _plan(
+        self,
+        *,
+        user_id: str,
+        city: str,
+        start_date: date,
+        duration_days: int,
+        pace: str,
+        weather_coordinates: Optional[Dict[str, float]],
+        budget: str,
+        shared: Optional[SharedFetches],
+        use_cache: bool,
+        deadline: Optional[Deadline],
+    ) -> Dict[str, Any]:
+        # Per user: batch runs for the same city and date must not share spans or scores.
+        run_id = f"run-{user_id}-{start_date.isoformat()}-{city.replace(' ', '_')}"
+        profile = await asyncio.to_thread(self.memory.get_user_profile, user_id) or {}
+        response_cache = get_response_cache()
+        use_cache = use_cache and not response_cache.bypass
+        cache_key = make_key(
+            "plan",
+            {
+                "user_id": user_id,
+                "city": city,
+                "start_date": start_date.isoformat(),
+                "duration_days": duration_days,
+                "pace": pace,
+                "weather_coordinates": weather_coordinates,
+                "budget": budget,
+                "profile": profile,
+            },
         )
+        if use_cache:
+            cached = await asyncio.to_thread(self.memory.get_cached_plan, cache_key)
+            if cached is not None and Path(cached["artifact_path"]).is_file():
+                cached["evaluation"] = evaluator.EvaluationResult(**cached["evaluation"])
+                return {**cached, "cached": True}
 
-        return {
+        replan_deadline = time.perf_counter() + self.replan_budget_ms / 1000.0
+        memo = StageMemo()
+        knobs: Dict[str, bool] = {}
+        replans = 0
+        cut: List[str] = []
+
+        def stages(*, present: bool) -> List[Stage]:
+            return self._stages(
+                run_id=run_id,
+                user_id=user_id,
+                city=city,
+                start_date=start_date,
+                duration_days=duration_days,
+                pace=pace,
+                weather_coordinates=weather_coordinates,
+                budget=budget,
+                shared=shared,
+                profile=profile,
+                present=present,
+                deadline=deadline,
+                cut=cut,
+                artifact_tag=cache_key[:10] if use_cache else "",
+                **knobs,
+            )
+
+        results = await run_stages(stages(present=False), memo=memo)
+        # Re-planning only helps while there is time left to fetch more.
+        while replans < self.max_replans and time.perf_counter() < replan_deadline and not cut:
+            rules = results["evaluate"]["evaluation"].rules
+            fixes = {REPLAN_FIXES[rule] for rule, ok in rules.items() if not ok and rule in REPLAN_FIXES}
+            if weather_coordinates:
+                fixes.discard("weather_from_stops")
+            fixes.difference_update(knobs)
+            if not fixes:
+                break
+            knobs.update(dict.fromkeys(fixes, True))
+            replans += 1
+            with self.telemetry.span(run_id=run_id, agent="evaluator", tool="replan"):
+                results = await run_stages(stages(present=False), memo=memo)
+
+        results = await run_stages(stages(present=True), memo=memo)
+        evaluated = results["evaluate"]
+
+        result = {
             "run_id": run_id,
-            "plan": plan,
-            "evaluation": evaluation,
-            "artifact_path": artifact_path,
-            "profile": profile,
-            "passed": passed,
+            "plan": evaluated["plan"],
+            "evaluation": evaluated["evaluation"],
+            "artifact_path": results["present"],
+            "profile": results["profile"],
+            "passed": evaluated["passed"],
+            "replans": replans,
+            "cut": cut,
         }
+        if use_cache and not cut:
+            ttl = min(response_cache.ttl_for("wiki_search_extracts"), response_cache.ttl_for("weather_range"))
+            await asyncio.to_thread(
+                self.memory.store_cached_plan,
+                cache_key,
+                user_id=user_id,
+                payload={**result, "evaluation": asdict(evaluated["evaluation"])},
+                ttl_seconds=ttl,
+            )
+        return {**result, "cached": False}
 
+    async def run_batch_async(
+        self, requests: Sequence[Dict[str, Any]], *, max_workers: int = 8
+    ) -> List[BatchResult]:
+        """Plan many requests, fetching research/weather once per distinct input.
+
+        Requests for the same city and focus share one research call, and
+        requests for the same coordinates and date share one forecast; the
+        per-user stages still run for each request, with every profile
+        loaded up front in one query. At most ``max_workers`` plans are in
+        flight. Results come back in input order, with failures captured per
+        request instead of aborting the batch.
+        """
+        shared = SharedFetches()
+        semaphore = asyncio.Semaphore(max_workers)
+        # One IN query warms the profile cache, so each plan's lookup is a memory hit.
+        user_ids = [request["user_id"] for request in requests if "user_id" in request]
+        await asyncio.to_thread(self.memory.get_user_profiles, user_ids)
+
+        async def _one(index: int, request: Dict[str, Any]) -> BatchResult:
+            async with semaphore:
+                try:
+                    result = await self.run_async(**request, shared=shared)
+                except Exception as exc:
+                    return BatchResult(index=index, request=request, error=exc)
+                return BatchResult(index=index, request=request, result=result)
+
+        return list(await asyncio.gather(*(_one(i, request) for i, request in enumerate(requests))))
+
+    def run(
+        self,
+        *,
+        user_id: str,
+        city: str,
+        start_date: date,
+        duration_days: int,
+        pace: str,
+        weather_coordinates: Optional[Dict[str, float]] = None,
+        budget: str = "mid",
+        use_cache: bool = True,
+        latency_budget_ms: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Blocking wrapper around :meth:`run_async` for callers without a loop.
+
+        Plans run on a shared background loop (see
+        :mod:`adk_app.orchestration.background`), so the async HTTP client
+        and its pooled connections are reused from one call to the next.
+        """
+        return run_blocking(
+            self.run_async(
+                user_id=user_id,
+                city=city,
+                start_date=start_date,
+                duration_days=duration_days,
+                pace=pace,
+                weather_coordinates=weather_coordinates,
+                budget=budget,
+                use_cache=use_cache,
+                latency_budget_ms=latency_budget_ms,
+            )
+        )
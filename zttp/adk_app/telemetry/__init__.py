@@ -1,5 +1,27 @@
-"""Telemetry helpers."""
+"""Telemetry helpers.
 
-from .logger import TelemetryLogger
+Loaded on first access, so the report CLI does not import the writer thread machinery.
+"""
 
-__all__ = ["TelemetryLogger"]
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .aggregate import AgentToolStats, LatencyHistogram, aggregate
+    from .logger import TelemetryLogger
+    from .query import fetch_spans
+
+_EXPORTS: Dict[str, str] = {
+    "AgentToolStats": ".aggregate",
+    "LatencyHistogram": ".aggregate",
+    "aggregate": ".aggregate",
+    "TelemetryLogger": ".logger",
+    "fetch_spans": ".query",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
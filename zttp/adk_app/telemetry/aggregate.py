@@ -0,0 +1,187 @@
+"""Incrementally maintained latency rollups over the ``telemetry`` table."""
+
+from __future__ import annotations
+
+import json
+import math
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Histogram buckets grow by 2**(1/8), so percentile estimates are within ~9%.
+BUCKET_BASE = 2 ** 0.125
+# Rollups are kept per (minute, agent, tool); queries merge the minutes in range.
+ROLLUP_SECONDS = 60
+
+RollupKey = Tuple[int, str, str]
+
+
+def bucket_index(latency_ms: float) -> int:
+    if latency_ms <= 0:
+        return 0
+    return max(1, math.ceil(math.log(latency_ms, BUCKET_BASE) - 1e-9) + 1)
+
+
+def bucket_upper_bound(index: int) -> float:
+    return 0.0 if index <= 0 else BUCKET_BASE ** (index - 1)
+
+
+@dataclass
+class LatencyHistogram:
+    """Log-bucketed latency histogram that can be merged across time and processes."""
+
+    counts: Dict[int, int] = field(default_factory=dict)
+
+    def add(self, latency_ms: float, count: int = 1) -> None:
+        index = bucket_index(latency_ms)
+        self.counts[index] = self.counts.get(index, 0) + count
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the ``q``-th percentile (0-100)."""
+        total = self.total
+        if total == 0:
+            return None
+        rank = max(1, math.ceil(total * q / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return bucket_upper_bound(index)
+        return bucket_upper_bound(max(self.counts))
+
+    def to_json(self) -> str:
+        return json.dumps({str(k): v for k, v in sorted(self.counts.items())}, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, payload: str) -> "LatencyHistogram":
+        return cls({int(k): int(v) for k, v in json.loads(payload).items()})
+
+
+@dataclass
+class Rollup:
+    calls: int = 0
+    errors: int = 0
+    total_ms: int = 0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def add(self, latency_ms: int, error: Optional[str]) -> None:
+        self.calls += 1
+        self.errors += int(bool(error))
+        self.total_ms += latency_ms
+        self.histogram.add(latency_ms)
+
+    def merge(self, other: "Rollup") -> None:
+        self.calls += other.calls
+        self.errors += other.errors
+        self.total_ms += other.total_ms
+        self.histogram.merge(other.histogram)
+
+
+def rollup_spans(rows: Iterable[Sequence[object]]) -> Dict[RollupKey, Rollup]:
+    """Group span rows ``(run_id, agent, tool, start_ts, end_ts, latency_ms, error)``."""
+    rollups: Dict[RollupKey, Rollup] = {}
+    for _, agent, tool, start_ts, _, latency_ms, error in rows:
+        bucket = int(float(start_ts)) // ROLLUP_SECONDS * ROLLUP_SECONDS
+        key = (bucket, str(agent), str(tool))
+        rollup = rollups.get(key)
+        if rollup is None:
+            rollup = rollups[key] = Rollup()
+        rollup.add(int(latency_ms), error)  # type: ignore[arg-type]
+    return rollups
+
+
+def merge_rollups(conn: sqlite3.Connection, rollups: Dict[RollupKey, Rollup]) -> None:
+    """Fold ``rollups`` into ``telemetry_rollups`` inside the caller's transaction."""
+    for key, rollup in rollups.items():
+        row = conn.execute(
+            """
+            SELECT calls, errors, total_ms, histogram FROM telemetry_rollups
+            WHERE bucket_start = ? AND agent = ? AND tool = ?
+            """,
+            key,
+        ).fetchone()
+        if row is not None:
+            rollup.merge(Rollup(row[0], row[1], row[2], LatencyHistogram.from_json(row[3])))
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO telemetry_rollups(bucket_start, agent, tool, calls, errors, total_ms, histogram)
+            VALUES(?, ?, ?, ?, ?, ?, ?)
+            """,
+            (*key, rollup.calls, rollup.errors, rollup.total_ms, rollup.histogram.to_json()),
+        )
+
+
+def rebuild_rollups(conn: sqlite3.Connection, batch_size: int = 50_000) -> int:
+    """Recompute every rollup from the raw ``telemetry`` table; returns spans read."""
+    conn.execute("DELETE FROM telemetry_rollups")
+    cursor = conn.execute("SELECT run_id, agent, tool, start_ts, end_ts, latency_ms, error FROM telemetry")
+    seen = 0
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return seen
+        seen += len(rows)
+        merge_rollups(conn, rollup_spans(rows))
+
+
+@dataclass
+class AgentToolStats:
+    agent: str
+    tool: str
+    calls: int
+    errors: int
+    total_ms: int
+    p50_ms: Optional[float]
+    p90_ms: Optional[float]
+    p99_ms: Optional[float]
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.calls if self.calls else 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+def aggregate(conn: sqlite3.Connection, *, since: float, until: float) -> List[AgentToolStats]:
+    """Latency percentiles, error rate and call counts per (agent, tool) in ``[since, until)``.
+
+    Only the per-minute rollups are read, so the cost depends on the window
+    length rather than the number of recorded spans. Stats are sorted by
+    total time spent, the biggest contributor first.
+    """
+    start_bucket = int(since) // ROLLUP_SECONDS * ROLLUP_SECONDS
+    rows = conn.execute(
+        """
+        SELECT agent, tool, calls, errors, total_ms, histogram FROM telemetry_rollups
+        WHERE bucket_start >= ? AND bucket_start < ?
+        """,
+        (start_bucket, until),
+    ).fetchall()
+    merged: Dict[Tuple[str, str], Rollup] = {}
+    for agent, tool, calls, errors, total_ms, histogram in rows:
+        rollup = merged.setdefault((agent, tool), Rollup())
+        rollup.merge(Rollup(calls, errors, total_ms, LatencyHistogram.from_json(histogram)))
+    stats = [
+        AgentToolStats(
+            agent=agent,
+            tool=tool,
+            calls=rollup.calls,
+            errors=rollup.errors,
+            total_ms=rollup.total_ms,
+            p50_ms=rollup.histogram.percentile(50),
+            p90_ms=rollup.histogram.percentile(90),
+            p99_ms=rollup.histogram.percentile(99),
+        )
+        for (agent, tool), rollup in merged.items()
+    ]
+    return sorted(stats, key=lambda item: item.total_ms, reverse=True)
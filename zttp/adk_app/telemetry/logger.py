@@ -2,23 +2,163 @@
 
 from __future__ import annotations
 
+import atexit
 import contextlib
-import sqlite3
+import queue
+import threading
 import time
 import uuid
-from dataclasses import dataclass
-from typing import Iterator, Optional
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple
+
+from adk_app.memory.connection import SQLiteConnectionManager
+
+from .aggregate import merge_rollups, rollup_spans
+
+SpanRow = Tuple[str, str, str, float, float, int, Optional[str]]
+MetricRow = Tuple[str, str, str, float, float]
+# Queue items are ("span", SpanRow) or ("metric", MetricRow).
+Record = Tuple[str, Any]
+
+_STOP = object()
 
 
 @dataclass
 class TelemetryLogger:
+    """Record spans through an in-memory buffer drained by a background writer.
+
+    ``span`` only timestamps and enqueues a row; a daemon thread inserts rows
+    with ``executemany`` once ``batch_size`` rows are waiting or
+    ``flush_interval`` seconds have passed. When ``max_buffer`` rows are
+    pending, ``overflow="drop"`` discards new spans (counted in ``dropped``)
+    while ``overflow="block"`` applies backpressure to the caller. Pending
+    rows are flushed by :meth:`flush`, :meth:`close` and at interpreter exit.
+    :meth:`metric` records named numeric values (e.g. solver output) through
+    the same buffer into ``telemetry_metrics``. Each batch also updates the
+    per-minute ``telemetry_rollups`` in the same transaction, which is what
+    :mod:`adk_app.telemetry.aggregate` queries.
+    """
+
     db_path: str
+    batch_size: int = 256
+    flush_interval: float = 0.25
+    max_buffer: int = 10_000
+    overflow: str = "drop"
+    dropped: int = field(default=0, init=False)
+    written: int = field(default=0, init=False)
+    write_errors: int = field(default=0, init=False)
+    last_error: Optional[str] = field(default=None, init=False)
+    _queue: "queue.Queue[Any]" = field(init=False, repr=False)
+    _thread: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.overflow not in {"drop", "block"}:
+            raise ValueError(f"overflow must be 'drop' or 'block', got {self.overflow!r}")
+        self._queue = queue.Queue(maxsize=self.max_buffer)
+
+    def _ensure_writer(self) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    thread = threading.Thread(target=self._drain, name="telemetry-writer", daemon=True)
+                    thread.start()
+                    atexit.register(self.close)
+                    self._thread = thread
+
+    def _enqueue(self, record: Record) -> None:
+        self._ensure_writer()
+        if self.overflow == "block":
+            self._queue.put(record)
+            return
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def _write(self, connections: SQLiteConnectionManager, batch: List[Record]) -> None:
+        spans = [row for kind, row in batch if kind == "span"]
+        metrics = [row for kind, row in batch if kind == "metric"]
+        try:
+            with connections.connection() as conn:
+                if spans:
+                    conn.executemany(
+                        """
+                        INSERT INTO telemetry(run_id, agent, tool, start_ts, end_ts, latency_ms, error)
+                        VALUES(?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        spans,
+                    )
+                    merge_rollups(conn, rollup_spans(spans))
+                if metrics:
+                    conn.executemany(
+                        "INSERT INTO telemetry_metrics(run_id, agent, name, value, ts) VALUES(?, ?, ?, ?, ?)",
+                        metrics,
+                    )
+            self.written += len(batch)
+        except Exception as exc:  # keep the writer alive; surface via counters
+            self.write_errors += len(batch)
+            self.last_error = str(exc)
+        batch.clear()
+
+    def _drain(self) -> None:
+        connections = SQLiteConnectionManager(self.db_path)
+        batch: List[Record] = []
+        deadline = 0.0
+        try:
+            while True:
+                timeout = self.flush_interval if not batch else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+                if item is None:
+                    if batch:
+                        self._write(connections, batch)
+                elif item is _STOP:
+                    if batch:
+                        self._write(connections, batch)
+                    return
+                elif isinstance(item, threading.Event):
+                    if batch:
+                        self._write(connections, batch)
+                    item.set()
+                else:
+                    if not batch:
+                        deadline = time.monotonic() + self.flush_interval
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        self._write(connections, batch)
+        finally:
+            connections.close()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every span recorded so far is written; False on timeout."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        """Flush pending spans and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        atexit.unregister(self.close)
+        if thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join()
 
     @contextlib.contextmanager
     def span(self, *, run_id: Optional[str], agent: str, tool: str) -> Iterator[None]:
         if run_id is None:
             run_id = str(uuid.uuid4())
         start = time.time()
+        started = time.perf_counter()
         error: Optional[str] = None
         try:
             yield
@@ -26,14 +166,9 @@ class TelemetryLogger:
             error = str(exc)
             raise
         finally:
-            end = time.time()
-            latency_ms = int((end - start) * 1000)
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO telemetry(run_id, agent, tool, start_ts, end_ts, latency_ms, error)
-                    VALUES(?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (run_id, agent, tool, start, end, latency_ms, error),
-                )
+            latency_ms = int((time.perf_counter() - started) * 1000)
+            self._enqueue(("span", (run_id, agent, tool, start, time.time(), latency_ms, error)))
 
+    def metric(self, *, run_id: Optional[str], agent: str, name: str, value: float) -> None:
+        """Record a named numeric measurement alongside the run's spans."""
+        self._enqueue(("metric", (run_id or str(uuid.uuid4()), agent, name, float(value), time.time())))
@@ -0,0 +1,48 @@
+"""Keyset-paginated reads over raw telemetry spans."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+SpanCursor = Tuple[float, int]
+
+_COLUMNS = ("id", "run_id", "agent", "tool", "start_ts", "end_ts", "latency_ms", "error")
+
+
+def fetch_spans(
+    conn: sqlite3.Connection,
+    *,
+    run_id: Optional[str] = None,
+    agent: Optional[str] = None,
+    tool: Optional[str] = None,
+    since: Optional[float] = None,
+    after: Optional[SpanCursor] = None,
+    limit: int = 100,
+) -> Tuple[List[Dict[str, Any]], Optional[SpanCursor]]:
+    """Return spans ordered by ``(start_ts, id)`` and the cursor for the next page.
+
+    Filter by ``run_id`` (served by ``idx_telemetry_run_id``) or by
+    ``agent``/``tool``/``since`` (served by ``idx_telemetry_agent_tool_start``).
+    Pass the returned cursor back as ``after``; it is ``None`` on the last page.
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    for column, value in (("run_id", run_id), ("agent", agent), ("tool", tool)):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    if since is not None:
+        clauses.append("start_ts >= ?")
+        params.append(since)
+    if after is not None:
+        clauses.append("(start_ts, id) > (?, ?)")
+        params.extend(after)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    rows = conn.execute(
+        f"SELECT {', '.join(_COLUMNS)} FROM telemetry {where} ORDER BY start_ts, id LIMIT ?",
+        (*params, limit + 1),
+    ).fetchall()
+    page = [dict(zip(_COLUMNS, row)) for row in rows[:limit]]
+    next_cursor = (page[-1]["start_ts"], page[-1]["id"]) if len(rows) > limit else None
+    return page, next_cursor
@@ -0,0 +1,66 @@
+"""Command-line latency report built from the telemetry rollups.
+
+Usage (from the ``zttp`` directory)::
+
+    python -m adk_app.telemetry.report --window 24h
+    python -m adk_app.telemetry.report --db db/zttp.sqlite --window 7d --rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from .aggregate import AgentToolStats, aggregate, rebuild_rollups
+
+DEFAULT_DB = Path(__file__).resolve().parents[2] / "db" / "zttp.sqlite"
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_window(value: str) -> float:
+    """Parse ``90``, ``15m``, ``24h`` or ``7d`` into seconds."""
+    value = value.strip().lower()
+    if value and value[-1] in _UNITS:
+        return float(value[:-1]) * _UNITS[value[-1]]
+    return float(value)
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.0f}"
+
+
+def format_report(stats: List[AgentToolStats]) -> str:
+    if not stats:
+        return "No telemetry in the selected window."
+    grand_total = sum(item.total_ms for item in stats) or 1
+    header = f"{'agent':<12} {'tool':<16} {'calls':>7} {'err%':>6} {'p50ms':>7} {'p90ms':>7} {'p99ms':>7} {'share':>6}"
+    lines = [header, "-" * len(header)]
+    for item in stats:
+        lines.append(
+            f"{item.agent:<12} {item.tool:<16} {item.calls:>7} {item.error_rate * 100:>5.1f}% "
+            f"{_fmt(item.p50_ms):>7} {_fmt(item.p90_ms):>7} {_fmt(item.p99_ms):>7} "
+            f"{item.total_ms / grand_total * 100:>5.1f}%"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Latency percentiles per agent and tool.")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB)
+    parser.add_argument("--window", default="24h", help="look-back window, e.g. 90s, 15m, 24h, 7d")
+    parser.add_argument("--rebuild", action="store_true", help="recompute rollups from raw spans first")
+    args = parser.parse_args(argv)
+
+    with sqlite3.connect(args.db) as conn:
+        if args.rebuild:
+            print(f"Rebuilt rollups from {rebuild_rollups(conn)} spans.")
+        until = time.time()
+        stats = aggregate(conn, since=until - parse_window(args.window), until=until + 1)
+    print(format_report(stats))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,90 @@
-"""Tool exports for convenience."""
-
-from .wiki import wiki_page, wiki_search
-from .weather import weather_forecast
-from .currency import currency_convert
-from .geo import haversine_distance_km, distance_matrix_local, cluster_points
-from .export import md_export
-
-__all__ = [
-    "wiki_page",
-    "wiki_search",
-    "weather_forecast",
-    "currency_convert",
-    "haversine_distance_km",
-    "distance_matrix_local",
-    "cluster_points",
-    "md_export",
-]
+"""Tool exports for convenience.
+
+Each name is imported from its module on first access: a single geo or
+export call does not load the HTTP clients, and vice versa.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .wiki import wiki_page, wiki_pages, wiki_search, wiki_search_extracts, wiki_search_extracts_async
+    from .weather import (
+        forecast_by_date,
+        weather_forecast,
+        weather_forecast_async,
+        weather_range,
+        weather_range_async,
+    )
+    from .currency import RateTable, convert_many, currency_convert, get_rate_table
+    from .geo import (
+        GeoGridIndex,
+        cluster_points,
+        distance_matrix_local,
+        haversine_condensed,
+        haversine_distance_km,
+        haversine_matrix,
+        kmeans_balanced,
+    )
+    from .export import md_export
+    from .routing import RouteSolution, solve_route
+    from .cache import ResponseCache, configure_response_cache, get_response_cache
+    from .singleflight import SingleFlight, get_single_flight
+    from .deadline import Deadline, DeadlineExceeded, current_deadline, deadline_scope
+    from .http_client import (
+        AsyncHttpClient,
+        HttpClient,
+        close_async_http_client,
+        configure_http_client,
+        get_async_http_client,
+        get_http_client,
+    )
+
+_EXPORTS: Dict[str, str] = {
+    "wiki_page": ".wiki",
+    "wiki_pages": ".wiki",
+    "wiki_search": ".wiki",
+    "wiki_search_extracts": ".wiki",
+    "wiki_search_extracts_async": ".wiki",
+    "forecast_by_date": ".weather",
+    "weather_forecast": ".weather",
+    "weather_forecast_async": ".weather",
+    "weather_range": ".weather",
+    "weather_range_async": ".weather",
+    "RateTable": ".currency",
+    "convert_many": ".currency",
+    "currency_convert": ".currency",
+    "get_rate_table": ".currency",
+    "GeoGridIndex": ".geo",
+    "cluster_points": ".geo",
+    "distance_matrix_local": ".geo",
+    "haversine_condensed": ".geo",
+    "haversine_distance_km": ".geo",
+    "haversine_matrix": ".geo",
+    "kmeans_balanced": ".geo",
+    "md_export": ".export",
+    "RouteSolution": ".routing",
+    "solve_route": ".routing",
+    "ResponseCache": ".cache",
+    "configure_response_cache": ".cache",
+    "get_response_cache": ".cache",
+    "SingleFlight": ".singleflight",
+    "get_single_flight": ".singleflight",
+    "Deadline": ".deadline",
+    "DeadlineExceeded": ".deadline",
+    "current_deadline": ".deadline",
+    "deadline_scope": ".deadline",
+    "AsyncHttpClient": ".http_client",
+    "HttpClient": ".http_client",
+    "close_async_http_client": ".http_client",
+    "configure_http_client": ".http_client",
+    "get_async_http_client": ".http_client",
+    "get_http_client": ".http_client",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,269 @@
+"""Persistent TTL/LRU response cache shared by the public API tools."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
+
+from .singleflight import get_single_flight
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+HOUR = 3600.0
+DEFAULT_TTLS: Dict[str, float] = {
+    "wiki_search": 7 * 24 * HOUR,
+    "wiki_page": 7 * 24 * HOUR,
+    "wiki_pages": 7 * 24 * HOUR,
+    "wiki_search_extracts": 7 * 24 * HOUR,
+    "weather_forecast": 3 * HOUR,
+    "weather_range": 3 * HOUR,
+    "currency_rates": 6 * HOUR,
+}
+DEFAULT_TTL = HOUR
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tool_cache (
+    key TEXT PRIMARY KEY,
+    tool TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tool_cache_last_access ON tool_cache(last_access);
+"""
+
+
+def make_key(tool: str, params: Dict[str, Any]) -> str:
+    """Build a stable key from the tool name and its (normalized) arguments."""
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(f"{tool}:{canonical}".encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ResponseCache:
+    """SQLite-backed cache with per-tool TTLs and least-recently-used eviction.
+
+    ``db_path`` defaults to an in-memory database; pass a file path to keep
+    responses across processes. Setting ``bypass`` (or ``ZTTP_CACHE_BYPASS=1``)
+    sends every call straight to the upstream API.
+
+    Hits do not write: their access times are kept in memory and written in
+    one transaction every ``touch_batch`` hits, before an eviction and on
+    :meth:`close`, so LRU order is still exact when it matters.
+    """
+
+    db_path: Union[str, Path] = ":memory:"
+    max_entries: int = 10_000
+    touch_batch: int = 64
+    ttls: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TTLS))
+    bypass: bool = field(default_factory=lambda: os.environ.get("ZTTP_CACHE_BYPASS", "") == "1")
+    hits: Dict[str, int] = field(default_factory=dict, init=False)
+    misses: Dict[str, int] = field(default_factory=dict, init=False)
+    _touched: Dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if str(self.db_path) != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        if str(self.db_path) != ":memory:":
+            # Same durability trade-off as the memory store: no fsync per commit.
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._size = self._conn.execute("SELECT COUNT(*) FROM tool_cache").fetchone()[0]
+
+    def ttl_for(self, tool: str) -> float:
+        return self.ttls.get(tool, DEFAULT_TTL)
+
+    def get(self, tool: str, key: str) -> Tuple[bool, Any]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM tool_cache WHERE key = ?", (key,)).fetchone()
+            if row is not None and row[1] > now:
+                self._touched[key] = now
+                if len(self._touched) >= self.touch_batch:
+                    self._flush_touches()
+                self.hits[tool] = self.hits.get(tool, 0) + 1
+                return True, json.loads(row[0])
+            if row is not None:
+                self._conn.execute("DELETE FROM tool_cache WHERE key = ?", (key,))
+                self._touched.pop(key, None)
+                self._size -= 1
+            self.misses[tool] = self.misses.get(tool, 0) + 1
+        return False, None
+
+    def set(self, tool: str, key: str, value: Any) -> None:
+        now = time.time()
+        payload = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            # Only a brand-new key grows the table; refreshing one must not bring eviction forward.
+            exists = self._conn.execute("SELECT 1 FROM tool_cache WHERE key = ?", (key,)).fetchone() is not None
+            self._conn.execute(
+                """
+                INSERT INTO tool_cache(key, tool, value, expires_at, last_access)
+                VALUES(?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value=excluded.value,
+                    expires_at=excluded.expires_at,
+                    last_access=excluded.last_access
+                """,
+                (key, tool, payload, now + self.ttl_for(tool), now),
+            )
+            self._touched.pop(key, None)
+            if not exists:
+                self._size += 1
+            if self._size > self.max_entries:
+                self._evict()
+
+    def _flush_touches(self) -> None:
+        if not self._touched:
+            return
+        touched = [(last_access, key) for key, last_access in self._touched.items()]
+        self._touched.clear()
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany("UPDATE tool_cache SET last_access = ? WHERE key = ?", touched)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _evict(self) -> None:
+        self._flush_touches()
+        # Trim to 90% of capacity so eviction is amortized over many inserts.
+        self._size = self._conn.execute("SELECT COUNT(*) FROM tool_cache").fetchone()[0]
+        excess = self._size - int(self.max_entries * 0.9)
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM tool_cache WHERE key IN (SELECT key FROM tool_cache ORDER BY last_access LIMIT ?)",
+                (excess,),
+            )
+            self._size -= excess
+
+    def clear(self, tool: Optional[str] = None) -> None:
+        with self._lock:
+            self._flush_touches()
+            if tool is None:
+                self._conn.execute("DELETE FROM tool_cache")
+            else:
+                self._conn.execute("DELETE FROM tool_cache WHERE tool = ?", (tool,))
+            self._size = self._conn.execute("SELECT COUNT(*) FROM tool_cache").fetchone()[0]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return hit/miss counters per tool."""
+        with self._lock:
+            tools = set(self.hits) | set(self.misses)
+            return {tool: {"hits": self.hits.get(tool, 0), "misses": self.misses.get(tool, 0)} for tool in tools}
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._conn.close()
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide cache, creating an in-memory one on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
+
+
+def configure_response_cache(**options: Any) -> ResponseCache:
+    """Replace the shared cache, e.g. to persist it next to the application database."""
+    global _cache
+    with _cache_lock:
+        previous, _cache = _cache, ResponseCache(**options)
+    if previous is not None:
+        previous.close()
+    return _cache
+
+
+def cached_tool(
+    tool: str, normalize: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+) -> Callable[[F], F]:
+    """Serve a tool function from the shared cache.
+
+    The wrapped function gains a ``use_cache`` keyword argument; pass
+    ``use_cache=False`` to force a fresh upstream call for that invocation.
+    ``normalize`` may rewrite the bound arguments before they are hashed, so
+    near-identical calls share an entry. Coroutine functions are supported
+    and share entries with a sync twin registered under the same ``tool``.
+
+    On a miss, concurrent calls with the same key (from threads or tasks,
+    sync or async) are coalesced by :func:`get_single_flight` into a single
+    upstream request, even while the cache is bypassed. Coroutine tools read
+    and write the cache in a worker thread, so SQLite never blocks the loop.
+    """
+
+    def decorator(fn: F) -> F:
+        signature = inspect.signature(fn)
+
+        def resolve(args: Any, kwargs: Any) -> Tuple[Optional[ResponseCache], str]:
+            cache = get_response_cache()
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            key = make_key(tool, normalize(params) if normalize else params)
+            return (None if cache.bypass else cache), key
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, use_cache: bool = True, **kwargs: Any) -> Any:
+                if not use_cache:
+                    return await fn(*args, **kwargs)
+                cache, key = resolve(args, kwargs)
+                if cache is not None:
+                    hit, value = await asyncio.to_thread(cache.get, tool, key)
+                    if hit:
+                        return value
+
+                async def fetch() -> Any:
+                    fresh = await fn(*args, **kwargs)
+                    if cache is not None:
+                        await asyncio.to_thread(cache.set, tool, key, fresh)
+                    return fresh
+
+                return await get_single_flight().do_async(tool, key, fetch)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, use_cache: bool = True, **kwargs: Any) -> Any:
+            if not use_cache:
+                return fn(*args, **kwargs)
+            cache, key = resolve(args, kwargs)
+            if cache is not None:
+                hit, value = cache.get(tool, key)
+                if hit:
+                    return value
+
+            def fetch() -> Any:
+                fresh = fn(*args, **kwargs)
+                if cache is not None:
+                    cache.set(tool, key, fresh)
+                return fresh
+
+            return get_single_flight().do(tool, key, fetch)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
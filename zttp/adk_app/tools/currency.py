@@ -1,31 +1,115 @@
-"""Currency conversion helper backed by exchangerate.host."""
+"""Currency conversion backed by one cached exchangerate.host rate table.
+
+The table for :data:`TABLE_BASE` is fetched once per TTL (through the
+response cache, so it survives restarts) and every pair is derived from it
+as a cross rate; conversions themselves never touch the network.
+"""
 
 from __future__ import annotations
 
-from typing import Dict
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .cache import ResponseCache, cached_tool, get_response_cache
+from .http_client import get_http_client
+
+RATES_URL = "https://api.exchangerate.host/latest"
+TABLE_BASE = "EUR"
+
+
+@dataclass(frozen=True)
+class RateTable:
+    """Units of each currency per one unit of ``base``, as of ``date``."""
+
+    base: str
+    date: str
+    rates: Dict[str, float]
+
+    def rate(self, from_currency: str, to_currency: str) -> float:
+        """Return the ``from -> to`` rate, derived through the base currency."""
+        return self._units(to_currency) / self._units(from_currency)
+
+    def _units(self, currency: str) -> float:
+        code = currency.upper()
+        if code == self.base:
+            return 1.0
+        units = self.rates.get(code)
+        if not units:
+            raise ValueError(f"No exchange rate for {code!r} in the {self.base} table")
+        return units
+
+    def convert_many(
+        self, amounts: Iterable[float], from_currency: str, to_currency: str, *, places: int = 2
+    ) -> List[float]:
+        values = np.fromiter(amounts, dtype=np.float64)
+        return np.round(values * self.rate(from_currency, to_currency), places).tolist()
 
-import requests
 
-BASE_URL = "https://api.exchangerate.host/convert"
+def _table_key(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {**params, "base": str(params.get("base", TABLE_BASE)).upper()}
 
 
-def currency_convert(amount: float, from_currency: str, to_currency: str) -> Dict[str, float]:
-    response = requests.get(
-        BASE_URL,
-        params={
-            "from": from_currency,
-            "to": to_currency,
-            "amount": amount,
-            "places": 2,
-        },
-        timeout=15,
-    )
-    response.raise_for_status()
-    data = response.json()
+@cached_tool("currency_rates", normalize=_table_key)
+def fetch_rates(base: str = TABLE_BASE) -> Dict[str, Any]:
+    """Fetch the latest rate table for ``base`` (one upstream call, cached with a TTL).
+
+    An error body or an empty table raises instead of returning, so it is
+    never cached for the table's TTL.
+    """
+    base = base.upper()
+    data = get_http_client().get_json(RATES_URL, params={"base": base})
+    if data.get("success") is False:
+        error = data.get("error") or {}
+        detail = error.get("info") or error.get("type") if isinstance(error, dict) else error
+        raise ValueError(f"Exchange rate lookup for {base} failed: {detail or 'no details'}")
+    rates = {code.upper(): float(units) for code, units in (data.get("rates") or {}).items()}
+    if not rates:
+        raise ValueError(f"Exchange rate lookup for {base} returned no rates")
+    return {"base": base, "date": data.get("date", ""), "rates": rates, "fetched_at": time.time()}
+
+
+_tables: Dict[str, Tuple[ResponseCache, float, RateTable]] = {}
+_tables_lock = threading.Lock()
+
+
+def get_rate_table(base: str = TABLE_BASE, *, use_cache: bool = True) -> RateTable:
+    """Return the rate table for ``base``, parsed once per TTL and kept in memory."""
+    base = base.upper()
+    cache = get_response_cache()
+    keep = use_cache and not cache.bypass
+    now = time.time()
+    if keep:
+        with _tables_lock:
+            entry = _tables.get(base)
+        # Tables belong to the response cache they were read through, so a
+        # reconfigured cache starts cold here too.
+        if entry is not None and entry[0] is cache and entry[1] > now:
+            return entry[2]
+    payload = fetch_rates(base, use_cache=use_cache)
+    table = RateTable(base=payload["base"], date=payload["date"], rates=payload["rates"])
+    if keep:
+        with _tables_lock:
+            # Expire with the stored response, not a fresh TTL from this read.
+            _tables[base] = (cache, payload["fetched_at"] + cache.ttl_for("currency_rates"), table)
+    return table
+
+
+def convert_many(
+    amounts: Iterable[float], from_currency: str, to_currency: str, *, places: int = 2, use_cache: bool = True
+) -> List[float]:
+    """Convert every amount with a single rate lookup; rounded to ``places`` decimals."""
+    return get_rate_table(use_cache=use_cache).convert_many(amounts, from_currency, to_currency, places=places)
+
+
+def currency_convert(amount: float, from_currency: str, to_currency: str, *, use_cache: bool = True) -> Dict[str, float]:
+    table = get_rate_table(use_cache=use_cache)
     return {
         "query_amount": amount,
         "from": from_currency,
         "to": to_currency,
-        "result": data.get("result", 0.0),
+        "result": round(amount * table.rate(from_currency, to_currency), 2),
     }
-
@@ -0,0 +1,153 @@
+"""Per-run latency budgets shared by the orchestration graph, agents and tools.
+
+A :class:`Deadline` is installed for the duration of a run with
+:func:`deadline_scope`; asyncio tasks and ``asyncio.to_thread`` workers
+started inside the scope inherit it, so the HTTP clients can bound every
+request by what is left of the run's budget without threading an extra
+argument through each cached tool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call is cut by the run's deadline.
+
+    ``partial`` carries whatever the cut layer had already collected (for
+    example the pages that arrived before a continuation request was cut),
+    so callers can carry on with it instead of starting from nothing.
+    """
+
+    def __init__(self, message: str, *, partial: Any = None) -> None:
+        super().__init__(message)
+        self.partial = partial
+
+
+@dataclass
+class Deadline:
+    """An absolute point in time (``time.monotonic``) by which a run must finish.
+
+    ``hedge_after`` (seconds) lets the async HTTP client start a duplicate
+    GET when the first one is slower than that, keeping whichever answers
+    first. ``cut`` lists the calls the deadline interrupted and ``hedged``
+    counts the duplicates sent, for telemetry.
+    """
+
+    expires_at: float
+    hedge_after: Optional[float] = None
+    started_at: float = field(default_factory=time.monotonic)
+    cut: List[str] = field(default_factory=list)
+    hedged: int = 0
+
+    @classmethod
+    def within(cls, budget_ms: float, *, hedge_after_ms: Optional[float] = None) -> "Deadline":
+        now = time.monotonic()
+        hedge_after = None if hedge_after_ms is None else hedge_after_ms / 1000.0
+        return cls(expires_at=now + budget_ms / 1000.0, hedge_after=hedge_after, started_at=now)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def exceeded(self, what: str, *, partial: Any = None) -> DeadlineExceeded:
+        """Record ``what`` as cut and build the exception to raise for it."""
+        self.cut.append(what)
+        elapsed_ms = (time.monotonic() - self.started_at) * 1000
+        return DeadlineExceeded(f"deadline exceeded after {elapsed_ms:.0f}ms: {what}", partial=partial)
+
+    def timeout(self, connect: float, read: float, what: str) -> Tuple[float, float]:
+        """Clamp a ``(connect, read)`` timeout pair to the time left."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise self.exceeded(what)
+        return (min(connect, remaining), min(read, remaining))
+
+    async def bound(self, awaitable: Awaitable[T], what: str, *, grace: float = 0.0) -> T:
+        """Await ``awaitable``, cancelling it if the deadline passes first.
+
+        ``grace`` (seconds) gives an inner layer that is bounded by the same
+        deadline the chance to raise its own :class:`DeadlineExceeded`, with
+        its partial results, before this one cancels it.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise self.exceeded(what)
+        try:
+            return await asyncio.wait_for(awaitable, remaining + grace)
+        except DeadlineExceeded:
+            raise
+        except asyncio.TimeoutError:
+            raise self.exceeded(what) from None
+
+
+_current: "contextvars.ContextVar[Optional[Deadline]]" = contextvars.ContextVar("zttp_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline of the run this code is executing for, if any."""
+    return _current.get()
+
+
+def has_time_left() -> bool:
+    """Whether the current run may still wait (always true without a deadline).
+
+    A :class:`DeadlineExceeded` from work shared with another run only
+    applies here when this is false; otherwise the caller should redo the
+    work under its own budget.
+    """
+    deadline = _current.get()
+    return deadline is None or not deadline.expired
+
+
+@contextlib.contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+async def hedged(
+    fn: Callable[[], Awaitable[T]], *, after: float, on_hedge: Optional[Callable[[], None]] = None
+) -> T:
+    """Run ``fn``; if it has not finished after ``after`` seconds, race a second call.
+
+    The first successful result wins and the other attempt is cancelled. An
+    attempt that fails while the other is still running is ignored; if both
+    fail, the first attempt's error is raised.
+    """
+    first = asyncio.ensure_future(fn())
+    attempts = [first]
+    try:
+        done, _ = await asyncio.wait({first}, timeout=after)
+        if done:
+            return first.result()
+        if on_hedge is not None:
+            on_hedge()
+        attempts.append(asyncio.ensure_future(fn()))
+        pending = set(attempts)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winners = [attempt for attempt in done if not attempt.cancelled() and attempt.exception() is None]
+            if winners:
+                return winners[0].result()
+        return first.result()
+    finally:
+        for attempt in attempts:
+            if not attempt.done():
+                attempt.cancel()
@@ -2,11 +2,83 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+import tempfile
 from pathlib import Path
+from typing import IO, Iterable, Optional, Union
 
+ARTIFACT_MODE = 0o644
 
-def md_export(path: str, content: str) -> None:
+
+class _Limited:
+    """Read at most ``remaining`` bytes from ``source``."""
+
+    def __init__(self, source: IO[bytes], remaining: int) -> None:
+        self.source = source
+        self.remaining = remaining
+
+    def read(self, size: int = -1) -> bytes:
+        size = self.remaining if size < 0 else min(size, self.remaining)
+        data = self.source.read(size)
+        self.remaining -= len(data)
+        return data
+
+
+def _open_temp(target: Path, existing: Optional[IO[bytes]], prefix_bytes: int) -> IO[bytes]:
+    handle = tempfile.NamedTemporaryFile(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp", delete=False)
+    if prefix_bytes and existing is not None:
+        existing.seek(0)
+        shutil.copyfileobj(_Limited(existing, prefix_bytes), handle)
+    return handle
+
+
+def md_export(path: str, content: Union[str, Iterable[str]]) -> bool:
+    """Write ``content`` to ``path`` atomically and return whether the file changed.
+
+    ``content`` may be a string or an iterable of chunks (such as a render
+    generator). Chunks are compared against the file already on disk as they
+    arrive; nothing is written while they match, so re-exporting an
+    identical document costs only a read. From the first difference on, the
+    output is streamed to a temporary file in the target directory, which
+    then replaces the target with a rename: readers see either the old or
+    the new document, never a partial one.
+    """
     target = Path(path)
     target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(content, encoding="utf-8")
-
+    chunks = [content] if isinstance(content, str) else content
+    try:
+        existing: Optional[IO[bytes]] = open(target, "rb")
+    except FileNotFoundError:
+        existing = None
+    handle: Optional[IO[bytes]] = None
+    matched = 0
+    try:
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            if handle is None:
+                if existing is not None and existing.read(len(data)) == data:
+                    matched += len(data)
+                    continue
+                handle = _open_temp(target, existing, matched)
+            handle.write(data)
+        if handle is None:
+            if existing is not None and existing.read(1) == b"":
+                return False
+            # The new document is a strict prefix of the old one (or there is no old one).
+            handle = _open_temp(target, existing, matched)
+        handle.close()
+        # NamedTemporaryFile creates the file 0600; keep the mode a plain write_text would give.
+        mode = os.fstat(existing.fileno()).st_mode & 0o777 if existing is not None else ARTIFACT_MODE
+        os.chmod(handle.name, mode)
+        os.replace(handle.name, target)
+    except BaseException:
+        if handle is not None:
+            handle.close()
+            if os.path.exists(handle.name):
+                os.unlink(handle.name)
+        raise
+    finally:
+        if existing is not None:
+            existing.close()
+    return True
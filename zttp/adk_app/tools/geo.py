@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from math import atan2, cos, radians, sin, sqrt
-from typing import Dict, Iterable, List, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+# Rows of the distance matrix computed per step; bounds temporaries to ~chunk x n.
+DEFAULT_CHUNK_ROWS = 1024
+
+DistanceMatrix = Union[List[List[float]], np.ndarray]
 
 
 def haversine_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    r = 6371.0
+    r = EARTH_RADIUS_KM
     phi1, phi2 = radians(lat1), radians(lat2)
     dphi = radians(lat2 - lat1)
     dlambda = radians(lon2 - lon1)
@@ -16,35 +25,264 @@ def haversine_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) ->
     return r * c
 
 
-def distance_matrix_local(points: Sequence[Dict[str, float]]) -> List[List[float]]:
-    matrix: List[List[float]] = []
-    for i, src in enumerate(points):
-        row = []
-        for j, dst in enumerate(points):
-            if i == j:
-                row.append(0.0)
-            else:
-                row.append(
-                    haversine_distance_km(
-                        src.get("lat", 0.0),
-                        src.get("lon", 0.0),
-                        dst.get("lat", 0.0),
-                        dst.get("lon", 0.0),
-                    )
-                )
-        matrix.append(row)
-    return matrix
-
-
-def cluster_points(points: Iterable[Dict[str, float]], buckets: int) -> List[List[Dict[str, float]]]:
+def coordinates_array(points: Sequence[Dict[str, float]], dtype: np.dtype = np.float64) -> np.ndarray:
+    """Pack ``lat``/``lon`` keys into an ``(n, 2)`` array of degrees; missing values become 0."""
+    coords = np.zeros((len(points), 2), dtype=dtype)
+    for row, point in enumerate(points):
+        coords[row, 0] = point.get("lat", 0.0)
+        coords[row, 1] = point.get("lon", 0.0)
+    return coords
+
+
+def _haversine_block(
+    phi1: np.ndarray, lam1: np.ndarray, cos1: np.ndarray, phi2: np.ndarray, lam2: np.ndarray, cos2: np.ndarray
+) -> np.ndarray:
+    a = np.sin((phi2 - phi1) / 2) ** 2 + cos1 * cos2 * np.sin((lam2 - lam1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def haversine_to_many(lat: float, lon: float, coords: np.ndarray) -> np.ndarray:
+    """Distances in km from one point to every row of an ``(n, 2)`` degree array."""
+    rad = np.radians(np.asarray(coords, dtype=np.float64))
+    phi, lam = radians(lat), radians(lon)
+    return _haversine_block(phi, lam, np.cos(phi), rad[:, 0], rad[:, 1], np.cos(rad[:, 0]))
+
+
+def _unit_vectors(coords: np.ndarray) -> np.ndarray:
+    rad = np.radians(np.asarray(coords, dtype=np.float64))
+    cos_lat = np.cos(rad[:, 0])
+    return np.column_stack((cos_lat * np.cos(rad[:, 1]), cos_lat * np.sin(rad[:, 1]), np.sin(rad[:, 0])))
+
+
+def haversine_matrix(
+    coords: np.ndarray,
+    other: Optional[np.ndarray] = None,
+    *,
+    dtype: np.dtype = np.float64,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> np.ndarray:
+    """Vectorized great-circle distances (km) between rows of two ``(n, 2)`` degree arrays.
+
+    ``other`` defaults to ``coords``. Points are mapped to unit vectors so
+    each block is one matrix product; the chord length then gives the same
+    distance as the haversine formula (to well under a metre in float64).
+    Rows are processed ``chunk_rows`` at a time so intermediates never exceed
+    ``chunk_rows x m`` elements; the result is allocated once in ``dtype``
+    (``float32`` halves its footprint).
+    """
+    src = _unit_vectors(coords)
+    dst = src if other is None else _unit_vectors(other)
+    out = np.empty((len(src), len(dst)), dtype=dtype)
+    for start in range(0, len(src), chunk_rows):
+        block = src[start : start + chunk_rows] @ dst.T
+        # |u - v|^2 = 2 - 2 u.v, and distance = 2R * asin(|u - v| / 2).
+        np.multiply(block, -0.5, out=block)
+        np.add(block, 0.5, out=block)
+        np.clip(block, 0.0, 1.0, out=block)
+        np.sqrt(block, out=block)
+        np.arcsin(block, out=block)
+        np.multiply(block, 2 * EARTH_RADIUS_KM, out=block)
+        out[start : start + len(block)] = block
+    if other is None:
+        np.fill_diagonal(out, 0.0)
+    return out
+
+
+def haversine_condensed(coords: np.ndarray, *, dtype: np.dtype = np.float64) -> np.ndarray:
+    """Upper-triangle distances in row-major ``(0,1), (0,2), ..., (n-2,n-1)`` order.
+
+    Stores ``n(n-1)/2`` values instead of ``n^2`` and builds them one row at
+    a time, so temporaries stay ``O(n)``. Entry ``(i, j)`` with ``i < j``
+    lives at ``n*i - i*(i+1)/2 + (j - i - 1)``.
+    """
+    rad = np.radians(np.asarray(coords, dtype=np.float64))
+    n = len(rad)
+    out = np.empty(n * (n - 1) // 2, dtype=dtype)
+    cos_all = np.cos(rad[:, 0])
+    offset = 0
+    for i in range(n - 1):
+        row = _haversine_block(rad[i, 0], rad[i, 1], cos_all[i], rad[i + 1 :, 0], rad[i + 1 :, 1], cos_all[i + 1 :])
+        out[offset : offset + len(row)] = row
+        offset += len(row)
+    return out
+
+
+def distance_matrix_local(
+    points: Sequence[Dict[str, float]], *, as_array: bool = False, dtype: np.dtype = np.float64
+) -> DistanceMatrix:
+    """Pairwise distances (km) between ``points`` with ``lat``/``lon`` keys.
+
+    Returns nested lists by default; ``as_array=True`` keeps the NumPy matrix
+    and avoids building ``n^2`` Python floats.
+    """
+    matrix = haversine_matrix(coordinates_array(points), dtype=dtype)
+    return matrix if as_array else matrix.tolist()
+
+
+@dataclass
+class GeoGridIndex:
+    """Fixed-size lat/lon grid over a set of points for radius and k-nearest queries.
+
+    Points are bucketed into ``cell_deg`` cells and stored sorted by cell, so
+    a query only computes exact distances for points in the cells its search
+    circle overlaps. Longitudes wrap around the antimeridian.
+    """
+
+    coords: np.ndarray
+    cell_deg: float = 0.05
+    _order: np.ndarray = field(init=False, repr=False)
+    _cells: Dict[int, Tuple[int, int]] = field(init=False, repr=False)
+    _cols: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.coords = np.asarray(self.coords, dtype=np.float64).reshape(-1, 2)
+        self._cols = int(np.ceil(360.0 / self.cell_deg))
+        keys = self._cell_keys(self.coords[:, 0], self.coords[:, 1])
+        self._order = np.argsort(keys, kind="stable")
+        unique, starts, counts = np.unique(keys[self._order], return_index=True, return_counts=True)
+        self._cells = {int(k): (int(s), int(s + c)) for k, s, c in zip(unique, starts, counts)}
+
+    @classmethod
+    def from_points(cls, points: Sequence[Dict[str, float]], cell_deg: float = 0.05) -> "GeoGridIndex":
+        return cls(coordinates_array(points), cell_deg=cell_deg)
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def _cell_keys(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        rows = np.floor((np.clip(lat, -90.0, 90.0) + 90.0) / self.cell_deg).astype(np.int64)
+        cols = np.floor((np.asarray(lon) + 180.0) / self.cell_deg).astype(np.int64) % self._cols
+        return rows * self._cols + cols
+
+    def _candidates(self, lat: float, lon: float, radius_km: float) -> np.ndarray:
+        dlat = np.degrees(radius_km / EARTH_RADIUS_KM)
+        max_abs_lat = min(90.0, abs(lat) + dlat)
+        row_lo = int(np.floor((max(-90.0, lat - dlat) + 90.0) / self.cell_deg))
+        row_hi = int(np.floor((min(90.0, lat + dlat) + 90.0) / self.cell_deg))
+        if max_abs_lat >= 89.9 or dlat / cos(radians(max_abs_lat)) >= 180.0:
+            cols = range(self._cols)
+        else:
+            dlon = dlat / cos(radians(max_abs_lat))
+            col_lo = int(np.floor((lon - dlon + 180.0) / self.cell_deg))
+            col_hi = int(np.floor((lon + dlon + 180.0) / self.cell_deg))
+            cols = range(col_lo, col_hi + 1)
+        if (row_hi - row_lo + 1) * len(cols) >= max(len(self._cells), 1):
+            return np.arange(len(self.coords))
+        spans = []
+        for row in range(row_lo, row_hi + 1):
+            for col in cols:
+                span = self._cells.get(row * self._cols + col % self._cols)
+                if span is not None:
+                    spans.append(self._order[span[0] : span[1]])
+        return np.concatenate(spans) if spans else np.empty(0, dtype=np.int64)
+
+    def query_radius(self, lat: float, lon: float, radius_km: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Indices and distances of points within ``radius_km``, nearest first."""
+        candidates = self._candidates(lat, lon, radius_km)
+        distances = haversine_to_many(lat, lon, self.coords[candidates])
+        mask = distances <= radius_km
+        candidates, distances = candidates[mask], distances[mask]
+        order = np.argsort(distances, kind="stable")
+        return candidates[order], distances[order]
+
+    def query_knn(self, lat: float, lon: float, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Indices and distances of the ``k`` nearest points, nearest first."""
+        k = min(k, len(self.coords))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        # Grow the search circle until it holds k points; everything closer
+        # than its radius is then guaranteed to have been considered.
+        radius = EARTH_RADIUS_KM * radians(self.cell_deg)
+        while True:
+            indices, distances = self.query_radius(lat, lon, radius)
+            if len(indices) >= k or radius >= np.pi * EARTH_RADIUS_KM:
+                return indices[:k], distances[:k]
+            radius *= 2
+
+
+def _balanced_assign(sq_dist: np.ndarray) -> np.ndarray:
+    """Assign points to clusters so every cluster gets ``n // k`` or one more point.
+
+    Points that lose the most by missing their nearest cluster (largest gap
+    to the runner-up) choose first, each taking its closest cluster that
+    still has room.
+    """
+    n, k = sq_dist.shape
+    base, extra = divmod(n, k)
+    preferences = np.argsort(sq_dist, axis=1, kind="stable")
+    ranked = np.take_along_axis(sq_dist, preferences[:, :2], axis=1)
+    order = np.argsort(ranked[:, 0] - ranked[:, 1], kind="stable")
+    sizes = [0] * k
+    labels = np.empty(n, dtype=np.int64)
+    for point in order.tolist():
+        for cluster in preferences[point].tolist():
+            if sizes[cluster] < base:
+                break
+            if sizes[cluster] == base and extra > 0:
+                extra -= 1
+                break
+        labels[point] = cluster
+        sizes[cluster] += 1
+    return labels
+
+
+def kmeans_balanced(coords: np.ndarray, k: int, *, seed: int = 0, max_iter: int = 20) -> np.ndarray:
+    """Size-balanced k-means labels for an ``(n, 2)`` array of degrees.
+
+    Points are clustered as unit vectors, so distances stay meaningful across
+    the antimeridian. Seeding is k-means++ from ``np.random.default_rng(seed)``,
+    which makes the result deterministic, and each iteration re-assigns
+    points greedily so cluster sizes differ by at most one.
+    """
+    n = len(coords)
+    k = max(1, min(k, n))
+    if n == 0 or k == 1:
+        return np.zeros(n, dtype=np.int64)
+    points = _unit_vectors(coords)
+    rng = np.random.default_rng(seed)
+    centers = np.empty((k, 3))
+    centers[0] = points[rng.integers(n)]
+    closest = ((points - centers[0]) ** 2).sum(axis=1)
+    for c in range(1, k):
+        total = closest.sum()
+        pick = rng.choice(n, p=closest / total) if total > 0 else rng.integers(n)
+        centers[c] = points[pick]
+        closest = np.minimum(closest, ((points - centers[c]) ** 2).sum(axis=1))
+    labels = np.full(n, -1, dtype=np.int64)
+    for _ in range(max_iter):
+        sq_dist = ((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        updated = _balanced_assign(sq_dist)
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+        for c in range(k):
+            centers[c] = points[labels == c].mean(axis=0)
+    return labels
+
+
+def cluster_points(
+    points: Iterable[Dict[str, float]], buckets: int, *, seed: int = 0
+) -> List[List[Dict[str, float]]]:
+    """Group points into ``buckets`` geographic clusters of near-equal size.
+
+    Points with ``lat``/``lon`` are clustered with :func:`kmeans_balanced`;
+    points without coordinates top up the smallest clusters. Clusters are
+    ordered by their best-ranked (earliest) point and keep input order
+    inside, so the first bucket holds the top result's neighbourhood.
+    """
     point_list = list(points)
     if buckets <= 0:
         return [point_list]
-    bucket_size = max(1, len(point_list) // buckets)
-    clusters: List[List[Dict[str, float]]] = []
-    for start in range(0, len(point_list), bucket_size):
-        clusters.append(point_list[start : start + bucket_size])
-    while len(clusters) < buckets:
-        clusters.append([])
-    return clusters[:buckets]
-
+    located = [i for i, point in enumerate(point_list) if "lat" in point and "lon" in point]
+    members: List[List[int]] = [[] for _ in range(buckets)]
+    if located:
+        coords = np.array([[point_list[i]["lat"], point_list[i]["lon"]] for i in located], dtype=np.float64)
+        labels = kmeans_balanced(coords, buckets, seed=seed)
+        for index, label in zip(located, labels):
+            members[int(label)].append(index)
+    located_set = set(located)
+    for index in range(len(point_list)):
+        if index not in located_set:
+            min(members, key=len).append(index)
+    members.sort(key=lambda group: (not group, min(group) if group else 0))
+    return [[point_list[i] for i in sorted(group)] for group in members]
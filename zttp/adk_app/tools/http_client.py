@@ -0,0 +1,247 @@
+"""Shared pooled HTTP client used by every public API tool."""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from .deadline import current_deadline, hedged
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+# requests and httpx are imported when a client is first built, so importing
+# the tools does not pay for them until a network call is actually made.
+
+USER_AGENT = "ZTTP/0.1 (Zero-Key Trip & Task Planner)"
+
+
+@dataclass
+class HttpClient:
+    """Keep-alive HTTP client with a bounded per-host connection pool.
+
+    A single ``requests.Session`` is shared by all tools so repeated calls to
+    the same host reuse established TCP/TLS connections instead of paying the
+    handshake on every request.
+    """
+
+    pool_connections: int = 4
+    pool_maxsize: int = 8
+    pool_block: bool = True
+    connect_timeout: float = 5.0
+    read_timeout: float = 15.0
+    retries: int = 2
+    backoff_factor: float = 0.3
+    status_forcelist: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    _session: Optional[requests.Session] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def _build_session(self) -> requests.Session:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=self.retries,
+            status=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.status_forcelist,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        return (self.connect_timeout, self.read_timeout)
+
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET ``url`` and decode JSON; under a run deadline the timeouts shrink to fit it."""
+        deadline = current_deadline()
+        if deadline is None:
+            response = self.session.get(url, params=params, timeout=self.timeout)
+        else:
+            import requests
+
+            timeout = deadline.timeout(self.connect_timeout, self.read_timeout, url)
+            try:
+                response = self.session.get(url, params=params, timeout=timeout)
+            except requests.Timeout:
+                if deadline.expired:
+                    raise deadline.exceeded(url) from None
+                raise
+        response.raise_for_status()
+        return response.json()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_ssl_context: Optional[ssl.SSLContext] = None
+
+
+def _shared_ssl_context() -> ssl.SSLContext:
+    # Loading CA certificates dominates client construction; do it once per process.
+    global _ssl_context
+    if _ssl_context is None:
+        import httpx
+
+        _ssl_context = httpx.create_ssl_context()
+    return _ssl_context
+
+
+@dataclass
+class AsyncHttpClient:
+    """Non-blocking counterpart of :class:`HttpClient` built on ``httpx``.
+
+    ``httpx`` pools connections per client rather than per host, so the pool
+    is bounded to ``pool_connections * pool_maxsize`` connections in total
+    with ``pool_maxsize`` kept alive. Retries mirror the sync client: failed
+    connections and ``status_forcelist`` responses are retried with
+    exponential backoff.
+    """
+
+    pool_connections: int = 4
+    pool_maxsize: int = 8
+    # httpx always waits for a free pooled connection; kept so both clients share options.
+    pool_block: bool = True
+    connect_timeout: float = 5.0
+    read_timeout: float = 15.0
+    retries: int = 2
+    backoff_factor: float = 0.3
+    status_forcelist: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    _client: Optional[httpx.AsyncClient] = field(default=None, init=False, repr=False)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                verify=_shared_ssl_context(),
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.pool_connections * self.pool_maxsize,
+                    max_keepalive_connections=self.pool_maxsize,
+                ),
+            )
+        return self._client
+
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET ``url`` and decode JSON, bounded by the run deadline if one is set.
+
+        Under a deadline with ``hedge_after``, a request still outstanding
+        after that long is duplicated and the first answer wins.
+        """
+        deadline = current_deadline()
+        if deadline is None:
+            return await self._get_json(url, params)
+        if deadline.hedge_after is None:
+            return await deadline.bound(self._get_json(url, params), url)
+
+        def count_hedge() -> None:
+            deadline.hedged += 1
+
+        attempt = hedged(lambda: self._get_json(url, params), after=deadline.hedge_after, on_hedge=count_hedge)
+        return await deadline.bound(attempt, url)
+
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]]) -> Any:
+        import httpx
+
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            try:
+                response = await self.client.get(url, params=params)
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+            else:
+                if response.status_code not in self.status_forcelist or last_attempt:
+                    response.raise_for_status()
+                    return response.json()
+            await asyncio.sleep(self.backoff_factor * (2**attempt))
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+_client_options: Dict[str, Any] = {}
+# httpx clients are bound to the loop that first used them, so keep one per loop.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHttpClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide client, creating it with defaults on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient(**_client_options)
+    return _client
+
+
+def configure_http_client(**options: Any) -> HttpClient:
+    """Replace the shared client, e.g. to tune pool size, timeouts or retries.
+
+    The same options apply to async clients created afterwards.
+    """
+    global _client
+    with _client_lock:
+        _client_options.clear()
+        _client_options.update(options)
+        previous, _client = _client, HttpClient(**options)
+    if previous is not None:
+        previous.close()
+    return _client
+
+
+def get_async_http_client() -> AsyncHttpClient:
+    """Return the async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = AsyncHttpClient(**_client_options)
+    return client
+
+
+async def close_async_http_client() -> None:
+    """Close the running loop's async client, if one was created."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,164 @@
+"""Fast open-path route ordering for the stops of a single day."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from itertools import permutations
+from typing import List, Sequence
+
+import numpy as np
+
+# Below this many stops every ordering is tried; it is cheaper than heuristics.
+EXACT_MAX_STOPS = 5
+# Nearest-neighbour construction is tried from every start up to this size.
+MULTI_START_MAX_STOPS = 40
+# Above this size the matrix is not copied into Python lists (an O(n²) step of
+# its own); the day gets a deadline-bounded nearest-neighbour tour instead.
+LOCAL_SEARCH_MAX_STOPS = 200
+
+
+@dataclass
+class RouteSolution:
+    """Visiting order (indices into the distance matrix) and its cost."""
+
+    order: List[int]
+    distance_km: float
+    solve_ms: float
+    timed_out: bool = False
+
+
+def path_length(order: Sequence[int], dist: Sequence[Sequence[float]]) -> float:
+    return float(sum(dist[a][b] for a, b in zip(order, order[1:])))
+
+
+def _nearest_neighbour(start: int, dist: List[List[float]], deadline: float = float("inf")) -> List[int]:
+    """Greedy tour from ``start``; past ``deadline`` the rest is appended in index order."""
+    n = len(dist)
+    order = [start]
+    remaining = set(range(n))
+    remaining.discard(start)
+    while remaining:
+        if time.perf_counter() > deadline:
+            order.extend(sorted(remaining))
+            break
+        last = dist[order[-1]]
+        nxt = min(remaining, key=last.__getitem__)
+        order.append(nxt)
+        remaining.discard(nxt)
+    return order
+
+
+def _nearest_neighbour_array(dist: np.ndarray, deadline: float) -> List[int]:
+    """:func:`_nearest_neighbour` from stop 0 on the array itself, one vectorized step per stop."""
+    n = len(dist)
+    visited = np.zeros(n, dtype=bool)
+    visited[0] = True
+    order = [0]
+    while len(order) < n:
+        if time.perf_counter() > deadline:
+            order.extend(np.flatnonzero(~visited).tolist())
+            break
+        nxt = int(np.where(visited, np.inf, dist[order[-1]]).argmin())
+        order.append(nxt)
+        visited[nxt] = True
+    return order
+
+
+def _two_opt_pass(order: List[int], dist: List[List[float]], deadline: float) -> bool:
+    """Apply the first improving segment reversal found; False if none (or out of time)."""
+    n = len(order)
+    for i in range(n - 1):
+        if time.perf_counter() > deadline:
+            return False
+        a = order[i - 1] if i > 0 else None
+        b = order[i]
+        for j in range(i + 1, n):
+            c = order[j]
+            e = order[j + 1] if j + 1 < n else None
+            before = (dist[a][b] if a is not None else 0.0) + (dist[c][e] if e is not None else 0.0)
+            after = (dist[a][c] if a is not None else 0.0) + (dist[b][e] if e is not None else 0.0)
+            if after < before - 1e-9:
+                order[i : j + 1] = order[i : j + 1][::-1]
+                return True
+    return False
+
+
+def _or_opt_pass(order: List[int], dist: List[List[float]], deadline: float) -> bool:
+    """Move a run of 1-3 stops (optionally reversed) to a cheaper position."""
+    n = len(order)
+    for length in (1, 2, 3):
+        for i in range(n - length + 1):
+            if time.perf_counter() > deadline:
+                return False
+            segment = order[i : i + length]
+            prev = order[i - 1] if i > 0 else None
+            nxt = order[i + length] if i + length < n else None
+            gain = (dist[prev][segment[0]] if prev is not None else 0.0) + (
+                dist[segment[-1]][nxt] if nxt is not None else 0.0
+            )
+            if prev is not None and nxt is not None:
+                gain -= dist[prev][nxt]
+            rest = order[:i] + order[i + length :]
+            for j in range(len(rest) + 1):
+                if j == i:
+                    continue
+                x = rest[j - 1] if j > 0 else None
+                y = rest[j] if j < len(rest) else None
+                for candidate in (segment, segment[::-1]):
+                    cost = (dist[x][candidate[0]] if x is not None else 0.0) + (
+                        dist[candidate[-1]][y] if y is not None else 0.0
+                    )
+                    if x is not None and y is not None:
+                        cost -= dist[x][y]
+                    if cost < gain - 1e-9:
+                        order[:] = rest[:j] + candidate + rest[j:]
+                        return True
+    return False
+
+
+def solve_route(dist: np.ndarray, *, time_budget_ms: float = 5.0) -> RouteSolution:
+    """Order stops to minimise the open-path travel distance.
+
+    Small days are solved exactly. Larger ones start from the best
+    nearest-neighbour tour and improve it with 2-opt and Or-opt moves until
+    no move helps or ``time_budget_ms`` runs out, in which case the best
+    order found so far is returned with ``timed_out`` set. Days above
+    :data:`LOCAL_SEARCH_MAX_STOPS` only get the nearest-neighbour tour.
+    """
+    started = time.perf_counter()
+    deadline = started + time_budget_ms / 1000
+    array = np.asarray(dist, dtype=np.float64)
+    n = len(array)
+    if n <= 1:
+        return RouteSolution(order=list(range(n)), distance_km=0.0, solve_ms=0.0)
+    if n > LOCAL_SEARCH_MAX_STOPS:
+        order = _nearest_neighbour_array(array, deadline)
+        distance = float(array[order[:-1], order[1:]].sum())
+        timed_out = time.perf_counter() > deadline
+        elapsed = (time.perf_counter() - started) * 1000
+        return RouteSolution(order=order, distance_km=distance, solve_ms=elapsed, timed_out=timed_out)
+    matrix: List[List[float]] = array.tolist()
+    if n <= EXACT_MAX_STOPS:
+        best = min(permutations(range(n)), key=lambda order: path_length(order, matrix))
+        elapsed = (time.perf_counter() - started) * 1000
+        return RouteSolution(order=list(best), distance_km=path_length(best, matrix), solve_ms=elapsed)
+
+    starts = range(n) if n <= MULTI_START_MAX_STOPS else [0]
+    # The first start always runs (cut short at the deadline if need be) so
+    # there is a tour to return.
+    order = _nearest_neighbour(starts[0], matrix, deadline)
+    length = path_length(order, matrix)
+    for start in starts[1:]:
+        if time.perf_counter() > deadline:
+            break
+        candidate = _nearest_neighbour(start, matrix, deadline)
+        candidate_length = path_length(candidate, matrix)
+        if candidate_length < length:
+            order, length = candidate, candidate_length
+    while time.perf_counter() <= deadline:
+        if not (_two_opt_pass(order, matrix, deadline) or _or_opt_pass(order, matrix, deadline)):
+            break
+    timed_out = time.perf_counter() > deadline
+    elapsed = (time.perf_counter() - started) * 1000
+    return RouteSolution(order=order, distance_km=path_length(order, matrix), solve_ms=elapsed, timed_out=timed_out)
@@ -0,0 +1,119 @@
+"""Coalesce concurrent identical tool calls into one upstream request."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from .deadline import DeadlineExceeded, has_time_left
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlight:
+    """Let one caller per key do the work while concurrent callers wait for its result.
+
+    Flights are plain :class:`concurrent.futures.Future` objects, so a call
+    from a worker thread and a call from a task on any event loop can join
+    the same flight. The leader's result, or its exception, is handed to
+    every waiter, except that a :class:`DeadlineExceeded` only reaches waiters
+    whose own deadline has run out too: the others start a fresh flight, since
+    another run's budget says nothing about theirs. Counters are kept per
+    ``group`` (the tool name).
+    """
+
+    calls: Dict[str, int] = field(default_factory=dict, init=False)
+    coalesced: Dict[str, int] = field(default_factory=dict, init=False)
+    _flights: Dict[Hashable, "Future[Any]"] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def _join(self, group: str, key: Hashable) -> Tuple["Future[Any]", bool]:
+        with self._lock:
+            self.calls[group] = self.calls.get(group, 0) + 1
+            flight = self._flights.get((group, key))
+            if flight is not None:
+                self.coalesced[group] = self.coalesced.get(group, 0) + 1
+                return flight, False
+            flight = self._flights[(group, key)] = Future()
+            return flight, True
+
+    def _land(self, group: str, key: Hashable, flight: "Future[Any]") -> None:
+        with self._lock:
+            if self._flights.get((group, key)) is flight:
+                del self._flights[(group, key)]
+
+    def do(self, group: str, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless an identical call is in flight, then share its outcome."""
+        while True:
+            flight, leader = self._join(group, key)
+            if leader:
+                break
+            try:
+                return flight.result()
+            except CancelledError:
+                # The leader was cancelled, not this caller: start a fresh flight.
+                continue
+            except DeadlineExceeded:
+                if has_time_left():
+                    continue
+                raise
+        try:
+            value = fn()
+        except BaseException as exc:
+            self._land(group, key, flight)
+            flight.set_exception(exc)
+            raise
+        self._land(group, key, flight)
+        flight.set_result(value)
+        return value
+
+    async def do_async(self, group: str, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async counterpart of :meth:`do`; waiting never blocks the event loop."""
+        while True:
+            flight, leader = self._join(group, key)
+            if leader:
+                break
+            # Shielded so that cancelling this waiter leaves the shared flight alone.
+            try:
+                return await asyncio.shield(asyncio.wrap_future(flight))
+            except asyncio.CancelledError:
+                if flight.cancelled():
+                    continue
+                raise
+            except DeadlineExceeded:
+                if has_time_left():
+                    continue
+                raise
+        try:
+            value = await fn()
+        except asyncio.CancelledError:
+            self._land(group, key, flight)
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            self._land(group, key, flight)
+            flight.set_exception(exc)
+            raise
+        self._land(group, key, flight)
+        flight.set_result(value)
+        return value
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return total and coalesced call counts per group."""
+        with self._lock:
+            return {
+                group: {"calls": calls, "coalesced": self.coalesced.get(group, 0)}
+                for group, calls in self.calls.items()
+            }
+
+
+_flights = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide single-flight registry used by the cached tools."""
+    return _flights
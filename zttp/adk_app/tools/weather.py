@@ -2,24 +2,147 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-import requests
+from .cache import cached_tool
+from .http_client import get_async_http_client, get_http_client
 
+BASE_URL = "https://api.open-meteo.com/v1/forecast"
+# Coordinates are rounded to ~1 km for cache keys; forecasts do not differ below that.
+CACHE_COORD_PRECISION = 2
+DAILY_FIELDS = "temperature_2m_max,temperature_2m_min,precipitation_probability_max"
+# Open-Meteo forecasts today plus the next 15 days; later dates are rejected.
+FORECAST_HORIZON_DAYS = 16
 
+
+def _cache_key(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **params,
+        "lat": round(float(params["lat"]), CACHE_COORD_PRECISION),
+        "lon": round(float(params["lon"]), CACHE_COORD_PRECISION),
+    }
+
+
+def _forecast_params(lat: float, lon: float, date_iso: str) -> Dict[str, Any]:
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "daily": DAILY_FIELDS,
+        "timezone": "auto",
+        "start_date": date_iso,
+        "end_date": date_iso,
+    }
+
+
+@cached_tool("weather_forecast", normalize=_cache_key)
 def weather_forecast(lat: float, lon: float, date_iso: str) -> Dict[str, Any]:
-    response = requests.get(
-        "https://api.open-meteo.com/v1/forecast",
-        params={
-            "latitude": lat,
-            "longitude": lon,
-            "daily": "temperature_2m_max,temperature_2m_min,precipitation_probability_max",
-            "timezone": "auto",
-            "start_date": date_iso,
-            "end_date": date_iso,
-        },
-        timeout=15,
-    )
-    response.raise_for_status()
-    return response.json().get("daily", {})
+    payload = get_http_client().get_json(BASE_URL, params=_forecast_params(lat, lon, date_iso))
+    return payload.get("daily", {})
+
+
+@cached_tool("weather_forecast", normalize=_cache_key)
+async def weather_forecast_async(lat: float, lon: float, date_iso: str) -> Dict[str, Any]:
+    """Non-blocking :func:`weather_forecast`; both share cache entries."""
+    payload = await get_async_http_client().get_json(BASE_URL, params=_forecast_params(lat, lon, date_iso))
+    return payload.get("daily", {})
+
+
+def _range_cache_key(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **params,
+        "locations": [
+            [round(float(lat), CACHE_COORD_PRECISION), round(float(lon), CACHE_COORD_PRECISION)]
+            for lat, lon in params["locations"]
+        ],
+    }
+
+
+def _range_window(start_iso: str, days: int) -> Optional[Tuple[str, str]]:
+    """Clamp the trip to the forecast horizon; ``None`` when it starts beyond it."""
+    start = date.fromisoformat(start_iso)
+    end = start + timedelta(days=max(days, 1) - 1)
+    last = date.today() + timedelta(days=FORECAST_HORIZON_DAYS - 1)
+    if start > last:
+        return None
+    return start_iso, min(end, last).isoformat()
+
+
+def _range_params(locations: Sequence[Tuple[float, float]], start_iso: str, end_iso: str) -> Dict[str, Any]:
+    return {
+        "latitude": ",".join(str(lat) for lat, _ in locations),
+        "longitude": ",".join(str(lon) for _, lon in locations),
+        "daily": DAILY_FIELDS,
+        "timezone": "auto",
+        "start_date": start_iso,
+        "end_date": end_iso,
+    }
+
+
+def _range_dailies(payload: Any) -> List[Dict[str, Any]]:
+    # Open-Meteo answers a single location with an object and several with a list.
+    entries = payload if isinstance(payload, list) else [payload]
+    return [entry.get("daily", {}) for entry in entries]
+
+
+@cached_tool("weather_range", normalize=_range_cache_key)
+def _fetch_range(locations: Sequence[Tuple[float, float]], start_iso: str, end_iso: str) -> List[Dict[str, Any]]:
+    payload = get_http_client().get_json(BASE_URL, params=_range_params(locations, start_iso, end_iso))
+    return _range_dailies(payload)
+
+
+@cached_tool("weather_range", normalize=_range_cache_key)
+async def _fetch_range_async(
+    locations: Sequence[Tuple[float, float]], start_iso: str, end_iso: str
+) -> List[Dict[str, Any]]:
+    payload = await get_async_http_client().get_json(BASE_URL, params=_range_params(locations, start_iso, end_iso))
+    return _range_dailies(payload)
+
+
+def weather_range(
+    locations: Sequence[Tuple[float, float]], start_iso: str, days: int, *, use_cache: bool = True
+) -> List[Dict[str, Any]]:
+    """Daily forecasts for ``days`` days from ``start_iso`` at every ``(lat, lon)``, in one request.
+
+    Returns one compact ``daily`` mapping per location, in input order, with
+    parallel ``time``/temperature/precipitation arrays covering the range.
+    Days past the forecast horizon are left out (a trip that starts beyond
+    it gets empty mappings without a request). Responses are cached under
+    the clamped window, so a range picks up new days as they come into the
+    horizon and an out-of-range trip is never cached as empty.
+    """
+    if not locations:
+        raise ValueError("weather_range needs at least one location")
+    window = _range_window(start_iso, days)
+    if window is None:
+        return [{} for _ in locations]
+    return _fetch_range(locations, *window, use_cache=use_cache)
+
+
+async def weather_range_async(
+    locations: Sequence[Tuple[float, float]], start_iso: str, days: int, *, use_cache: bool = True
+) -> List[Dict[str, Any]]:
+    """Non-blocking :func:`weather_range`; both share cache entries."""
+    if not locations:
+        raise ValueError("weather_range needs at least one location")
+    window = _range_window(start_iso, days)
+    if window is None:
+        return [{} for _ in locations]
+    return await _fetch_range_async(locations, *window, use_cache=use_cache)
+
 
+def forecast_by_date(daily: Dict[str, Any] | None) -> Dict[str, Dict[str, Any]]:
+    """Pivot a ``daily`` mapping into ``{date: {"temp_max", "temp_min", "precipitation"}}``."""
+    if not daily:
+        return {}
+    highs = daily.get("temperature_2m_max") or []
+    lows = daily.get("temperature_2m_min") or []
+    rain = daily.get("precipitation_probability_max") or []
+    return {
+        day: {
+            "temp_max": highs[i] if i < len(highs) else None,
+            "temp_min": lows[i] if i < len(lows) else None,
+            "precipitation": rain[i] if i < len(rain) else None,
+        }
+        for i, day in enumerate(daily.get("time") or [])
+    }
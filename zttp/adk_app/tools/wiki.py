@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-import requests
+from .cache import cached_tool
+from .deadline import DeadlineExceeded
+from .http_client import get_async_http_client, get_http_client
 
 BASE_URL = "https://en.wikipedia.org/w/api.php"
 
 
+@cached_tool("wiki_search")
 def wiki_search(query: str, limit: int = 5) -> List[Dict[str, str]]:
-    response = requests.get(
+    payload = get_http_client().get_json(
         BASE_URL,
         params={
             "action": "query",
@@ -19,15 +22,19 @@ def wiki_search(query: str, limit: int = 5) -> List[Dict[str, str]]:
             "format": "json",
             "srlimit": limit,
         },
-        timeout=15,
     )
-    response.raise_for_status()
-    data = response.json().get("query", {}).get("search", [])
+    data = payload.get("query", {}).get("search", [])
     return [{"title": item["title"], "snippet": item.get("snippet", "")} for item in data]
 
 
+@cached_tool("wiki_page")
 def wiki_page(title: str) -> Dict[str, str]:
-    response = requests.get(
+    """Fetch the complete plain-text article.
+
+    This is the opt-in full-text path; use :func:`wiki_pages` or
+    :func:`wiki_search_extracts` when only a summary is needed.
+    """
+    payload = get_http_client().get_json(
         BASE_URL,
         params={
             "action": "query",
@@ -36,10 +43,197 @@ def wiki_page(title: str) -> Dict[str, str]:
             "titles": title,
             "format": "json",
         },
-        timeout=15,
     )
-    response.raise_for_status()
-    pages = response.json().get("query", {}).get("pages", {})
+    pages = payload.get("query", {}).get("pages", {})
     page = next(iter(pages.values()), {})
     return {"title": page.get("title", title), "text": page.get("extract", "")}
 
+
+# MediaWiki returns at most 20 intro extracts per request (``exlimit=max``).
+EXTRACTS_PER_REQUEST = 20
+# Default cap applied to each summary extract after decoding.
+SUMMARY_MAX_BYTES = 1024
+# Continuation keys for page props we request; search-result paging is not followed.
+_PROP_CONTINUATIONS = ("excontinue", "cocontinue")
+
+
+def _summary_params(sentences: Optional[int]) -> Dict[str, object]:
+    params: Dict[str, object] = {"prop": "extracts", "exintro": True, "explaintext": True, "exlimit": "max"}
+    if sentences:
+        params["exsentences"] = max(1, min(10, sentences))
+    return params
+
+
+def _cap_bytes(text: str, max_bytes: Optional[int]) -> str:
+    """Trim ``text`` to at most ``max_bytes`` UTF-8 bytes without splitting a character."""
+    if max_bytes is None:
+        return text
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+    return encoded[:max_bytes].decode("utf-8", errors="ignore").rstrip()
+
+
+def _merge_pages(
+    payload: Dict[str, object], pages: Dict[str, Dict[str, object]], aliases: Dict[str, str]
+) -> Dict[str, object]:
+    """Fold one response into ``pages``/``aliases`` and return its continuation."""
+    query = payload.get("query", {})
+    for mapping in query.get("normalized", []) + query.get("redirects", []):
+        aliases[mapping["from"]] = mapping["to"]
+    for key, page in query.get("pages", {}).items():
+        merged = pages.setdefault(key, {})
+        merged.update({k: v for k, v in page.items() if v not in ("", None)})
+    continuation = payload.get("continue", {})
+    return continuation if any(key in continuation for key in _PROP_CONTINUATIONS) else {}
+
+
+def _query_pages(params: Dict[str, object]) -> Tuple[Dict[str, Dict[str, object]], Dict[str, str]]:
+    """Run a ``prop=extracts`` query, following prop continuations until all pages are complete.
+
+    Returns the merged pages plus a map of normalized/redirected titles to the
+    title the page was finally resolved to.
+    """
+    pages: Dict[str, Dict[str, object]] = {}
+    aliases: Dict[str, str] = {}
+    continuation: Dict[str, object] = {}
+    while True:
+        payload = get_http_client().get_json(BASE_URL, params={**params, **continuation})
+        continuation = _merge_pages(payload, pages, aliases)
+        if not continuation:
+            return pages, aliases
+
+
+async def _query_pages_async(params: Dict[str, object]) -> Tuple[Dict[str, Dict[str, object]], Dict[str, str]]:
+    """Non-blocking variant of :func:`_query_pages`."""
+    pages: Dict[str, Dict[str, object]] = {}
+    aliases: Dict[str, str] = {}
+    continuation: Dict[str, object] = {}
+    while True:
+        try:
+            payload = await get_async_http_client().get_json(BASE_URL, params={**params, **continuation})
+        except DeadlineExceeded as exc:
+            # Hand back the batches that did arrive before the cut. The caught
+            # exception may be shared with other callers, so it is left as is.
+            raise DeadlineExceeded(str(exc), partial=(pages, aliases) if pages else None) from exc
+        continuation = _merge_pages(payload, pages, aliases)
+        if not continuation:
+            return pages, aliases
+
+
+def _resolve(title: str, aliases: Dict[str, str]) -> str:
+    seen = {title}
+    while title in aliases and aliases[title] not in seen:
+        title = aliases[title]
+        seen.add(title)
+    return title
+
+
+@cached_tool("wiki_pages")
+def wiki_pages(
+    titles: Sequence[str], *, sentences: Optional[int] = None, max_bytes: Optional[int] = SUMMARY_MAX_BYTES
+) -> List[Dict[str, str]]:
+    """Fetch intro extracts for many titles, batching up to 20 titles per request.
+
+    ``sentences`` limits each extract server-side (1-10 sentences) and
+    ``max_bytes`` caps it client-side. Results follow the order of ``titles``;
+    missing pages come back with empty text.
+    """
+    by_title: Dict[str, str] = {}
+    aliases: Dict[str, str] = {}
+    for start in range(0, len(titles), EXTRACTS_PER_REQUEST):
+        chunk = titles[start : start + EXTRACTS_PER_REQUEST]
+        pages, chunk_aliases = _query_pages(
+            {
+                "action": "query",
+                **_summary_params(sentences),
+                "titles": "|".join(chunk),
+                "redirects": True,
+                "format": "json",
+            }
+        )
+        aliases.update(chunk_aliases)
+        for page in pages.values():
+            by_title[str(page.get("title", ""))] = str(page.get("extract", ""))
+    results = []
+    for title in titles:
+        resolved = _resolve(title, aliases)
+        results.append({"title": resolved, "text": _cap_bytes(by_title.get(resolved, ""), max_bytes)})
+    return results
+
+
+def _search_extracts_params(
+    query: str, limit: int, sentences: Optional[int], coordinates: bool
+) -> Dict[str, object]:
+    params: Dict[str, object] = {
+        "action": "query",
+        "generator": "search",
+        "gsrsearch": query,
+        "gsrlimit": limit,
+        **_summary_params(sentences),
+        "format": "json",
+    }
+    if coordinates:
+        params["prop"] = "extracts|coordinates"
+        params["colimit"] = "max"
+    return params
+
+
+def _ranked_extracts(pages: Dict[str, Dict[str, object]], max_bytes: Optional[int]) -> List[Dict[str, Any]]:
+    ranked = sorted(pages.values(), key=lambda page: int(page.get("index", 0)))
+    results: List[Dict[str, Any]] = []
+    for page in ranked:
+        entry: Dict[str, Any] = {
+            "title": str(page.get("title", "")),
+            "text": _cap_bytes(str(page.get("extract", "")), max_bytes),
+        }
+        coords = page.get("coordinates") or []
+        if coords:
+            entry["lat"] = float(coords[0]["lat"])
+            entry["lon"] = float(coords[0]["lon"])
+        results.append(entry)
+    return results
+
+
+@cached_tool("wiki_search_extracts")
+def wiki_search_extracts(
+    query: str,
+    limit: int = 5,
+    *,
+    sentences: Optional[int] = None,
+    max_bytes: Optional[int] = SUMMARY_MAX_BYTES,
+    coordinates: bool = True,
+) -> List[Dict[str, Any]]:
+    """Search and fetch intro extracts in one round trip via ``generator=search``.
+
+    Results are ordered by search rank. Limits above 20 cost one extra request
+    per additional 20 results for the extract continuation. ``sentences`` and
+    ``max_bytes`` bound each extract as in :func:`wiki_pages`. With
+    ``coordinates``, geotagged pages also carry ``lat``/``lon``.
+    """
+    pages, _ = _query_pages(_search_extracts_params(query, limit, sentences, coordinates))
+    return _ranked_extracts(pages, max_bytes)
+
+
+@cached_tool("wiki_search_extracts")
+async def wiki_search_extracts_async(
+    query: str,
+    limit: int = 5,
+    *,
+    sentences: Optional[int] = None,
+    max_bytes: Optional[int] = SUMMARY_MAX_BYTES,
+    coordinates: bool = True,
+) -> List[Dict[str, Any]]:
+    """Non-blocking :func:`wiki_search_extracts`; both share cache entries.
+
+    If the run's deadline cuts a continuation request, the
+    :class:`~adk_app.tools.deadline.DeadlineExceeded` carries the ranked
+    extracts received so far as ``partial`` (nothing is cached).
+    """
+    try:
+        pages, _ = await _query_pages_async(_search_extracts_params(query, limit, sentences, coordinates))
+    except DeadlineExceeded as exc:
+        if exc.partial is None:
+            raise
+        raise DeadlineExceeded(str(exc), partial=_ranked_extracts(exc.partial[0], max_bytes)) from exc
+    return _ranked_extracts(pages, max_bytes)
@@ -0,0 +1 @@
+"""Micro-benchmarks for ZTTP hot paths, runnable with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,176 @@
+"""Local stub of the public APIs used by the tools, for offline benchmarks."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
+from urllib.parse import parse_qs, urlparse
+
+from adk_app.tools import currency, weather, wiki
+
+
+@dataclass
+class StubStats:
+    connections: int = 0
+    requests: int = 0
+    bytes_sent: int = 0
+    base_url: str = ""
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def reset(self) -> None:
+        with self.lock:
+            self.connections = self.requests = self.bytes_sent = 0
+
+
+def _article(title: str, size: int) -> str:
+    intro = f"{title} is a well-known landmark. It attracts many visitors every year."
+    body = ("Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * (size // 56 + 1))[:size]
+    return f"{intro}\n\n== History ==\n{body}"
+
+
+def _mediawiki(params: Dict[str, str], article_bytes: int) -> Dict[str, Any]:
+    if params.get("list") == "search":
+        limit = int(params.get("srlimit", 5))
+        query = params.get("srsearch", "")
+        return {"query": {"search": [{"title": f"{query} #{i}", "snippet": ""} for i in range(limit)]}}
+    titles: List[str] = params.get("titles", "").split("|") if params.get("titles") else []
+    if params.get("generator") == "search":
+        limit = int(params.get("gsrlimit", 5))
+        query = params.get("gsrsearch", "")
+        titles = [f"{query} #{i}" for i in range(limit)]
+    intro_only = "exintro" in params
+    pages = {}
+    for index, title in enumerate(titles, start=1):
+        text = _article(title, article_bytes)
+        if intro_only:
+            text = text.split("\n", 1)[0]
+        if "exsentences" in params:
+            sentences = text.split(". ")
+            text = ". ".join(sentences[: int(params["exsentences"])])
+        pages[str(index)] = {"pageid": index, "title": title, "index": index, "extract": text}
+        if "coordinates" in params.get("prop", ""):
+            # Deterministic spread of ~30 km around a fixed city centre.
+            seed = zlib.crc32(title.encode("utf-8"))
+            lat = 12.97 + ((seed % 1000) / 1000 - 0.5) * 0.3
+            lon = 77.59 + (((seed // 1000) % 1000) / 1000 - 0.5) * 0.3
+            pages[str(index)]["coordinates"] = [{"lat": lat, "lon": lon, "primary": ""}]
+    return {"query": {"pages": pages}}
+
+
+def _weather(params: Dict[str, str]) -> Any:
+    start = date.fromisoformat(params["start_date"])
+    end = date.fromisoformat(params.get("end_date") or params["start_date"])
+    days = [(start + timedelta(days=offset)).isoformat() for offset in range((end - start).days + 1)]
+    daily = {
+        "time": days,
+        "temperature_2m_max": [24.0 for _ in days],
+        "temperature_2m_min": [16.0 for _ in days],
+        "precipitation_probability_max": [30 for _ in days],
+    }
+    locations = str(params.get("latitude", "")).split(",")
+    if len(locations) > 1:
+        return [{"latitude": float(lat), "daily": daily} for lat in locations]
+    return {"daily": daily}
+
+
+_EUR_RATES = {"USD": 1.1, "GBP": 0.85, "INR": 90.0, "JPY": 160.0, "CHF": 0.95}
+
+
+def _rates(params: Dict[str, str]) -> Dict[str, Any]:
+    base = params.get("base", "EUR").upper()
+    per_eur = {"EUR": 1.0, **_EUR_RATES}
+    return {
+        "base": base,
+        "date": date.today().isoformat(),
+        "rates": {code: units / per_eur[base] for code, units in per_eur.items() if code != base},
+    }
+
+
+@contextmanager
+def stub_server(
+    *,
+    handshake_delay: float = 0.0,
+    response_delay: float = 0.0,
+    article_bytes: int = 2_000,
+    straggler_every: int = 0,
+    straggler_delay: float = 0.0,
+) -> Iterator[StubStats]:
+    """Serve fake MediaWiki/Open-Meteo/exchangerate responses on localhost.
+
+    ``handshake_delay`` is slept once per accepted connection to stand in for
+    the TCP+TLS setup cost of the real public endpoints. With
+    ``straggler_every=N``, every Nth request is held for an extra
+    ``straggler_delay`` seconds.
+    """
+
+    stats = StubStats()
+    arrivals = itertools.count(1)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            super().setup()
+            with stats.lock:
+                stats.connections += 1
+            if handshake_delay:
+                time.sleep(handshake_delay)
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            if response_delay:
+                time.sleep(response_delay)
+            if straggler_every and next(arrivals) % straggler_every == 0:
+                time.sleep(straggler_delay)
+            url = urlparse(self.path)
+            params = {k: v[-1] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+            if url.path.endswith("/api.php"):
+                payload = _mediawiki(params, article_bytes)
+            elif url.path.endswith("/forecast"):
+                payload = _weather(params)
+            elif url.path.endswith("/latest"):
+                payload = _rates(params)
+            else:
+                payload = {"result": round(float(params.get("amount", 0)) * 1.1, 2)}
+            body = json.dumps(payload).encode("utf-8")
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                # The client gave up (deadline cut or losing hedge); not a served request.
+                self.close_connection = True
+                return
+            with stats.lock:
+                stats.requests += 1
+                stats.bytes_sent += len(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host = f"http://127.0.0.1:{server.server_address[1]}"
+    stats.base_url = host
+    originals = (wiki.BASE_URL, weather.BASE_URL, currency.RATES_URL)
+    wiki.BASE_URL = f"{host}/w/api.php"
+    weather.BASE_URL = f"{host}/v1/forecast"
+    currency.RATES_URL = f"{host}/latest"
+    try:
+        yield stats
+    finally:
+        wiki.BASE_URL, weather.BASE_URL, currency.RATES_URL = originals
+        server.shutdown()
+        server.server_close()
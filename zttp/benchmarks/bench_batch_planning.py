@@ -0,0 +1,60 @@
+"""Upstream requests and wall time: planning users one by one versus ``run_batch``.
+
+Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_batch_planning --users 24 --cities 3 --response-ms 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from adk_app.app import create_app
+from adk_app.tools.cache import configure_response_cache
+
+from ._stub import stub_server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=24)
+    parser.add_argument("--cities", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--response-ms", type=float, default=60.0)
+    args = parser.parse_args()
+
+    requests = [
+        {
+            "user_id": f"user-{index}",
+            "city": f"City {index % args.cities}",
+            "start_date": date(2024, 1, 1),
+            "duration_days": 2,
+            "pace": "balanced",
+            "weather_coordinates": {"lat": 10.0 + index % args.cities, "lon": 77.0},
+        }
+        for index in range(args.users)
+    ]
+    with tempfile.TemporaryDirectory() as tmp, stub_server(response_delay=args.response_ms / 1000) as stats:
+        app = create_app(Path(tmp))
+        configure_response_cache(bypass=True)
+
+        stats.reset()
+        start = time.perf_counter()
+        for request in requests:
+            app.run(request)
+        print(f"one-by-one: upstream_requests={stats.requests:<4} time={(time.perf_counter() - start) * 1000:8.1f}ms")
+
+        stats.reset()
+        start = time.perf_counter()
+        results = app.run_batch(requests, max_workers=args.workers)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        failed = sum(not result.ok for result in results)
+        print(f"run_batch:  upstream_requests={stats.requests:<4} time={elapsed_ms:8.1f}ms failed={failed}")
+
+
+if __name__ == "__main__":
+    main()
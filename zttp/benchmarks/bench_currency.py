@@ -0,0 +1,64 @@
+"""Budget conversion: one upstream call per amount vs. one cached rate table.
+
+Converts ``--amounts`` line items through the per-amount ``/convert``
+endpoint (the previous behaviour) and through ``convert_many``. Run from
+the ``zttp`` directory::
+
+    python -m benchmarks.bench_currency --amounts 50 --bulk 10000 --response-ms 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from adk_app.tools.cache import configure_response_cache
+from adk_app.tools.currency import convert_many, currency_convert
+from adk_app.tools.http_client import get_http_client
+
+from ._stub import stub_server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--amounts", type=int, default=50)
+    parser.add_argument("--bulk", type=int, default=10_000)
+    parser.add_argument("--response-ms", type=float, default=40.0)
+    args = parser.parse_args()
+    rng = random.Random(3)
+    amounts = [round(rng.uniform(5, 500), 2) for _ in range(max(args.amounts, args.bulk))]
+
+    with stub_server(response_delay=args.response_ms / 1000) as stats:
+        configure_response_cache()
+        client = get_http_client()
+        start = time.perf_counter()
+        for amount in amounts[: args.amounts]:
+            client.get_json(f"{stats.base_url}/convert", params={"from": "USD", "to": "INR", "amount": amount})
+        per_amount_ms = (time.perf_counter() - start) * 1000
+        print(f"per-amount /convert  amounts={args.amounts:<6} requests={stats.requests:<4} {per_amount_ms:9.2f}ms")
+
+        stats.reset()
+        start = time.perf_counter()
+        convert_many(amounts[: args.amounts], "USD", "INR")
+        cold_ms = (time.perf_counter() - start) * 1000
+        print(f"convert_many (cold)  amounts={args.amounts:<6} requests={stats.requests:<4} {cold_ms:9.2f}ms")
+
+        stats.reset()
+        start = time.perf_counter()
+        convert_many(amounts[: args.bulk], "USD", "INR")
+        bulk_us = (time.perf_counter() - start) * 1e6
+        print(f"convert_many (warm)  amounts={args.bulk:<6} requests={stats.requests:<4} {bulk_us / 1000:9.2f}ms")
+
+        start = time.perf_counter()
+        for amount in amounts[: args.bulk]:
+            currency_convert(amount, "GBP", "JPY")
+        loop_us = (time.perf_counter() - start) * 1e6
+        print(
+            f"currency_convert     amounts={args.bulk:<6} requests={stats.requests:<4} {loop_us / 1000:9.2f}ms "
+            f"({loop_us / args.bulk:.2f}us each, cross rate)"
+        )
+
+
+if __name__ == "__main__":
+    main()
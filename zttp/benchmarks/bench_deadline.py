@@ -0,0 +1,88 @@
+"""Plan latency with straggling upstream requests: no budget vs. a deadline vs. deadline + hedging.
+
+Every ``--straggler-every``-th stub request is held for ``--straggler-ms``.
+Plans run one after another with the response cache bypassed. Run from the
+``zttp`` directory::
+
+    python -m benchmarks.bench_deadline --plans 20 --budget-ms 500 --hedge-ms 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List
+
+from adk_app.app import create_app
+from adk_app.tools.cache import configure_response_cache
+
+from ._stub import stub_server
+
+COORDS = {"lat": 12.9716, "lon": 77.5946}
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plans", type=int, default=20)
+    parser.add_argument("--response-ms", type=float, default=40.0)
+    parser.add_argument("--straggler-every", type=int, default=5)
+    parser.add_argument("--straggler-ms", type=float, default=2000.0)
+    parser.add_argument("--budget-ms", type=float, default=500.0)
+    parser.add_argument("--hedge-ms", type=float, default=150.0)
+    args = parser.parse_args()
+
+    configs: List[tuple] = [
+        ("no budget", None, None),
+        (f"budget {args.budget_ms:.0f}ms", args.budget_ms, None),
+        (f"+ hedge at {args.hedge_ms:.0f}ms", args.budget_ms, args.hedge_ms),
+    ]
+    rows = []
+    for label, budget_ms, hedge_ms in configs:
+        with tempfile.TemporaryDirectory() as tmp, stub_server(
+            response_delay=args.response_ms / 1000,
+            straggler_every=args.straggler_every,
+            straggler_delay=args.straggler_ms / 1000,
+        ) as stats:
+            app = create_app(Path(tmp))
+            app.graph.hedge_after_ms = hedge_ms
+            configure_response_cache(bypass=True)
+            timings: List[float] = []
+            stops: List[int] = []
+            cut_plans = 0
+            for index in range(args.plans):
+                request: Dict[str, Any] = {
+                    "user_id": "bench",
+                    "city": f"Bench {index}",
+                    "start_date": date(2024, 1, 1),
+                    "duration_days": 2,
+                    "pace": "balanced",
+                    "weather_coordinates": COORDS,
+                    "latency_budget_ms": budget_ms,
+                }
+                start = time.perf_counter()
+                result = app.run(request)
+                timings.append((time.perf_counter() - start) * 1000)
+                stops.append(len(result["plan"]["stops"]))
+                cut_plans += bool(result["cut"])
+            app.graph.telemetry.close()
+            rows.append((label, timings, stops, cut_plans, stats.requests))
+
+    for label, timings, stops, cut_plans, requests in rows:
+        print(
+            f"{label:<20} p50={statistics.median(timings):7.1f}ms  p95={_percentile(timings, 0.95):7.1f}ms  "
+            f"max={max(timings):7.1f}ms  cut_plans={cut_plans:<3} mean_stops={statistics.mean(stops):4.1f}  "
+            f"upstream_requests={requests}"
+        )
+
+
+if __name__ == "__main__":
+    main()
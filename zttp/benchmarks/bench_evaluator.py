@@ -0,0 +1,93 @@
+"""Rubric throughput: per-plan evaluation and row-at-a-time writes vs. the batch path.
+
+Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_evaluator --plans 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from adk_app.agents import evaluator
+from adk_app.memory.sqlite_memory import SQLiteMemoryService
+
+
+def _legacy_meals(plan: Dict[str, Any]) -> bool:
+    """The previous has_two_meals check: two lower() calls per segment."""
+    return any(
+        "breakfast" in segment.get("activity", "").lower() or "lunch" in segment.get("activity", "").lower()
+        for day in plan.get("schedule", [])
+        for segment in day.get("segments", [])
+    )
+
+
+def _legacy_evaluate(plan: Dict[str, Any]) -> evaluator.EvaluationResult:
+    stops: List[Dict[str, Any]] = plan.get("stops", [])
+    rules = {
+        "has_two_meals": _legacy_meals(plan),
+        "covers_3_pois": len(stops) >= 3,
+        "weather_aware": bool(plan.get("weather_note")),
+        "budget_tagged": plan.get("budget") in {"low", "mid", "high"},
+        "no_duplicates": len({stop.get("title") for stop in stops}) == len(stops),
+        "has_sources": all(stop.get("source") for stop in stops),
+    }
+    return evaluator.EvaluationResult(score=sum(map(int, rules.values())), max=len(rules), rules=rules)
+
+
+def _plan(index: int, days: int = 3) -> Dict[str, Any]:
+    # Meal-free plans are the worst case: every segment is scanned.
+    return {
+        "schedule": [
+            {
+                "date": f"2024-01-{day + 1:02d}",
+                "segments": [{"slot": slot, "activity": f"Landmark {index}-{day}-{slot}"} for slot in range(5)],
+            }
+            for day in range(days)
+        ],
+        "stops": [{"title": f"Landmark {index}-{stop}", "source": "https://example.org"} for stop in range(6)],
+        "weather_note": "Sunny",
+        "budget": "mid",
+    }
+
+
+def _rate(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<28} {elapsed * 1000:9.1f}ms {count / elapsed:12,.0f} plans/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plans", type=int, default=20000)
+    args = parser.parse_args()
+    plans = [_plan(index) for index in range(args.plans)]
+    # Keep collector pauses from landing on whichever variant runs second.
+    gc.collect()
+    gc.disable()
+
+    start = time.perf_counter()
+    legacy = [_legacy_evaluate(plan) for plan in plans]
+    _rate("evaluate() per plan", len(plans), time.perf_counter() - start)
+    start = time.perf_counter()
+    batched = evaluator.evaluate_many(plans)
+    _rate("evaluate_many()", len(plans), time.perf_counter() - start)
+    gc.enable()
+    assert [result.rules for result in legacy] == [result.rules for result in batched]
+
+    rows = [(f"run-{index}", result.score, result.max, result.passed) for index, result in enumerate(batched)]
+    with tempfile.TemporaryDirectory() as tmp, SQLiteMemoryService(db_path=Path(tmp) / "bench.sqlite") as memory:
+        start = time.perf_counter()
+        for row in rows:
+            memory.record_rubric_scores([row])
+        _rate("rubric_scores row by row", len(rows), time.perf_counter() - start)
+        start = time.perf_counter()
+        memory.record_rubric_scores(rows)
+        _rate("rubric_scores one batch", len(rows), time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
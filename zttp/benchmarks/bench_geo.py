@@ -0,0 +1,104 @@
+"""Distance-matrix, nearest-neighbour and clustering timings for growing POI counts.
+
+Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_geo --sizes 100 1000 10000 --legacy-max 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from adk_app.tools.geo import (
+    GeoGridIndex,
+    coordinates_array,
+    haversine_condensed,
+    haversine_distance_km,
+    haversine_matrix,
+    kmeans_balanced,
+)
+
+
+def _legacy_matrix(points: Sequence[Dict[str, float]]) -> List[List[float]]:
+    """The previous implementation: one scalar haversine call per pair."""
+    matrix: List[List[float]] = []
+    for i, src in enumerate(points):
+        row = []
+        for j, dst in enumerate(points):
+            if i == j:
+                row.append(0.0)
+            else:
+                row.append(
+                    haversine_distance_km(src.get("lat", 0.0), src.get("lon", 0.0), dst.get("lat", 0.0), dst.get("lon", 0.0))
+                )
+        matrix.append(row)
+    return matrix
+
+
+def _ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--legacy-max", type=int, default=1000, help="skip the scalar matrix above this size")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--days", type=int, default=7, help="clusters for the balanced k-means run")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    for size in args.sizes:
+        # Points spread over a ~40 km metro area, the shape of a cached city.
+        points = [{"lat": 12.8 + rng.random() * 0.35, "lon": 77.4 + rng.random() * 0.4} for _ in range(size)]
+        coords = coordinates_array(points)
+        print(f"n={size}")
+
+        if size <= args.legacy_max:
+            start = time.perf_counter()
+            _legacy_matrix(points)
+            print(f"  legacy list-of-lists        {_ms(start):10.1f}ms")
+        else:
+            print("  legacy list-of-lists        skipped (quadratic; raise --legacy-max to run)")
+        for dtype in (np.float64, np.float32):
+            start = time.perf_counter()
+            matrix = haversine_matrix(coords, dtype=dtype)
+            print(f"  numpy matrix {np.dtype(dtype).name:<8}       {_ms(start):10.1f}ms  {matrix.nbytes / 2**20:8.1f} MiB")
+            del matrix
+        start = time.perf_counter()
+        condensed = haversine_condensed(coords, dtype=np.float32)
+        print(f"  numpy condensed float32     {_ms(start):10.1f}ms  {condensed.nbytes / 2**20:8.1f} MiB")
+        del condensed
+
+        start = time.perf_counter()
+        index = GeoGridIndex(coords, cell_deg=0.01)
+        print(f"  grid index build            {_ms(start):10.1f}ms")
+        probes = [(12.8 + rng.random() * 0.35, 77.4 + rng.random() * 0.4) for _ in range(args.queries)]
+        start = time.perf_counter()
+        for lat, lon in probes:
+            index.query_radius(lat, lon, 1.0)
+        print(f"  grid radius(1km) per query  {_ms(start) / args.queries:10.3f}ms")
+        start = time.perf_counter()
+        for lat, lon in probes:
+            index.query_knn(lat, lon, 5)
+        print(f"  grid knn(5) per query       {_ms(start) / args.queries:10.3f}ms")
+        start = time.perf_counter()
+        for lat, lon in probes[:20]:
+            sorted(
+                range(size), key=lambda j: haversine_distance_km(lat, lon, points[j]["lat"], points[j]["lon"])
+            )[:5]
+        print(f"  scalar scan knn(5) per query{_ms(start) / 20:10.3f}ms")
+
+        start = time.perf_counter()
+        labels = kmeans_balanced(coords, args.days)
+        sizes = np.bincount(labels)
+        print(f"  balanced k-means k={args.days:<3}     {_ms(start):10.1f}ms  sizes {sizes.min()}-{sizes.max()}")
+
+
+if __name__ == "__main__":
+    main()
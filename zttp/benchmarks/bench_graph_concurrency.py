@@ -0,0 +1,78 @@
+"""End-to-end plan latency with concurrent stages, and many plans on one event loop.
+
+Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_graph_concurrency --plans 5 --response-ms 80
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from adk_app.agents.researcher import ResearcherAgent
+from adk_app.app import create_app
+from adk_app.tools.cache import configure_response_cache
+from adk_app.tools.http_client import close_async_http_client
+from adk_app.tools.weather import weather_forecast
+
+from ._stub import stub_server
+
+COORDS = {"lat": 12.9716, "lon": 77.5946}
+
+
+def _timed(fn) -> float:  # type: ignore[no-untyped-def]
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+async def _multiplexed(app, requests) -> None:  # type: ignore[no-untyped-def]
+    try:
+        await asyncio.gather(*(app.run_async(request) for request in requests))
+    finally:
+        await close_async_http_client()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plans", type=int, default=5)
+    parser.add_argument("--response-ms", type=float, default=80.0)
+    parser.add_argument("--concurrent", type=int, default=16, help="plans multiplexed on one loop")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, stub_server(response_delay=args.response_ms / 1000):
+        app = create_app(Path(tmp))
+        configure_response_cache(bypass=True)
+        research_ms, weather_ms, plan_ms = [], [], []
+        for _ in range(args.plans):
+            research_ms.append(_timed(lambda: asyncio.run(ResearcherAgent().research(city="Bench"))))
+            weather_ms.append(_timed(lambda: weather_forecast(COORDS["lat"], COORDS["lon"], "2024-01-01")))
+            request = {
+                "user_id": "bench",
+                "city": "Bench",
+                "start_date": date(2024, 1, 1),
+                "duration_days": 2,
+                "pace": "balanced",
+                "weather_coordinates": COORDS,
+            }
+            plan_ms.append(_timed(lambda: app.run(request)))
+        batch = [
+            {**request, "user_id": f"bench-{index}", "city": f"Bench {index}"} for index in range(args.concurrent)
+        ]
+        multiplexed_ms = _timed(lambda: asyncio.run(_multiplexed(app, batch)))
+    research, weather = statistics.mean(research_ms), statistics.mean(weather_ms)
+    print(f"research branch  mean={research:7.1f}ms")
+    print(f"weather branch   mean={weather:7.1f}ms")
+    print(f"sum of branches       {research + weather:7.1f}ms")
+    print(f"full plan (DAG)  mean={statistics.mean(plan_ms):7.1f}ms")
+    print(f"{args.concurrent} plans on one loop (max_concurrency={app.max_concurrency}): {multiplexed_ms:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""History and telemetry queries before and after the index migration.
+
+Fills a schema-v1 database (no secondary indexes) with ``--rows`` itineraries
+and telemetry spans, times the common read paths, then runs the migrations
+and times them again. Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_history_queries --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from adk_app.memory.migrations import current_version, migrate
+from adk_app.memory.sqlite_memory import SQLiteMemoryService
+from adk_app.telemetry.query import fetch_spans
+
+_T0 = 1_700_000_000.0
+_AGENTS = {
+    "planner": ("skeleton",),
+    "researcher": ("wiki_search", "wiki_extracts"),
+    "weather": ("weather_range",),
+    "scheduler": ("route",),
+}
+
+
+class _Unmigrated(SQLiteMemoryService):
+    """Leave the schema where the benchmark put it, so v1 can be measured."""
+
+    def ensure_schema(self) -> None:
+        pass
+
+
+def _fill(conn: sqlite3.Connection, rows: int, users: int, spans_per_run: int) -> None:
+    rng = random.Random(7)
+    pairs = [(agent, tool) for agent, tools in _AGENTS.items() for tool in tools]
+    with conn:
+        conn.executemany(
+            "INSERT INTO itineraries(user_id, city, start_date, duration_days, artifact_path) VALUES(?, ?, ?, ?, ?)",
+            (
+                (f"user-{rng.randrange(users)}", f"City {i % 500}", "2026-05-01", 3, f"artifacts/plan-{i}.md")
+                for i in range(rows)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO telemetry(run_id, agent, tool, start_ts, end_ts, latency_ms, error) VALUES(?, ?, ?, ?, ?, ?, ?)",
+            (
+                (f"run-{i // spans_per_run}", *pairs[i % len(pairs)], _T0 + i * 0.5, _T0 + i * 0.5 + 0.04, 40, None)
+                for i in range(rows)
+            ),
+        )
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def _offset_page(conn: sqlite3.Connection, user_id: str, limit: int, offset: int) -> List[tuple]:
+    return conn.execute(
+        "SELECT id, city, start_date, duration_days, artifact_path FROM itineraries "
+        "WHERE user_id = ? ORDER BY id DESC LIMIT ? OFFSET ?",
+        (user_id, limit, offset),
+    ).fetchall()
+
+
+def _cases(service: SQLiteMemoryService, conn: sqlite3.Connection, args: argparse.Namespace) -> Dict[str, float]:
+    user = "user-3"
+    deep = args.rows // args.users // 2
+    # The keyset cursor that lands on the same page as OFFSET ``deep``.
+    cursor = conn.execute(
+        "SELECT id FROM itineraries WHERE user_id = ? ORDER BY id DESC LIMIT 1 OFFSET ?", (user, deep - 1)
+    ).fetchone()[0]
+    run_id = f"run-{args.rows // args.spans_per_run // 2}"
+    since = _T0 + args.rows * 0.45
+    return {
+        "last 5 itineraries": _time(lambda: service.fetch_last_itineraries(user), args.repeat),
+        f"page at offset {deep} (OFFSET)": _time(lambda: _offset_page(conn, user, 20, deep), args.repeat),
+        f"page at offset {deep} (keyset)": _time(
+            lambda: service.fetch_itinerary_page(user, limit=20, before_id=cursor), args.repeat
+        ),
+        "spans for one run_id": _time(lambda: fetch_spans(conn, run_id=run_id), args.repeat),
+        "agent/tool time window": _time(
+            lambda: fetch_spans(conn, agent="researcher", tool="wiki_search", since=since), args.repeat
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--spans-per-run", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "zttp.sqlite"
+        conn = sqlite3.connect(db_path)
+        migrate(conn, target=1)
+        start = time.perf_counter()
+        _fill(conn, args.rows, args.users, args.spans_per_run)
+        print(f"filled {args.rows} itineraries and spans in {time.perf_counter() - start:.1f}s")
+        conn.close()
+
+        service = _Unmigrated(db_path=db_path)
+        conn = service._connection
+        before = _cases(service, conn, args)
+        start = time.perf_counter()
+        applied = migrate(conn)
+        print(f"migrated to v{current_version(conn)} (applied {applied}) in {time.perf_counter() - start:.1f}s")
+        after = _cases(service, conn, args)
+        service.close()
+
+    print(f"{'query':<32}{'v1 (no indexes)':>18}{'latest':>12}")
+    for label, elapsed in before.items():
+        print(f"{label:<32}{elapsed:>16.2f}ms{after[label]:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Compare bare ``requests.get`` with the shared pooled client per simulated plan.
+
+Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_http_pool --plans 20 --handshake-ms 25
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+import requests
+
+from adk_app.tools import currency, weather, wiki
+from adk_app.tools.cache import configure_response_cache
+from adk_app.tools.http_client import configure_http_client
+
+from ._stub import StubStats, stub_server
+
+POIS_PER_PLAN = 6
+
+
+def _bare_get(url: str, params: Dict[str, object]) -> Dict[str, object]:
+    response = requests.get(url, params=params, timeout=15)
+    response.raise_for_status()
+    return response.json()
+
+
+def _plan_unpooled(pool: ThreadPoolExecutor) -> None:
+    results = _bare_get(
+        wiki.BASE_URL,
+        {"action": "query", "list": "search", "srsearch": "Bench", "format": "json", "srlimit": POIS_PER_PLAN},
+    )
+    titles = [item["title"] for item in results["query"]["search"]]
+    list(
+        pool.map(
+            lambda t: _bare_get(
+                wiki.BASE_URL,
+                {"action": "query", "prop": "extracts", "explaintext": True, "titles": t, "format": "json"},
+            ),
+            titles,
+        )
+    )
+    _bare_get(weather.BASE_URL, {"latitude": 1.0, "longitude": 2.0, "start_date": "2024-01-01", "end_date": "2024-01-01"})
+    _bare_get(currency.RATES_URL, {"base": currency.TABLE_BASE})
+
+
+def _plan_pooled(pool: ThreadPoolExecutor) -> None:
+    titles = [item["title"] for item in wiki.wiki_search("Bench", limit=POIS_PER_PLAN)]
+    list(pool.map(wiki.wiki_page, titles))
+    weather.weather_forecast(1.0, 2.0, "2024-01-01")
+    currency.currency_convert(10, "USD", "EUR")
+
+
+def _measure(label: str, plan: Callable[[ThreadPoolExecutor], None], stats: StubStats, plans: int) -> None:
+    stats.reset()
+    timings: List[float] = []
+    with ThreadPoolExecutor(max_workers=POIS_PER_PLAN) as pool:
+        for _ in range(plans):
+            start = time.perf_counter()
+            plan(pool)
+            timings.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{label:<10} plans={plans:<4} requests={stats.requests:<5} connections={stats.connections:<5} "
+        f"mean={statistics.mean(timings):7.2f}ms p50={statistics.median(timings):7.2f}ms "
+        f"max={max(timings):7.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plans", type=int, default=20)
+    parser.add_argument("--handshake-ms", type=float, default=25.0, help="simulated TCP+TLS setup per connection")
+    args = parser.parse_args()
+
+    configure_http_client(pool_maxsize=POIS_PER_PLAN)
+    configure_response_cache(bypass=True)
+    with stub_server(handshake_delay=args.handshake_ms / 1000) as stats:
+        _measure("unpooled", _plan_unpooled, stats, args.plans)
+        _measure("pooled", _plan_pooled, stats, args.plans)
+
+
+if __name__ == "__main__":
+    main()
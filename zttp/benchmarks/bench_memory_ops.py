@@ -0,0 +1,70 @@
+"""Memory-service operations per second under several threads.
+
+Compares the previous connect-per-call pattern with the pooled WAL connections.
+Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_memory_ops --ops 2000 --threads 1 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from adk_app.memory.sqlite_memory import SQLiteMemoryService
+
+
+class _ConnectPerCall(SQLiteMemoryService):
+    """The previous behaviour: a fresh, never-closed connection per access."""
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+
+def _workload(service: SQLiteMemoryService, worker: int, ops: int) -> None:
+    user_id = f"user-{worker % 16}"
+    for op in range(ops):
+        # Roughly the mix of one plan: a profile read, history read, one write.
+        if op % 3 == 0:
+            service.record_itinerary(
+                user_id=user_id, city="Bench", start_date="2024-01-01", duration_days=1, artifact_path="x.md"
+            )
+        elif op % 3 == 1:
+            service.get_user_profile(user_id)
+        else:
+            service.fetch_last_itineraries(user_id)
+
+
+def _measure(label: str, factory: Callable[[Path], SQLiteMemoryService], ops: int, threads: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        service = factory(Path(tmp) / "bench.sqlite")
+        for index in range(16):
+            service.upsert_user_profile(f"user-{index}", budget_tier="mid", pace_preference="balanced", must_avoid="")
+        per_thread = ops // threads
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(lambda worker: _workload(service, worker, per_thread), range(threads)))
+        elapsed = time.perf_counter() - start
+        if hasattr(service, "close"):
+            service.close()
+    print(f"{label:<18} threads={threads:<3} ops={per_thread * threads:<6} {per_thread * threads / elapsed:9.0f} ops/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+    for threads in args.threads:
+        _measure("connect-per-call", lambda path: _ConnectPerCall(db_path=path), args.ops, threads)
+        _measure("pooled-wal", lambda path: SQLiteMemoryService(db_path=path), args.ops, threads)
+
+
+if __name__ == "__main__":
+    main()
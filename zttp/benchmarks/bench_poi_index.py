@@ -0,0 +1,88 @@
+"""Research latency: live MediaWiki search vs. the local FTS5 POI index.
+
+Loads a synthetic dump of ``--cities`` cities, then researches known cities
+with the index and with live calls (response cache bypassed). Run from the
+``zttp`` directory::
+
+    python -m benchmarks.bench_poi_index --cities 1000 --response-ms 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from adk_app.agents.researcher import ResearcherAgent
+from adk_app.memory.poi_index import POIIndex
+from adk_app.tools.cache import configure_response_cache
+
+from ._stub import stub_server
+
+
+_KINDS = ("museum", "park", "monument", "market", "temple", "gallery", "garden", "palace")
+
+
+def _dump(cities: int, per_city: int) -> Iterator[Dict[str, Any]]:
+    for city in range(cities):
+        for index in range(per_city):
+            yield {
+                "city": f"City {city}",
+                "title": f"Landmark {city}-{index}",
+                "summary": f"Landmark {index} is a well-known {_KINDS[index % len(_KINDS)]} in City {city}.",
+                "lat": 10.0 + city / 100,
+                "lon": 20.0 + index / 100,
+            }
+
+
+def _timed_research(agent: ResearcherAgent, cities: List[str], **kwargs: Any) -> List[float]:
+    async def _run() -> List[float]:
+        timings = []
+        for city in cities:
+            start = time.perf_counter()
+            await agent.research(city=city, **kwargs)
+            timings.append((time.perf_counter() - start) * 1000)
+        return timings
+
+    return asyncio.run(_run())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cities", type=int, default=1000)
+    parser.add_argument("--per-city", type=int, default=48)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--response-ms", type=float, default=40.0)
+    args = parser.parse_args()
+    cities = [f"City {index * 7 % args.cities}" for index in range(args.queries)]
+
+    with tempfile.TemporaryDirectory() as tmp, stub_server(response_delay=args.response_ms / 1000) as stats:
+        index = POIIndex(db_path=Path(tmp) / "poi_index.sqlite")
+        start = time.perf_counter()
+        loaded = index.load(_dump(args.cities, args.per_city))
+        print(f"bulk load: {loaded} POIs in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+        runs = []
+        for label, agent, kwargs in (
+            ("live wiki", ResearcherAgent(), {}),
+            ("index", ResearcherAgent(index=index), {}),
+            ("index + FTS focus", ResearcherAgent(index=index), {"focus": "museum"}),
+        ):
+            configure_response_cache(bypass=agent.index is None)
+            stats.reset()
+            runs.append((label, _timed_research(agent, cities, **kwargs), stats.requests))
+        index.close()
+
+    for label, timings, requests in runs:
+        print(
+            f"{label:<18} p50={statistics.median(timings):7.2f}ms  max={max(timings):7.2f}ms  "
+            f"upstream_requests={requests}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Markdown export: join-and-write vs. streamed, atomic, skip-if-unchanged writes.
+
+Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_presenter --days 90 --segments 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from adk_app.agents.presenter import PresenterAgent
+
+
+def _plan(days: int, segments: int) -> Dict[str, Any]:
+    summary = "A well-known landmark that attracts many visitors every year. " * 4
+    return {
+        "schedule": [
+            {
+                "date": f"day-{day}",
+                "city": "Bench",
+                "segments": [
+                    {"slot": "morning", "activity": f"Stop {day}-{index}", "summary": summary}
+                    for index in range(segments)
+                ],
+            }
+            for day in range(days)
+        ],
+        "stops": [{"title": f"Stop {index}", "summary": summary, "source": "https://example.org"} for index in range(days)],
+        "checklist": {"packing": ["Water bottle"], "tasks": ["Book tickets"]},
+        "weather_note": "Sunny",
+    }
+
+
+def _join_and_write(presenter: PresenterAgent, path: Path, plan: Dict[str, Any]) -> None:
+    """The previous behaviour: build the whole document, then write_text unconditionally."""
+    path.write_text("".join(list(presenter.render(**plan))), encoding="utf-8")
+
+
+def _measure(label: str, write: Callable[[], Any], repeats: int) -> None:
+    write()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        write()
+    elapsed = (time.perf_counter() - start) / repeats
+    # Peak memory from one separate, traced write; tracing would skew the timings.
+    tracemalloc.start()
+    write()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<30} {elapsed * 1000:8.2f}ms/write  peak={peak / 1024:8.1f} KiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--segments", type=int, default=12)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    plan: Dict[str, Any] = _plan(args.days, args.segments)
+    changing: List[int] = [0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        presenter = PresenterAgent(output_dir=tmp)
+        path = Path(tmp) / "bench.md"
+
+        def _changed() -> str:
+            changing[0] += 1
+            return presenter.present(filename="bench.md", **{**plan, "weather_note": f"Sunny {changing[0]}"})
+
+        _measure("join + write_text", lambda: _join_and_write(presenter, path, plan), args.repeats)
+        _measure("streamed, content changed", _changed, args.repeats)
+        _measure("streamed, content unchanged", lambda: presenter.present(filename="bench.md", **plan), args.repeats)
+        print(f"document size: {path.stat().st_size / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
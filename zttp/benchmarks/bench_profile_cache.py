@@ -0,0 +1,80 @@
+"""Profile lookups: SQLite on every call vs. the in-process LRU cache.
+
+Replays ``--lookups`` skewed profile reads (a few users plan most often,
+some ids are unknown) and loads a batch's profiles one by one vs. with
+``get_user_profiles``. Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_profile_cache --users 5000 --lookups 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from adk_app.memory.profile_cache import ProfileCache
+from adk_app.memory.sqlite_memory import SQLiteMemoryService
+
+
+def _workload(users: int, lookups: int, unknown_share: float) -> List[str]:
+    rng = random.Random(11)
+    ids = []
+    for _ in range(lookups):
+        if rng.random() < unknown_share:
+            ids.append(f"ghost-{rng.randrange(users // 10 or 1)}")
+        else:
+            ids.append(f"user-{min(int(rng.paretovariate(1.2)) - 1, users - 1)}")
+    return ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--lookups", type=int, default=50_000)
+    parser.add_argument("--unknown-share", type=float, default=0.05)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--max-entries", type=int, default=1024)
+    args = parser.parse_args()
+    ids = _workload(args.users, args.lookups, args.unknown_share)
+    batch = [f"user-{index * 7 % args.users}" for index in range(args.batch)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "zttp.sqlite"
+        seed = SQLiteMemoryService(db_path=db_path)
+        for index in range(args.users):
+            seed.upsert_user_profile(f"user-{index}", budget_tier="mid", pace_preference="balanced", must_avoid="")
+        seed.close()
+
+        for label, cache in (
+            ("sqlite every call", ProfileCache(max_entries=0)),
+            ("lru cache", ProfileCache(max_entries=args.max_entries)),
+        ):
+            service = SQLiteMemoryService(db_path=db_path, profile_cache=cache)
+            start = time.perf_counter()
+            for user_id in ids:
+                service.get_user_profile(user_id)
+            elapsed = time.perf_counter() - start
+            stats = cache.stats()
+            print(
+                f"{label:<18} {len(ids) / elapsed:10.0f} lookups/s  hit_rate={stats['hit_rate']:.1%}  "
+                f"negative_hits={stats['negative_hits']}  evictions={stats['evictions']}"
+            )
+            service.close()
+
+        for label, load in (
+            ("one by one", lambda service: [service.get_user_profile(user_id) for user_id in batch]),
+            ("get_user_profiles", lambda service: service.get_user_profiles(batch)),
+        ):
+            service = SQLiteMemoryService(db_path=db_path, profile_cache=ProfileCache(max_entries=0))
+            start = time.perf_counter()
+            load(service)
+            print(f"batch of {len(batch)} {label:<18} {(time.perf_counter() - start) * 1000:8.2f}ms")
+            service.close()
+
+
+if __name__ == "__main__":
+    main()
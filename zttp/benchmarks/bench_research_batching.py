@@ -0,0 +1,55 @@
+"""Research latency versus ``max_results``: per-title fan-out against batched extracts.
+
+Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_research_batching --sizes 6 12 24 48 --response-ms 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from adk_app.agents.researcher import ResearcherAgent
+from adk_app.tools.cache import configure_response_cache
+from adk_app.tools.wiki import wiki_page, wiki_search
+
+from ._stub import stub_server
+
+
+async def _fanout_research(city: str, max_results: int) -> List[Dict[str, Any]]:
+    """The previous strategy: one search, then one extract request per title."""
+    loop = asyncio.get_running_loop()
+    results = wiki_search(f"{city} points of interest", limit=max_results)
+    return await asyncio.gather(*(loop.run_in_executor(None, wiki_page, r["title"]) for r in results))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[6, 12, 24, 48])
+    parser.add_argument("--response-ms", type=float, default=40.0, help="simulated server latency per request")
+    args = parser.parse_args()
+
+    configure_response_cache(bypass=True)
+
+    with stub_server(response_delay=args.response_ms / 1000) as stats:
+        for size in args.sizes:
+            stats.reset()
+            start = time.perf_counter()
+            asyncio.run(_fanout_research("Bench", size))
+            fanout_ms, fanout_requests = (time.perf_counter() - start) * 1000, stats.requests
+
+            stats.reset()
+            start = time.perf_counter()
+            asyncio.run(ResearcherAgent(max_results=size).research(city="Bench"))
+            batched_ms, batched_requests = (time.perf_counter() - start) * 1000, stats.requests
+            print(
+                f"max_results={size:<4} fan-out: {fanout_requests:>3} requests {fanout_ms:8.1f}ms | "
+                f"batched: {batched_requests:>2} requests {batched_ms:8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Bytes downloaded and peak memory per research run: full articles versus summaries.
+
+Each strategy runs once untimed first, so HTTP client set-up, imports and (for
+the async path) the event loop stay out of the numbers; the figures are per
+run, averaged over ``--iterations`` steady-state runs. Run from the ``zttp``
+directory::
+
+    python -m benchmarks.bench_research_payload --article-kb 200 --max-results 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from adk_app.agents.researcher import ResearcherAgent
+from adk_app.orchestration.background import run_blocking
+from adk_app.tools.cache import configure_response_cache
+from adk_app.tools.wiki import wiki_page, wiki_search
+
+from ._stub import StubStats, stub_server
+
+
+def _full_text_research(city: str, max_results: int) -> List[Dict[str, Any]]:
+    """The previous strategy: download whole articles and keep the first line."""
+    results = wiki_search(f"{city} points of interest", limit=max_results)
+    pages = [wiki_page(result["title"]) for result in results]
+    return [{"title": p["title"], "summary": p["text"].split("\n", 1)[0].strip()} for p in pages]
+
+
+def _summary_research(city: str, max_results: int) -> List[Dict[str, Any]]:
+    # The shared loop keeps the async client alive between runs, as app.run does.
+    return run_blocking(ResearcherAgent(max_results=max_results).research(city=city))["pois"]
+
+
+def _measure(
+    label: str, run: Callable[[str, int], Any], stats: StubStats, max_results: int, iterations: int
+) -> None:
+    run("Bench", max_results)  # warm-up: client, connection pool, lazy imports
+    stats.reset()
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        run("Bench", max_results)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / iterations
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<10} requests={stats.requests / iterations:<4.1f} "
+        f"downloaded={stats.bytes_sent / 1024 / iterations:9.1f} KiB "
+        f"peak_mem={peak / 1024:9.1f} KiB time={elapsed_ms:7.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--article-kb", type=int, default=200)
+    parser.add_argument("--max-results", type=int, default=6)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    configure_response_cache(bypass=True)
+
+    with stub_server(article_bytes=args.article_kb * 1024) as stats:
+        _measure("full-text", _full_text_research, stats, args.max_results, args.iterations)
+        _measure("summary", _summary_research, stats, args.max_results, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
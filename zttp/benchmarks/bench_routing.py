@@ -0,0 +1,44 @@
+"""Per-day route solver: distance saved over input order and solve time by stop count.
+
+Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_routing --stops 3 8 15 30 60 120 --budget-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+
+import numpy as np
+
+from adk_app.tools.geo import haversine_matrix
+from adk_app.tools.routing import path_length, solve_route
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stops", type=int, nargs="+", default=[3, 8, 15, 30, 60, 120])
+    parser.add_argument("--budget-ms", type=float, default=5.0)
+    parser.add_argument("--trials", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(11)
+    for stops in args.stops:
+        ratios, solve_ms, timeouts = [], [], 0
+        for _ in range(args.trials):
+            coords = np.column_stack((12.8 + rng.random(stops) * 0.35, 77.4 + rng.random(stops) * 0.4))
+            dist = haversine_matrix(coords)
+            baseline = path_length(list(range(stops)), dist.tolist())
+            solution = solve_route(dist, time_budget_ms=args.budget_ms)
+            ratios.append(solution.distance_km / baseline if baseline else 1.0)
+            solve_ms.append(solution.solve_ms)
+            timeouts += int(solution.timed_out)
+        print(
+            f"stops={stops:<4} distance vs input order={statistics.mean(ratios) * 100:5.1f}% "
+            f"solve p50={statistics.median(solve_ms):6.2f}ms max={max(solve_ms):6.2f}ms timeouts={timeouts}/{args.trials}"
+        )
+
+
+if __name__ == "__main__":
+    main()
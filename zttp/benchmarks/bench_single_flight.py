@@ -0,0 +1,64 @@
+"""Upstream requests for concurrent identical tool calls, with and without coalescing.
+
+A cold cache cannot help while the first call is still in flight; single-flight
+merges the identical calls instead. Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_single_flight --callers 16 --response-ms 80
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+from adk_app.tools.cache import configure_response_cache
+from adk_app.tools.http_client import close_async_http_client
+from adk_app.tools.singleflight import get_single_flight
+from adk_app.tools.weather import weather_forecast, weather_forecast_async
+from adk_app.tools.wiki import wiki_search_extracts_async
+
+from ._stub import StubStats, stub_server
+
+
+async def _async_callers(callers: int, options: Dict[str, Any]) -> None:
+    try:
+        await asyncio.gather(
+            *(wiki_search_extracts_async("Bench points of interest", 6, **options) for _ in range(callers)),
+            *(weather_forecast_async(12.97, 77.59, "2024-01-01", **options) for _ in range(callers)),
+        )
+    finally:
+        await close_async_http_client()
+
+
+def _thread_callers(callers: int, options: Dict[str, Any]) -> None:
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        list(pool.map(lambda _: weather_forecast(12.97, 77.59, "2024-01-02", **options), range(callers)))
+
+
+def _measure(label: str, stats: StubStats, run: Any) -> None:
+    configure_response_cache()
+    stats.reset()
+    start = time.perf_counter()
+    run()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{label:<44} upstream_requests={stats.requests:<4} time={elapsed:8.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--callers", type=int, default=16)
+    parser.add_argument("--response-ms", type=float, default=80.0)
+    args = parser.parse_args()
+
+    with stub_server(response_delay=args.response_ms / 1000) as stats:
+        for label, options in (("uncoalesced (use_cache=False)", {"use_cache": False}), ("single-flight", {})):
+            _measure(f"asyncio tasks, {label}", stats, lambda: asyncio.run(_async_callers(args.callers, options)))
+            _measure(f"threads, {label}", stats, lambda: _thread_callers(args.callers, options))
+    print("single-flight stats:", get_single_flight().stats())
+
+
+if __name__ == "__main__":
+    main()
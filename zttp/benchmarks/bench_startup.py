@@ -0,0 +1,109 @@
+"""Start-up cost of ``adk_app``: import times and cold ``create_app``, checked against a budget.
+
+Each case runs in a fresh interpreter. The report lists the median wall time
+per case next to its budget, then the slowest imports from ``python -X
+importtime``. Exits non-zero if any case is over budget, so it can guard
+against start-up regressions. Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_startup --runs 5 --top 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Median milliseconds per case; generous enough for slow CI machines.
+BUDGETS_MS: Dict[str, float] = {
+    "import adk_app": 25.0,
+    "import adk_app.tools.export": 25.0,
+    "import adk_app.telemetry.report": 60.0,
+    "create_app (new db)": 250.0,
+    "create_app (existing db)": 200.0,
+}
+
+_TIMED = """
+import time
+start = time.perf_counter()
+{statement}
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _run(statement: str, *extra: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *extra, "-c", _TIMED.format(statement=statement)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cases(db_dir: Path) -> Dict[str, Tuple[str, str]]:
+    create = f"from pathlib import Path\nfrom adk_app import create_app\ncreate_app(Path({str(db_dir)!r}))"
+    return {
+        "import adk_app": ("import adk_app", ""),
+        "import adk_app.tools.export": ("import adk_app.tools.export", ""),
+        "import adk_app.telemetry.report": ("import adk_app.telemetry.report", ""),
+        "create_app (new db)": (create, "fresh"),
+        "create_app (existing db)": (create, ""),
+    }
+
+
+def _import_report(statement: str, top: int) -> Tuple[int, List[Tuple[int, str]]]:
+    """Return the total import time and the ``top`` modules by self time, in microseconds."""
+    stderr = _run(statement, "-X", "importtime").stderr
+    rows = []
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:") :].split("|")
+        rows.append((int(self_us), name.strip()))
+        if not name.startswith("  "):  # top-level imports carry a single leading space
+            total += int(cumulative)
+    return total, sorted(rows, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    over_budget = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # Create the "existing" database once so only the fresh case pays for the schema.
+        _run(_cases(Path(tmp) / "app")["create_app (existing db)"][0])
+        for label, (statement, mode) in _cases(Path(tmp) / "app").items():
+            timings = []
+            for run in range(args.runs):
+                if mode == "fresh":
+                    statement = statement.replace(str(Path(tmp) / "app"), str(Path(tmp) / f"fresh-{run}"))
+                timings.append(float(_run(statement).stdout.strip().splitlines()[-1]))
+            median = statistics.median(timings)
+            budget = BUDGETS_MS[label]
+            status = "ok" if median <= budget else "OVER BUDGET"
+            if median > budget:
+                over_budget.append(label)
+            print(f"{label:<34} median={median:8.1f}ms  budget={budget:6.0f}ms  {status}")
+
+        create = _cases(Path(tmp) / "app")["create_app (existing db)"][0]
+        total, slowest = _import_report(create, args.top)
+        print(f"\n-X importtime for create_app: {total / 1000:.1f}ms of imports; slowest modules by self time:")
+        for self_us, name in slowest:
+            print(f"  {self_us / 1000:8.1f}ms  {name}")
+    if over_budget:
+        raise SystemExit(f"over start-up budget: {', '.join(over_budget)}")
+
+
+if __name__ == "__main__":
+    main()
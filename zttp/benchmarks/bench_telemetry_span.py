@@ -0,0 +1,69 @@
+"""Per-span overhead: synchronous INSERT per span versus the buffered background writer.
+
+Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_telemetry_span --spans 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterator
+
+from adk_app.memory.sqlite_memory import SQLiteMemoryService
+from adk_app.telemetry.logger import TelemetryLogger
+
+
+@contextlib.contextmanager
+def _sync_span(db_path: str, *, run_id: str, agent: str, tool: str) -> Iterator[None]:
+    """The previous span: open a connection and commit one row per span."""
+    start = time.time()
+    try:
+        yield
+    finally:
+        end = time.time()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO telemetry(run_id, agent, tool, start_ts, end_ts, latency_ms, error) "
+                "VALUES(?, ?, ?, ?, ?, ?, ?)",
+                (run_id, agent, tool, start, end, int((end - start) * 1000), None),
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spans", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.sqlite"
+        SQLiteMemoryService(db_path=db_path).close()
+
+        start = time.perf_counter()
+        for _ in range(args.spans):
+            with _sync_span(str(db_path), run_id="bench", agent="bench", tool="sync"):
+                pass
+        sync_us = (time.perf_counter() - start) / args.spans * 1e6
+
+        telemetry = TelemetryLogger(db_path=str(db_path))
+        start = time.perf_counter()
+        for _ in range(args.spans):
+            with telemetry.span(run_id="bench", agent="bench", tool="buffered"):
+                pass
+        buffered_us = (time.perf_counter() - start) / args.spans * 1e6
+        telemetry.close()
+
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute("SELECT tool, COUNT(*) FROM telemetry GROUP BY tool ORDER BY tool").fetchall()
+    print(f"sync insert per span: {sync_us:9.1f}us")
+    print(f"buffered per span:    {buffered_us:9.1f}us (dropped={telemetry.dropped})")
+    print(f"rows written: {dict(rows)}")
+
+
+if __name__ == "__main__":
+    main()
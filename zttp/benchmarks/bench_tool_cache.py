@@ -0,0 +1,50 @@
+"""Upstream requests and latency for a cold versus a warm repeat plan's tool calls.
+
+Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_tool_cache --repeats 5 --response-ms 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from adk_app.agents.researcher import ResearcherAgent
+from adk_app.tools.cache import configure_response_cache
+from adk_app.tools.currency import currency_convert
+from adk_app.tools.weather import weather_forecast
+
+from ._stub import stub_server
+
+
+def _plan_tools() -> None:
+    asyncio.run(ResearcherAgent().research(city="Bench"))
+    weather_forecast(12.97163, 77.59461, "2024-01-01")
+    currency_convert(100, "usd", "EUR")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--response-ms", type=float, default=40.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, stub_server(response_delay=args.response_ms / 1000) as stats:
+        cache = configure_response_cache(db_path=Path(tmp) / "tool_cache.sqlite")
+        for attempt in range(args.repeats):
+            stats.reset()
+            start = time.perf_counter()
+            _plan_tools()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            label = "cold" if attempt == 0 else "warm"
+            print(f"{label} run {attempt}: upstream_requests={stats.requests} time={elapsed_ms:7.2f}ms")
+        print("cache stats:", cache.stats())
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
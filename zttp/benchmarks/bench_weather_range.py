@@ -0,0 +1,52 @@
+"""Upstream requests and latency: one forecast per day and city vs. one range request per trip.
+
+Run from the ``zttp`` directory::
+
+    python -m benchmarks.bench_weather_range --days 14 --cities 3 --response-ms 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date, timedelta
+from typing import Callable, List, Tuple
+
+from adk_app.tools.cache import configure_response_cache
+from adk_app.tools.weather import weather_forecast, weather_range
+
+from ._stub import StubStats, stub_server
+
+START = date(2024, 1, 1)
+
+
+def _per_day(locations: List[Tuple[float, float]], days: int) -> None:
+    for lat, lon in locations:
+        for offset in range(days):
+            weather_forecast(lat, lon, (START + timedelta(days=offset)).isoformat())
+
+
+def _measure(label: str, stats: StubStats, run: Callable[[], None]) -> None:
+    stats.reset()
+    start = time.perf_counter()
+    run()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{label:<24} upstream_requests={stats.requests:<4} bytes={stats.bytes_sent:<7} time={elapsed:8.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--cities", type=int, default=3)
+    parser.add_argument("--response-ms", type=float, default=40.0)
+    args = parser.parse_args()
+    locations = [(12.97 + index, 77.59 + index) for index in range(args.cities)]
+
+    with stub_server(response_delay=args.response_ms / 1000) as stats:
+        configure_response_cache(bypass=True)
+        _measure("per day and city", stats, lambda: _per_day(locations, args.days))
+        _measure("weather_range", stats, lambda: weather_range(locations, START.isoformat(), args.days))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Deadline cuts on coalesced research calls.
+
+Run from the ``zttp`` directory with ``python -m pytest tests``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+import pytest
+
+from adk_app.agents.researcher import ResearcherAgent
+from adk_app.app import create_app
+from adk_app.tools import wiki
+from adk_app.tools.cache import configure_response_cache
+from adk_app.tools.deadline import Deadline, DeadlineExceeded, current_deadline, deadline_scope
+
+
+class SlowContinuationClient:
+    """Answers the first batch at once with a continuation; the rest take ``delay`` seconds."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.requests = 0
+
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        self.requests += 1
+        deadline = current_deadline()
+        response = self._respond(params or {})
+        return await (response if deadline is None else deadline.bound(response, url))
+
+    async def _respond(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if "excontinue" not in params:
+            return {"query": {"pages": _pages(1, 2)}, "continue": {"excontinue": 2}}
+        await asyncio.sleep(self.delay)
+        return {"query": {"pages": _pages(3, 4)}}
+
+
+def _pages(first: int, last: int) -> Dict[str, Dict[str, Any]]:
+    return {
+        str(index): {"pageid": index, "index": index, "title": f"Sight {index}", "extract": f"Sight {index}."}
+        for index in range(first, last + 1)
+    }
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Iterator[SlowContinuationClient]:
+    slow = SlowContinuationClient(delay=0.5)
+    monkeypatch.setattr(wiki, "get_async_http_client", lambda: slow)
+    # Bypass the response cache so every call reaches the (single-flighted) fetch.
+    configure_response_cache(bypass=True)
+    yield slow
+    configure_response_cache()
+
+
+async def _research(budget_ms: Optional[float], *, delay: float = 0.0) -> Dict[str, Any]:
+    await asyncio.sleep(delay)
+    deadline = None if budget_ms is None else Deadline.within(budget_ms)
+    with deadline_scope(deadline):
+        try:
+            return await ResearcherAgent().research(city="Paris", limit=4)
+        except DeadlineExceeded as exc:
+            return {"cut": True, **exc.partial}
+
+
+def _titles(result: Dict[str, Any]) -> list:
+    return [poi["title"] for poi in result["pois"]]
+
+
+def test_concurrent_budgets_each_get_a_partial_result(client: SlowContinuationClient) -> None:
+    async def main() -> list:
+        return await asyncio.gather(_research(200), _research(200))
+
+    results = asyncio.run(main())
+
+    for result in results:
+        assert result["cut"]
+        assert result["city"] == "Paris"
+        assert _titles(result) == ["Sight 1", "Sight 2"]
+
+
+def test_unbudgeted_call_is_not_cut_by_a_coalesced_budget(client: SlowContinuationClient) -> None:
+    async def main() -> list:
+        return await asyncio.gather(_research(200), _research(None, delay=0.05))
+
+    budgeted, unbudgeted = asyncio.run(main())
+
+    assert budgeted["cut"] and _titles(budgeted) == ["Sight 1", "Sight 2"]
+    assert "cut" not in unbudgeted
+    assert _titles(unbudgeted) == ["Sight 1", "Sight 2", "Sight 3", "Sight 4"]
+
+
+@pytest.mark.parametrize("budgeted_first", [True, False])
+def test_batch_shares_fetches_without_sharing_the_cut(
+    client: SlowContinuationClient, tmp_path: Path, budgeted_first: bool
+) -> None:
+    app = create_app(tmp_path)
+    request = {"city": "Paris", "start_date": date(2024, 1, 1), "duration_days": 1, "pace": "balanced"}
+    requests = [
+        {**request, "user_id": "hurried", "latency_budget_ms": 100},
+        {**request, "user_id": "patient"},
+    ]
+    try:
+        results = app.run_batch(requests if budgeted_first else requests[::-1])
+    finally:
+        app.graph.telemetry.close()
+    budgeted, unbudgeted = results if budgeted_first else results[::-1]
+
+    assert budgeted.ok and unbudgeted.ok
+    assert budgeted.result["cut"] == ["research"]
+    assert unbudgeted.result["cut"] == []
+    assert len(unbudgeted.result["plan"]["stops"]) > len(budgeted.result["plan"]["stops"])